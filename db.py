@@ -4,10 +4,12 @@
 import difflib
 import json
 import logging
+import queue
+import re
 import sqlite3
 import threading
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from models import Item, FavoriteItem, NotificationLog, SellerFilter
@@ -15,6 +17,10 @@ from models import Item, FavoriteItem, NotificationLog, SellerFilter
 
 _UNSET = object()
 
+# Title markers for detect_sale_status ("예약" also covers "예약중").
+_SOLD_TITLE_PATTERN = re.compile(r"판매완료|거래완료|sold", re.IGNORECASE)
+_RESERVED_TITLE_PATTERN = re.compile(r"예약|reserved", re.IGNORECASE)
+
 
 
 class DatabaseManager:
@@ -23,10 +29,47 @@ class DatabaseManager:
     PRICE_PARSE_VERSION = 2
     SCHEMA_VERSION = 3
 
+    # Append-only telemetry writes buffered by the background flusher.
+    _BUFFERED_WRITES = {
+        "notification_log": '''
+            INSERT INTO notification_log (listing_id, notification_type, message_preview)
+            VALUES (?, ?, ?)
+        ''',
+        "search_stats": '''
+            INSERT INTO search_stats (keyword, platform, items_found, new_items)
+            VALUES (?, ?, ?, ?)
+        ''',
+        "search_history": '''
+            INSERT INTO search_history (keyword)
+            VALUES (?)
+            ON CONFLICT(keyword) DO UPDATE SET
+            use_count = use_count + 1,
+            last_used = CURRENT_TIMESTAMP
+        ''',
+    }
+    FLUSH_INTERVAL_SECONDS = 1.0
+
+    # sqlite3 reuses prepared statements keyed by SQL text; size the per-connection
+    # cache above the number of distinct queries so hot paths never re-prepare.
+    STATEMENT_CACHE_SIZE = 256
+    MMAP_SIZE = 256 * 1024 * 1024
+
+    # Columns the dashboard/recent-listings consumers read.
+    _RECENT_LISTING_COLUMNS = "id, platform, article_id, keyword, title, price, url, thumbnail, seller, created_at"
+
+    # Columns add_listing reads back when comparing an existing row.
+    _ADD_LISTING_COLUMNS = (
+        "id, title, price, price_numeric, url, normalized_url, thumbnail, seller, location, sale_status"
+    )
+
     def __init__(self, db_path: str = "listings.db"):
         self.db_path = db_path
         # check_same_thread=False allowed but we handle locking manually
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+        )
         self.conn.row_factory = sqlite3.Row
         self.lock = threading.Lock()
         self.logger = logging.getLogger("DatabaseManager")
@@ -35,18 +78,135 @@ class DatabaseManager:
         self._stats_cache = {}
         self._cache_ttl = 30  # 30 seconds cache
         self._cache_time = None
+        self._cache_generation = 0
+        self._fav_version = 0  # Bumped on every favorites write
+
+        # WAL allows concurrent readers: read-only queries use one connection per
+        # thread and skip self.lock; self.conn stays the single writer.
+        self._readers = threading.local()
+        self._reader_conns: list[sqlite3.Connection] = []
+        self._reader_conns_lock = threading.Lock()
         
         # Enable WAL mode and other optimizations for better concurrency
         self.conn.execute('PRAGMA foreign_keys=ON')
         self.conn.execute('PRAGMA journal_mode=WAL')
         self.conn.execute('PRAGMA synchronous=NORMAL')  # Faster writes
         self.conn.execute('PRAGMA cache_size=-64000')  # 64MB cache
+        self.conn.execute('PRAGMA temp_store=MEMORY')  # cleanup temp table / sorts
+        self.conn.execute(f'PRAGMA mmap_size={self.MMAP_SIZE}')
         self.create_tables()
+
+        # Small, rarely-changing block list kept in memory for O(1) seller checks.
+        self._blocked_sellers: frozenset[tuple[str, Optional[str]]] = frozenset()
+        self._blocked_sellers_version: Optional[int] = None
+        with self.lock:
+            self._reload_blocked_sellers()
+
+        # In-process (platform, article_id) set for is_duplicate. Built lazily and
+        # kept as a superset of stored keys, so a miss means "definitely new".
+        self._known_listing_keys: Optional[set[tuple[str, str]]] = None
+        self._known_listing_keys_version: Optional[int] = None
+
+        # Telemetry rows (notification_log/search_stats/search_history) are queued
+        # and committed in batches so bursts do not pay one fsync per row.
+        self._write_queue: queue.SimpleQueue[tuple[str, tuple]] = queue.SimpleQueue()
+        self._flusher_stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop,
+            name="DatabaseManagerFlusher",
+            daemon=True,
+        )
+        self._flusher.start()
     
     def _invalidate_cache(self):
         """Invalidate stats cache on write operations"""
         self._cache_time = None
         self._stats_cache = {}
+        self._cache_generation += 1
+
+    def _get_read_conn(self) -> sqlite3.Connection:
+        """Get this thread's read-only connection, opening it on first use."""
+        conn = getattr(self._readers, "conn", None)
+        if conn is None:
+            # check_same_thread=False only so close() can close it from another thread.
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                cached_statements=self.STATEMENT_CACHE_SIZE,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA query_only=1')
+            conn.execute('PRAGMA cache_size=-16000')  # 16MB per reader
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute(f'PRAGMA mmap_size={self.MMAP_SIZE}')
+            self._readers.conn = conn
+            with self._reader_conns_lock:
+                self._reader_conns.append(conn)
+        return conn
+
+    def release_read_conn(self) -> None:
+        """Close the calling thread's reader connection (for short-lived worker threads)."""
+        conn = getattr(self._readers, "conn", None)
+        if conn is None:
+            return
+        self._readers.conn = None
+        with self._reader_conns_lock:
+            if conn in self._reader_conns:
+                self._reader_conns.remove(conn)
+        conn.close()
+
+    def _enqueue_write(self, table: str, params: tuple) -> None:
+        """Queue an append-only telemetry row for the background flusher."""
+        self._write_queue.put((table, params))
+
+    def _flush_pending_writes(self) -> None:
+        """Commit queued telemetry rows in one transaction. Caller must hold self.lock."""
+        batches: dict[str, list[tuple]] = {}
+        while True:
+            try:
+                table, params = self._write_queue.get_nowait()
+            except queue.Empty:
+                break
+            batches.setdefault(table, []).append(params)
+        if not batches:
+            return
+
+        cursor = self.conn.cursor()
+        for table, rows in batches.items():
+            sql = self._BUFFERED_WRITES[table]
+            # Savepoint per table so a failed batch can be undone without
+            # touching the tables already written in this transaction.
+            cursor.execute("SAVEPOINT buffered_flush")
+            try:
+                cursor.executemany(sql, rows)
+            except sqlite3.Error as e:
+                # One bad row (e.g. a log entry for a listing removed by cleanup)
+                # must not cost the rest of the batch: replay it row by row.
+                cursor.execute("ROLLBACK TO buffered_flush")
+                self.logger.debug("Buffered %s batch failed, retrying per row: %s", table, e)
+                for params in rows:
+                    try:
+                        cursor.execute(sql, params)
+                    except sqlite3.Error as row_error:
+                        self.logger.warning("Buffered %s row dropped %r: %s", table, params, row_error)
+            cursor.execute("RELEASE buffered_flush")
+        self.conn.commit()
+        self._invalidate_cache()
+
+    def _flush_loop(self) -> None:
+        while not self._flusher_stop.wait(self.FLUSH_INTERVAL_SECONDS):
+            if self._write_queue.empty():
+                continue
+            try:
+                with self.lock:
+                    self._flush_pending_writes()
+            except Exception as e:
+                self.logger.warning(f"Background write flush failed: {e}")
+
+    def flush(self) -> None:
+        """Synchronously commit any queued telemetry rows."""
+        with self.lock:
+            self._flush_pending_writes()
     
     def create_tables(self):
         """Create all required tables"""
@@ -154,22 +314,31 @@ class DatabaseManager:
             ''')
             
             # Create indexes for better query performance
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_listings_platform ON listings(platform)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_listings_keyword ON listings(keyword)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_listings_created ON listings(created_at)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_price_history_listing ON price_history(listing_id)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_search_stats_date ON search_stats(checked_at)')
-            # Composite index for duplicate checking (most frequent query)
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_listings_platform_article ON listings(platform, article_id)')
+            # Daily stats filter on checked_at and sum the counters; carrying both
+            # counters lets the range scan answer the aggregate without table lookups.
+            cursor.execute('DROP INDEX IF EXISTS idx_search_stats_date')
+            cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_search_stats_checked_totals '
+                'ON search_stats(checked_at, items_found, new_items)'
+            )
+            # Duplicate checks (platform, article_id) are answered index-only by the
+            # UNIQUE constraint's autoindex; separate copies only slowed down writes.
+            cursor.execute('DROP INDEX IF EXISTS idx_listings_platform_article')
+            cursor.execute('DROP INDEX IF EXISTS idx_listings_platform')
             # Additional indexes for new features
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_favorites_listing ON favorites(listing_id)')
             cursor.execute(
                 'CREATE INDEX IF NOT EXISTS idx_search_stats_keyword_checked '
                 'ON search_stats(keyword, checked_at DESC)'
             )
+            # Range + order on changed_at with the join key carried in the index.
+            cursor.execute('DROP INDEX IF EXISTS idx_price_history_changed_at')
             cursor.execute(
-                'CREATE INDEX IF NOT EXISTS idx_price_history_changed_at '
-                'ON price_history(changed_at DESC)'
+                'CREATE INDEX IF NOT EXISTS idx_price_history_changed_listing '
+                'ON price_history(changed_at DESC, listing_id)'
             )
             cursor.execute(
                 'CREATE INDEX IF NOT EXISTS idx_notification_log_sent_at '
@@ -233,6 +402,10 @@ class DatabaseManager:
             # Index for listing_notes (created after table exists)
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_listing_notes_listing ON listing_notes(listing_id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_listing_auto_tags_listing ON listing_auto_tags(listing_id)')
+            cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_listing_auto_tags_tag '
+                'ON listing_auto_tags(tag_name, listing_id)'
+            )
             cursor.execute(
                 'CREATE INDEX IF NOT EXISTS idx_sale_status_history_listing_changed '
                 'ON sale_status_history(listing_id, changed_at DESC)'
@@ -246,6 +419,8 @@ class DatabaseManager:
                 'ON notification_delivery_log(notification_type, sent_at DESC)'
             )
             
+            self._fts_enabled = self._create_title_fts(cursor)
+
             # Migrations for existing databases.
             self._add_column_if_missing(cursor, "listings", "sale_status", 'TEXT DEFAULT "for_sale"')
             self._add_column_if_missing(cursor, "listings", "price_numeric", "INTEGER DEFAULT 0")
@@ -254,19 +429,28 @@ class DatabaseManager:
             self._add_column_if_missing(cursor, "price_history", "new_price_numeric", "INTEGER")
             self._add_column_if_missing(cursor, "listing_notes", "auto_tags", 'TEXT DEFAULT "[]"')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_listings_platform_normalized_url ON listings(platform, normalized_url)')
+            # Partial index: only blocked rows are ever filtered on.
+            cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_seller_filters_blocked '
+                'ON seller_filters(seller_name, platform) WHERE is_blocked = 1'
+            )
 
-            # Index for sale_status (must be created after column exists for older DBs)
-            try:
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_listings_sale_status ON listings(sale_status)')
-            except Exception:
-                pass
-            try:
+            # Index for sale_status (must be created after column exists for older DBs).
+            # The composite index serves sale_status lookups on its leading column, so
+            # the older single-column index is redundant write overhead.
+            cursor.execute('DROP INDEX IF EXISTS idx_listings_sale_status')
+            if self._column_exists(cursor, "listings", "sale_status"):
                 cursor.execute(
                     'CREATE INDEX IF NOT EXISTS idx_listings_status_platform_created '
                     'ON listings(sale_status, platform, created_at DESC)'
                 )
-            except Exception:
-                pass
+                # Status-only filters ordered by recency (no platform predicate).
+                # Ascending so a backward scan yields (created_at DESC, id DESC),
+                # the keyset pagination order.
+                cursor.execute(
+                    'CREATE INDEX IF NOT EXISTS idx_listings_status_created '
+                    'ON listings(sale_status, created_at)'
+                )
 
             self.conn.commit()
 
@@ -290,6 +474,78 @@ class DatabaseManager:
             except Exception as e:
                 self.logger.warning(f"Schema integrity check failed: {e}")
 
+    def _create_title_fts(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Create the listings_fts title index (external content, trigram tokenizer).
+        Trigrams keep LIKE '%term%' substring semantics, which matters for Korean
+        titles without word boundaries. Returns False when FTS5 is unavailable.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'listings_fts'")
+        existed = cursor.fetchone() is not None
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS listings_fts USING fts5(
+                    title, content='listings', content_rowid='id', tokenize='trigram'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            self.logger.info(f"FTS5 title search unavailable, using LIKE: {e}")
+            return False
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS listings_fts_ai AFTER INSERT ON listings BEGIN
+                INSERT INTO listings_fts(rowid, title) VALUES (new.id, new.title);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS listings_fts_ad AFTER DELETE ON listings BEGIN
+                INSERT INTO listings_fts(listings_fts, rowid, title) VALUES ('delete', old.id, old.title);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS listings_fts_au AFTER UPDATE OF title ON listings BEGIN
+                INSERT INTO listings_fts(listings_fts, rowid, title) VALUES ('delete', old.id, old.title);
+                INSERT INTO listings_fts(rowid, title) VALUES (new.id, new.title);
+            END
+        ''')
+        if not existed:
+            cursor.execute("INSERT INTO listings_fts(listings_fts) VALUES ('rebuild')")
+        return True
+
+    def _title_search_clause(self, search: str, alias: str = "") -> tuple[str, str]:
+        """Predicate + parameter for a title substring search."""
+        # Trigram MATCH needs at least 3 characters; shorter terms fall back to LIKE.
+        if self._fts_enabled and len(search) >= 3:
+            phrase = '"' + search.replace('"', '""') + '"'
+            return f"{alias}id IN (SELECT rowid FROM listings_fts WHERE listings_fts MATCH ?)", phrase
+        return f"{alias}title LIKE ?", f'%{search}%'
+
+    def _listing_filter_clause(
+        self,
+        platform: str | None = None,
+        search: str | None = None,
+        status: str | None = None,
+        alias: str = "",
+    ) -> tuple[str, list]:
+        """
+        WHERE clause for the common listing filters, always emitted in the same
+        order so each filter shape maps to one cached prepared statement.
+        ('all' and empty values mean no filter.)
+        """
+        conditions = []
+        params: list[Any] = []
+        if status and status != 'all':
+            conditions.append(f'{alias}sale_status = ?')
+            params.append(status)
+        if platform and platform != 'all':
+            conditions.append(f'{alias}platform = ?')
+            params.append(platform)
+        if search:
+            clause, param = self._title_search_clause(search, alias=alias)
+            conditions.append(clause)
+            params.append(param)
+        return (' AND '.join(conditions) or '1=1'), params
+
     def _get_meta(self, cursor: sqlite3.Cursor, key: str) -> Optional[str]:
         cursor.execute("SELECT value FROM meta WHERE key = ?", (key,))
         row = cursor.fetchone()
@@ -481,10 +737,24 @@ class DatabaseManager:
         self._set_meta(cursor, key, "1")
         self.conn.commit()
     
+    def _ensure_known_listing_keys(self, cursor: sqlite3.Cursor) -> set[tuple[str, str]]:
+        """Load or refresh the known-key set. Caller must hold self.lock."""
+        cursor.execute("PRAGMA data_version")
+        version = cursor.fetchone()[0]
+        if self._known_listing_keys is None or version != self._known_listing_keys_version:
+            # Another connection committed (or first use): reload from the table.
+            cursor.execute("SELECT platform, article_id FROM listings")
+            self._known_listing_keys = {(row["platform"], row["article_id"]) for row in cursor.fetchall()}
+            self._known_listing_keys_version = version
+        return self._known_listing_keys
+
     def is_duplicate(self, platform: str, article_id: str) -> bool:
         """Check if listing already exists"""
         with self.lock:
             cursor = self.conn.cursor()
+            if (platform, article_id) not in self._ensure_known_listing_keys(cursor):
+                return False
+            # Keys may be stale after deletes; confirm positives against the table.
             cursor.execute(
                 'SELECT 1 FROM listings WHERE platform = ? AND article_id = ?', 
                 (platform, article_id)
@@ -493,22 +763,20 @@ class DatabaseManager:
     
     def get_listing_by_id(self, listing_id: int) -> Optional[dict]:
         """Get listing by its ID"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT * FROM listings WHERE id = ?', (listing_id,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('SELECT * FROM listings WHERE id = ?', (listing_id,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
     
     def get_listing(self, platform: str, article_id: str) -> Optional[dict]:
         """Get existing listing"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                'SELECT * FROM listings WHERE platform = ? AND article_id = ?', 
-                (platform, article_id)
-            )
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        cursor = self._get_read_conn().cursor()
+        cursor.execute(
+            'SELECT * FROM listings WHERE platform = ? AND article_id = ?', 
+            (platform, article_id)
+        )
+        row = cursor.fetchone()
+        return dict(row) if row else None
 
     @staticmethod
     def _prefer_non_empty(new_value: Any, current_value: Any) -> Any:
@@ -548,170 +816,208 @@ class DatabaseManager:
             - price_change_info: Dict with old/new price if price changed, else None
             - listing_id: ID of the listing in database
         """
-        # Internal lock usage to ensure atomicity of check-then-act
-        with self.lock:
+        # Internal lock usage to ensure atomicity of check-then-act; the connection
+        # context wraps price/status history and the listing update in one transaction.
+        with self.lock, self.conn:
+            return self._add_listing_locked(self.conn.cursor(), item)
+
+    def add_listings_bulk(self, items: list[Item]) -> list[tuple[bool, Optional[dict], Optional[int]]]:
+        """
+        Add or update many listings under one lock and one transaction.
+        Existing rows are fetched with chunked IN queries instead of one SELECT per item.
+
+        Returns:
+            add_listing's (is_new, price_change_info, listing_id) for each item, in order.
+        """
+        if not items:
+            return []
+        with self.lock, self.conn:
             cursor = self.conn.cursor()
-            normalized_url = self.normalize_url(item.link)
-            
-            # Check existing
+            prefetched = self._prefetch_listing_rows(cursor, items)
+            results = []
+            for item in items:
+                # pop(): a key repeated within the batch must re-read the row just written.
+                row = prefetched.pop((item.platform, str(item.article_id)), _UNSET)
+                results.append(self._add_listing_locked(cursor, item, row))
+            return results
+
+    def _prefetch_listing_rows(
+        self,
+        cursor: sqlite3.Cursor,
+        items: list[Item],
+        chunk_size: int = 500,
+    ) -> dict[tuple[str, str], Optional[sqlite3.Row]]:
+        """Map (platform, article_id) to its existing row (or None) for add_listings_bulk."""
+        by_platform: dict[str, dict[str, None]] = {}
+        for item in items:
+            by_platform.setdefault(item.platform, {})[str(item.article_id)] = None
+
+        rows: dict[tuple[str, str], Optional[sqlite3.Row]] = {}
+        for platform, article_ids in by_platform.items():
+            ids = list(article_ids)
+            for i in range(0, len(ids), chunk_size):
+                chunk = ids[i:i + chunk_size]
+                placeholders = ",".join(["?"] * len(chunk))
+                cursor.execute(
+                    f"SELECT article_id, {self._ADD_LISTING_COLUMNS} FROM listings "
+                    f"WHERE platform = ? AND article_id IN ({placeholders})",
+                    [platform, *chunk],
+                )
+                found = {str(row["article_id"]): row for row in cursor.fetchall()}
+                for article_id in chunk:
+                    rows[(platform, article_id)] = found.get(article_id)
+        return rows
+
+    def _add_listing_locked(
+        self,
+        cursor: sqlite3.Cursor,
+        item: Item,
+        row: Any = _UNSET,
+    ) -> tuple[bool, Optional[dict], Optional[int]]:
+        """add_listing body. Caller must hold self.lock inside a connection transaction."""
+        normalized_url = self.normalize_url(item.link)
+        
+        # Check existing (only the columns compared below)
+        if row is _UNSET:
             cursor.execute(
-                'SELECT * FROM listings WHERE platform = ? AND article_id = ?', 
+                f'SELECT {self._ADD_LISTING_COLUMNS} FROM listings WHERE platform = ? AND article_id = ?',
                 (item.platform, item.article_id)
             )
             row = cursor.fetchone()
-            if row is None and normalized_url:
+        if row is None and normalized_url:
+            cursor.execute(
+                f'''
+                SELECT {self._ADD_LISTING_COLUMNS} FROM listings
+                WHERE platform = ? AND normalized_url = ?
+                ORDER BY updated_at DESC, id DESC
+                LIMIT 1
+                ''',
+                (item.platform, normalized_url),
+            )
+            row = cursor.fetchone()
+        # sqlite3.Row already supports lookups by name; no per-item dict copy.
+        existing = row
+        
+        price_numeric = item.parse_price()
+        explicit_status = self._normalize_sale_status(item.sale_status)
+        detected_status = explicit_status if explicit_status is not None else self.detect_sale_status(item.title)
+        
+        if existing:
+            # Check for price change
+            old_price = existing['price']
+            old_price_numeric = existing['price_numeric'] or 0
+            old_status = existing['sale_status'] or 'for_sale'
+            new_status = detected_status or old_status
+
+            price_change_info: Optional[dict] = None
+            if old_price != item.price and old_price_numeric != price_numeric:
+                # Price changed - record in history
+                cursor.execute('''
+                    INSERT INTO price_history 
+                    (listing_id, old_price, old_price_numeric, new_price, new_price_numeric)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (existing['id'], old_price, old_price_numeric, item.price, price_numeric))
+
+                price_change_info = {
+                    'old_price': old_price,
+                    'new_price': item.price,
+                    'old_numeric': old_price_numeric,
+                    'new_numeric': price_numeric
+                }
+
+            updated_title = self._prefer_non_empty(item.title, existing['title'])
+            updated_url = self._prefer_non_empty(item.link, existing['url'])
+            updated_normalized_url = self._prefer_non_empty(normalized_url, existing['normalized_url'])
+            updated_thumbnail = self._prefer_non_empty(item.thumbnail, existing['thumbnail'])
+            updated_seller = self._prefer_non_empty(item.seller, existing['seller'])
+            updated_location = self._prefer_non_empty(item.location, existing['location'])
+            updated_price = self._prefer_non_empty(item.price, existing['price'])
+            updated_price_numeric = (
+                price_numeric if isinstance(updated_price, str) and updated_price == item.price
+                else existing['price_numeric'] or 0
+            )
+
+            if new_status != old_status:
+                self._record_sale_status_change(cursor, existing['id'], old_status, new_status)
+
+            fields_changed = any(
+                (
+                    updated_title != existing['title'],
+                    updated_url != existing['url'],
+                    updated_normalized_url != existing['normalized_url'],
+                    updated_thumbnail != existing['thumbnail'],
+                    updated_seller != existing['seller'],
+                    updated_location != existing['location'],
+                    updated_price != existing['price'],
+                    updated_price_numeric != (existing['price_numeric'] or 0),
+                    new_status != old_status,
+                )
+            )
+
+            if fields_changed:
                 cursor.execute(
                     '''
-                    SELECT * FROM listings
-                    WHERE platform = ? AND normalized_url = ?
-                    ORDER BY updated_at DESC, id DESC
-                    LIMIT 1
+                    UPDATE listings
+                    SET title = ?, price = ?, price_numeric = ?, url = ?, normalized_url = ?, thumbnail = ?,
+                        seller = ?, location = ?, sale_status = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
                     ''',
-                    (item.platform, normalized_url),
-                )
-                row = cursor.fetchone()
-            existing = dict(row) if row else None
-            
-            price_numeric = item.parse_price()
-            explicit_status = self._normalize_sale_status(item.sale_status)
-            detected_status = explicit_status if explicit_status is not None else self.detect_sale_status(item.title)
-            
-            if existing:
-                # Check for price change
-                old_price = existing['price']
-                old_price_numeric = existing['price_numeric'] or 0
-                old_status = existing.get('sale_status') or 'for_sale'
-                new_status = detected_status or old_status
-
-                price_change_info: Optional[dict] = None
-                if old_price != item.price and old_price_numeric != price_numeric:
-                    # Price changed - record in history
-                    cursor.execute('''
-                        INSERT INTO price_history 
-                        (listing_id, old_price, old_price_numeric, new_price, new_price_numeric)
-                        VALUES (?, ?, ?, ?, ?)
-                    ''', (existing['id'], old_price, old_price_numeric, item.price, price_numeric))
-
-                    price_change_info = {
-                        'old_price': old_price,
-                        'new_price': item.price,
-                        'old_numeric': old_price_numeric,
-                        'new_numeric': price_numeric
-                    }
-
-                updated_title = self._prefer_non_empty(item.title, existing.get('title'))
-                updated_url = self._prefer_non_empty(item.link, existing.get('url'))
-                updated_normalized_url = self._prefer_non_empty(normalized_url, existing.get('normalized_url'))
-                updated_thumbnail = self._prefer_non_empty(item.thumbnail, existing.get('thumbnail'))
-                updated_seller = self._prefer_non_empty(item.seller, existing.get('seller'))
-                updated_location = self._prefer_non_empty(item.location, existing.get('location'))
-                updated_price = self._prefer_non_empty(item.price, existing.get('price'))
-                updated_price_numeric = (
-                    price_numeric if isinstance(updated_price, str) and updated_price == item.price
-                    else existing.get('price_numeric') or 0
-                )
-
-                if new_status != old_status:
-                    self._record_sale_status_change(cursor, existing['id'], old_status, new_status)
-
-                fields_changed = any(
                     (
-                        updated_title != existing.get('title'),
-                        updated_url != existing.get('url'),
-                        updated_normalized_url != existing.get('normalized_url'),
-                        updated_thumbnail != existing.get('thumbnail'),
-                        updated_seller != existing.get('seller'),
-                        updated_location != existing.get('location'),
-                        updated_price != existing.get('price'),
-                        updated_price_numeric != (existing.get('price_numeric') or 0),
-                        new_status != old_status,
-                    )
+                        updated_title,
+                        updated_price,
+                        updated_price_numeric,
+                        updated_url,
+                        updated_normalized_url,
+                        updated_thumbnail,
+                        updated_seller,
+                        updated_location,
+                        new_status,
+                        existing['id'],
+                    ),
                 )
-
-                if fields_changed:
-                    cursor.execute(
-                        '''
-                        UPDATE listings
-                        SET title = ?, price = ?, price_numeric = ?, url = ?, normalized_url = ?, thumbnail = ?,
-                            seller = ?, location = ?, sale_status = ?, updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                        ''',
-                        (
-                            updated_title,
-                            updated_price,
-                            updated_price_numeric,
-                            updated_url,
-                            updated_normalized_url,
-                            updated_thumbnail,
-                            updated_seller,
-                            updated_location,
-                            new_status,
-                            existing['id'],
-                        ),
-                    )
-                    self.conn.commit()
-                    self._invalidate_cache()
-
-                return False, price_change_info, existing['id']
-            
-            # New listing
-            try:
-                cursor.execute('''
-                    INSERT INTO listings 
-                    (platform, article_id, keyword, title, price, price_numeric, url, normalized_url, thumbnail, seller, location, sale_status)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    item.platform, item.article_id, item.keyword, item.title,
-                    item.price, price_numeric, item.link, normalized_url, item.thumbnail,
-                    item.seller, item.location, detected_status
-                ))
-                new_id = cursor.lastrowid
-                self.conn.commit()
                 self._invalidate_cache()
-                return True, None, new_id
-            except sqlite3.IntegrityError:
-                return False, None, None
-    
-    def record_search_stats(self, keyword: str, platform: str, items_found: int, new_items: int):
-        """Record search statistics"""
-        with self.lock:
-            cursor = self.conn.cursor()
+
+            return False, price_change_info, existing['id']
+        
+        # New listing
+        try:
             cursor.execute('''
-                INSERT INTO search_stats (keyword, platform, items_found, new_items)
-                VALUES (?, ?, ?, ?)
-            ''', (keyword, platform, items_found, new_items))
-            self.conn.commit()
+                INSERT INTO listings 
+                (platform, article_id, keyword, title, price, price_numeric, url, normalized_url, thumbnail, seller, location, sale_status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                item.platform, item.article_id, item.keyword, item.title,
+                item.price, price_numeric, item.link, normalized_url, item.thumbnail,
+                item.seller, item.location, detected_status
+            ))
+            new_id = cursor.lastrowid
+            if self._known_listing_keys is not None:
+                self._known_listing_keys.add((item.platform, item.article_id))
             self._invalidate_cache()
+            return True, None, new_id
+        except sqlite3.IntegrityError:
+            return False, None, None
     
-    # Statistics methods - all read operations also need locks if sharing connection
+    def record_search_stats(self, keyword: str, platform: str, items_found: int, new_items: int):
+        """Record search statistics (buffered; committed by the background flusher)"""
+        self._enqueue_write("search_stats", (keyword, platform, items_found, new_items))
+
+    def record_search_stats_bulk(self, rows: Iterable[tuple[str, str, int, int]]):
+        """Record (keyword, platform, items_found, new_items) rows; flushed as one executemany"""
+        for row in rows:
+            self._enqueue_write("search_stats", tuple(row))
+    
+    # Statistics methods - read-only, served from per-thread reader connections
     def get_total_listings(self) -> int:
         """Get total number of listings"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM listings')
-            return cursor.fetchone()[0]
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('SELECT COUNT(*) FROM listings')
+        return cursor.fetchone()[0]
     
     def get_listings_paginated(self, platform: str | None = None, search: str | None = None, 
                                 limit: int = 50, offset: int = 0) -> list:
         """Get listings with pagination and filtering"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            query = 'SELECT * FROM listings WHERE 1=1'
-            params = []
-            
-            if platform:
-                query += ' AND platform = ?'
-                params.append(platform)
-            
-            if search:
-                query += ' AND title LIKE ?'
-                params.append(f'%{search}%')
-            
-            query += ' ORDER BY created_at DESC LIMIT ? OFFSET ?'
-            params.extend([limit, offset])
-            
-            cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+        return self.get_listings_by_status(platform=platform, search=search, limit=limit, offset=offset)
     
     def get_listings_count(
         self,
@@ -720,78 +1026,61 @@ class DatabaseManager:
         status: str | None = None,
     ) -> int:
         """Get total count of listings with filters (platform/title/sale_status)"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            query = 'SELECT COUNT(*) FROM listings WHERE 1=1'
-            params = []
-            
-            if platform:
-                query += ' AND platform = ?'
-                params.append(platform)
-
-            if status and status != "all":
-                query += ' AND sale_status = ?'
-                params.append(status)
-            
-            if search:
-                query += ' AND title LIKE ?'
-                params.append(f'%{search}%')
-            
-            cursor.execute(query, params)
-            return cursor.fetchone()[0]
+        cursor = self._get_read_conn().cursor()
+        where, params = self._listing_filter_clause(platform, search, status)
+        cursor.execute(f'SELECT COUNT(*) FROM listings WHERE {where}', params)
+        return cursor.fetchone()[0]
     
     def get_listings_by_platform(self) -> dict:
         """Get listing count by platform"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT platform, COUNT(*) as count 
-                FROM listings 
-                GROUP BY platform
-            ''')
-            return {row['platform']: row['count'] for row in cursor.fetchall()}
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('''
+            SELECT platform, COUNT(*) as count 
+            FROM listings 
+            GROUP BY platform
+        ''')
+        return {row['platform']: row['count'] for row in cursor.fetchall()}
     
     def get_listings_by_keyword(self) -> dict:
         """Get listing count by keyword"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT keyword, COUNT(*) as count 
-                FROM listings 
-                GROUP BY keyword
-                ORDER BY count DESC
-            ''')
-            return {row['keyword']: row['count'] for row in cursor.fetchall()}
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('''
+            SELECT keyword, COUNT(*) as count 
+            FROM listings 
+            GROUP BY keyword
+            ORDER BY count DESC
+        ''')
+        return {row['keyword']: row['count'] for row in cursor.fetchall()}
 
     def get_keyword_price_stats(self) -> list:
         """Get price statistics by keyword (min, avg, max)"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT 
-                    keyword,
-                    COUNT(*) as count,
-                    MIN(price_numeric) as min_price,
-                    CAST(AVG(price_numeric) as INTEGER) as avg_price,
-                    MAX(price_numeric) as max_price
-                FROM listings
-                WHERE price_numeric > 0 
-                GROUP BY keyword
-                ORDER BY count DESC
-            ''')
-            return [dict(row) for row in cursor.fetchall()]
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('''
+            SELECT 
+                keyword,
+                COUNT(*) as count,
+                MIN(price_numeric) as min_price,
+                CAST(AVG(price_numeric) as INTEGER) as avg_price,
+                MAX(price_numeric) as max_price
+            FROM listings
+            WHERE price_numeric > 0 
+            GROUP BY keyword
+            ORDER BY count DESC
+        ''')
+        return [dict(row) for row in cursor.fetchall()]
     
     def get_last_search_time(self, keyword: str) -> Optional[datetime]:
         """Get last search time for a keyword"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT MAX(checked_at) FROM search_stats WHERE keyword = ?
-            ''', (keyword,))
-            row = cursor.fetchone()
-            if row and row[0]:
-                return datetime.strptime(row[0], "%Y-%m-%d %H:%M:%S")
-            return None
+        self.flush()
+        cursor = self._get_read_conn().cursor()
+        # checked_at is stored as UTC text; convert to epoch seconds in SQLite.
+        cursor.execute('''
+            SELECT CAST(strftime('%s', MAX(checked_at)) AS INTEGER) FROM search_stats WHERE keyword = ?
+        ''', (keyword,))
+        row = cursor.fetchone()
+        if row and row[0]:
+            return datetime.fromtimestamp(row[0])
+        return None
 
     def get_existing_article_ids(self, platform: str, article_ids: list[str], chunk_size: int = 500) -> set[str]:
         """Get existing article IDs for a platform in chunks (SQLite variable-safe)."""
@@ -803,17 +1092,16 @@ class DatabaseManager:
             return set()
 
         existing: set[str] = set()
-        with self.lock:
-            cursor = self.conn.cursor()
-            for i in range(0, len(normalized), chunk_size):
-                chunk = normalized[i:i + chunk_size]
-                placeholders = ",".join(["?"] * len(chunk))
-                query = (
-                    f"SELECT article_id FROM listings WHERE platform = ? "
-                    f"AND article_id IN ({placeholders})"
-                )
-                cursor.execute(query, [platform, *chunk])
-                existing.update(str(row["article_id"]) for row in cursor.fetchall())
+        cursor = self._get_read_conn().cursor()
+        for i in range(0, len(normalized), chunk_size):
+            chunk = normalized[i:i + chunk_size]
+            placeholders = ",".join(["?"] * len(chunk))
+            query = (
+                f"SELECT article_id FROM listings WHERE platform = ? "
+                f"AND article_id IN ({placeholders})"
+            )
+            cursor.execute(query, [platform, *chunk])
+            existing.update(str(row["article_id"]) for row in cursor.fetchall())
         return existing
 
     def get_dashboard_snapshot(
@@ -831,182 +1119,186 @@ class DatabaseManager:
         now = datetime.now()
 
         with self.lock:
+            self._flush_pending_writes()
             if (
                 self._cache_time is not None
                 and (now - self._cache_time).total_seconds() < self._cache_ttl
                 and cache_key in self._stats_cache
             ):
                 return self._stats_cache[cache_key]
+            generation = self._cache_generation
+
+        cursor = self._get_read_conn().cursor()
+
+        cursor.execute('''
+            SELECT platform, COUNT(*) as count 
+            FROM listings 
+            GROUP BY platform
+        ''')
+        by_platform = {row['platform']: row['count'] for row in cursor.fetchall()}
+        # Every row lands in exactly one platform group, so no separate COUNT(*) scan.
+        total = sum(by_platform.values())
+
+        cursor.execute(f'''
+            SELECT {self._RECENT_LISTING_COLUMNS} FROM listings
+            ORDER BY created_at DESC
+            LIMIT ?
+        ''', (recent_limit,))
+        recent = [dict(row) for row in cursor.fetchall()]
+
+        cursor.execute('''
+            SELECT 
+                l.platform, l.article_id, l.title, l.url, l.thumbnail,
+                ph.old_price, ph.new_price, ph.changed_at
+            FROM price_history ph
+            JOIN listings l ON ph.listing_id = l.id
+            WHERE ph.changed_at >= datetime('now', ?)
+            ORDER BY ph.changed_at DESC
+            LIMIT ?
+        ''', (f'-{price_change_days} days', price_change_limit))
+        price_changes = [dict(row) for row in cursor.fetchall()]
+
+        cursor.execute('''
+            SELECT 
+                keyword,
+                COUNT(*) as count,
+                MIN(price_numeric) as min_price,
+                CAST(AVG(price_numeric) as INTEGER) as avg_price,
+                MAX(price_numeric) as max_price
+            FROM listings
+            WHERE price_numeric > 0 
+            GROUP BY keyword
+            ORDER BY count DESC
+        ''')
+        analysis = [dict(row) for row in cursor.fetchall()]
+
+        cursor.execute('''
+            SELECT 
+                DATE(checked_at) as date,
+                SUM(items_found) as items_found,
+                SUM(new_items) as new_items
+            FROM search_stats
+            WHERE checked_at >= datetime('now', ?)
+            GROUP BY DATE(checked_at)
+            ORDER BY date
+        ''', (f'-{daily_days} days',))
+        daily = [dict(row) for row in cursor.fetchall()]
 
-            cursor = self.conn.cursor()
-
-            cursor.execute('SELECT COUNT(*) as count FROM listings')
-            total = cursor.fetchone()['count']
-
-            cursor.execute('''
-                SELECT platform, COUNT(*) as count 
-                FROM listings 
-                GROUP BY platform
-            ''')
-            by_platform = {row['platform']: row['count'] for row in cursor.fetchall()}
-
-            cursor.execute('''
-                SELECT * FROM listings
-                ORDER BY created_at DESC
-                LIMIT ?
-            ''', (recent_limit,))
-            recent = [dict(row) for row in cursor.fetchall()]
-
-            cursor.execute('''
-                SELECT 
-                    l.platform, l.article_id, l.title, l.url, l.thumbnail,
-                    ph.old_price, ph.new_price, ph.changed_at
-                FROM price_history ph
-                JOIN listings l ON ph.listing_id = l.id
-                WHERE ph.changed_at >= datetime('now', ?)
-                ORDER BY ph.changed_at DESC
-                LIMIT ?
-            ''', (f'-{price_change_days} days', price_change_limit))
-            price_changes = [dict(row) for row in cursor.fetchall()]
-
-            cursor.execute('''
-                SELECT 
-                    keyword,
-                    COUNT(*) as count,
-                    MIN(price_numeric) as min_price,
-                    CAST(AVG(price_numeric) as INTEGER) as avg_price,
-                    MAX(price_numeric) as max_price
-                FROM listings
-                WHERE price_numeric > 0 
-                GROUP BY keyword
-                ORDER BY count DESC
-            ''')
-            analysis = [dict(row) for row in cursor.fetchall()]
-
-            cursor.execute('''
-                SELECT 
-                    DATE(checked_at) as date,
-                    SUM(items_found) as items_found,
-                    SUM(new_items) as new_items
-                FROM search_stats
-                WHERE checked_at >= datetime('now', ?)
-                GROUP BY DATE(checked_at)
-                ORDER BY date
-            ''', (f'-{daily_days} days',))
-            daily = [dict(row) for row in cursor.fetchall()]
-
-            cursor.execute(
-                '''
-                SELECT
-                    l.platform,
-                    l.title,
-                    ssh.old_status,
-                    ssh.new_status,
-                    ssh.changed_at,
-                    l.url
-                FROM sale_status_history ssh
-                JOIN listings l ON ssh.listing_id = l.id
-                ORDER BY ssh.changed_at DESC
-                LIMIT 20
-                '''
-            )
-            status_history = [dict(row) for row in cursor.fetchall()]
-
-            snapshot = {
-                'total': total,
-                'by_platform': by_platform,
-                'recent': recent,
-                'price_changes': price_changes,
-                'analysis': analysis,
-                'daily_stats': daily,
-                'status_history': status_history,
-            }
-            self._stats_cache[cache_key] = snapshot
-            self._cache_time = now
-            return snapshot
+        cursor.execute(
+            '''
+            SELECT
+                l.platform,
+                l.title,
+                ssh.old_status,
+                ssh.new_status,
+                ssh.changed_at,
+                l.url
+            FROM sale_status_history ssh
+            JOIN listings l ON ssh.listing_id = l.id
+            ORDER BY ssh.changed_at DESC
+            LIMIT 20
+            '''
+        )
+        status_history = [dict(row) for row in cursor.fetchall()]
+
+        snapshot = {
+            'total': total,
+            'by_platform': by_platform,
+            'recent': recent,
+            'price_changes': price_changes,
+            'analysis': analysis,
+            'daily_stats': daily,
+            'status_history': status_history,
+        }
+        with self.lock:
+            # Skip caching if a write landed while the snapshot was being read.
+            if generation == self._cache_generation:
+                self._stats_cache[cache_key] = snapshot
+                self._cache_time = now
+        return snapshot
 
-    def is_fuzzy_duplicate(self, item: Item, threshold: float = 0.9) -> bool:
+    def is_fuzzy_duplicate(self, item: Item, threshold: float = 0.9, pending: Iterable[Item] = ()) -> bool:
         """
         Check if item is a fuzzy duplicate of recent items.
         Optimized with price-based pre-filtering and quick_ratio pre-check.
+        `pending` adds items not yet stored (e.g. queued for add_listings_bulk) as candidates.
         """
-        with self.lock:
-            cursor = self.conn.cursor()
-            # Optimized: First filter by exact price match (reduces candidates significantly)
-            cursor.execute('''
-                SELECT title FROM listings 
-                WHERE platform = ? 
-                AND price = ?
-                AND created_at >= datetime('now', '-3 days')
-                LIMIT 20
-            ''', (item.platform, item.price))
-            
-            candidates = cursor.fetchall()
-            
-            for row in candidates:
-                # Use quick_ratio first (faster approximation)
-                matcher = difflib.SequenceMatcher(None, item.title, row['title'])
-                if matcher.quick_ratio() >= threshold:
-                    # Only compute full ratio if quick_ratio passes
-                    if matcher.ratio() >= threshold:
-                        return True
-            
-            return False
+        cursor = self._get_read_conn().cursor()
+        # Optimized: First filter by exact price match (reduces candidates significantly)
+        cursor.execute('''
+            SELECT title FROM listings 
+            WHERE platform = ? 
+            AND price = ?
+            AND created_at >= datetime('now', '-3 days')
+            LIMIT 20
+        ''', (item.platform, item.price))
+        
+        candidates = [row['title'] for row in cursor.fetchall()]
+        candidates.extend(
+            other.title for other in pending if other.platform == item.platform and other.price == item.price
+        )
+        
+        for title in candidates:
+            # Use quick_ratio first (faster approximation)
+            matcher = difflib.SequenceMatcher(None, item.title, title)
+            if matcher.quick_ratio() >= threshold:
+                # Only compute full ratio if quick_ratio passes
+                if matcher.ratio() >= threshold:
+                    return True
+        
+        return False
 
     def get_daily_stats(self, days: int = 7) -> list:
         """Get daily statistics for the past N days"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT 
-                    DATE(checked_at) as date,
-                    SUM(items_found) as items_found,
-                    SUM(new_items) as new_items
-                FROM search_stats
-                WHERE checked_at >= datetime('now', ?)
-                GROUP BY DATE(checked_at)
-                ORDER BY date
-            ''', (f'-{days} days',))
-            return [dict(row) for row in cursor.fetchall()]
+        self.flush()
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('''
+            SELECT 
+                DATE(checked_at) as date,
+                SUM(items_found) as items_found,
+                SUM(new_items) as new_items
+            FROM search_stats
+            WHERE checked_at >= datetime('now', ?)
+            GROUP BY DATE(checked_at)
+            ORDER BY date
+        ''', (f'-{days} days',))
+        return [dict(row) for row in cursor.fetchall()]
     
     def get_price_changes(self, days: int = 7) -> list:
         """Get recent price changes"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT 
-                    l.platform, l.article_id, l.title, l.url, l.thumbnail,
-                    ph.old_price, ph.new_price, ph.changed_at
-                FROM price_history ph
-                JOIN listings l ON ph.listing_id = l.id
-                WHERE ph.changed_at >= datetime('now', ?)
-                ORDER BY ph.changed_at DESC
-                LIMIT 50
-            ''', (f'-{days} days',))
-            return [dict(row) for row in cursor.fetchall()]
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('''
+            SELECT 
+                l.platform, l.article_id, l.title, l.url, l.thumbnail,
+                ph.old_price, ph.new_price, ph.changed_at
+            FROM price_history ph
+            JOIN listings l ON ph.listing_id = l.id
+            WHERE ph.changed_at >= datetime('now', ?)
+            ORDER BY ph.changed_at DESC
+            LIMIT 50
+        ''', (f'-{days} days',))
+        return [dict(row) for row in cursor.fetchall()]
     
     def get_recent_listings(self, limit: int = 20) -> list:
         """Get most recent listings"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT * FROM listings
-                ORDER BY created_at DESC
-                LIMIT ?
-            ''', (limit,))
-            return [dict(row) for row in cursor.fetchall()]
+        cursor = self._get_read_conn().cursor()
+        cursor.execute(f'''
+            SELECT {self._RECENT_LISTING_COLUMNS} FROM listings
+            ORDER BY created_at DESC
+            LIMIT ?
+        ''', (limit,))
+        return [dict(row) for row in cursor.fetchall()]
 
     # Favorites Management
     def get_listing_id(self, platform: str, article_id: str) -> Optional[int]:
         """Get listing ID by platform and article_id"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                'SELECT id FROM listings WHERE platform = ? AND article_id = ?', 
-                (platform, article_id)
-            )
-            row = cursor.fetchone()
-            return row['id'] if row else None
+        cursor = self._get_read_conn().cursor()
+        cursor.execute(
+            'SELECT id FROM listings WHERE platform = ? AND article_id = ?', 
+            (platform, article_id)
+        )
+        row = cursor.fetchone()
+        return row['id'] if row else None
 
     def add_favorite(self, listing_id: int, notes: str = "", target_price: int | None = None) -> bool:
         """Add a listing to favorites"""
@@ -1019,6 +1311,7 @@ class DatabaseManager:
                 ''', (listing_id, notes, target_price))
                 self.conn.commit()
                 self._invalidate_cache()
+                self._fav_version += 1
                 return True
             except sqlite3.IntegrityError:
                 return False
@@ -1050,6 +1343,7 @@ class DatabaseManager:
             ''', tuple(params))
             self.conn.commit()
             self._invalidate_cache()
+            self._fav_version += 1
             return cursor.rowcount > 0
 
     def remove_favorite(self, listing_id: int):
@@ -1059,45 +1353,66 @@ class DatabaseManager:
             cursor.execute('DELETE FROM favorites WHERE listing_id = ?', (listing_id,))
             self.conn.commit()
             self._invalidate_cache()
+            self._fav_version += 1
+
+    def remove_favorites(self, listing_ids: Iterable[int]) -> int:
+        """Remove several listings from favorites in one transaction"""
+        params = [(int(listing_id),) for listing_id in listing_ids]
+        if not params:
+            return 0
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.executemany('DELETE FROM favorites WHERE listing_id = ?', params)
+            self.conn.commit()
+            self._invalidate_cache()
+            self._fav_version += 1
+            return cursor.rowcount
     
     def is_favorite(self, listing_id: int) -> bool:
         """Check if a listing is in favorites"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT 1 FROM favorites WHERE listing_id = ?', (listing_id,))
-            return cursor.fetchone() is not None
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('SELECT 1 FROM favorites WHERE listing_id = ?', (listing_id,))
+        return cursor.fetchone() is not None
 
     def get_favorite_details(self, listing_id: int) -> Optional[dict]:
         """Get favorite details (notes, target_price)"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT notes, target_price FROM favorites WHERE listing_id = ?', (listing_id,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('SELECT notes, target_price FROM favorites WHERE listing_id = ?', (listing_id,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+    def favorites_version(self) -> tuple:
+        """
+        Cheap change token for get_favorites().
+        Combines the favorites write counter with a fingerprint of the favorited
+        listings only, so unrelated listing upserts and telemetry flushes don't
+        move it. Price and status are included because updated_at has one-second
+        resolution.
+        """
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('''
+            SELECT COUNT(*), MAX(l.updated_at),
+                   group_concat(COALESCE(l.price, '') || '|' || COALESCE(l.sale_status, ''))
+            FROM favorites f
+            JOIN listings l ON f.listing_id = l.id
+        ''')
+        return (self._fav_version, *cursor.fetchone())
 
     def get_favorites(self) -> list:
         """Get all favorite listings with details"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT l.*, f.notes, f.target_price, f.added_at as fav_added_at
-                FROM favorites f
-                JOIN listings l ON f.listing_id = l.id
-                ORDER BY f.added_at DESC
-            ''')
-            return [dict(row) for row in cursor.fetchall()]
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('''
+            SELECT l.*, f.notes, f.target_price, f.added_at as fav_added_at
+            FROM favorites f
+            JOIN listings l ON f.listing_id = l.id
+            ORDER BY f.added_at DESC
+        ''')
+        return [dict(row) for row in cursor.fetchall()]
 
     # Notification Logging
     def log_notification(self, listing_id: int, notification_type: str, message: str):
-        """Log a sent notification"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT INTO notification_log (listing_id, notification_type, message_preview)
-                VALUES (?, ?, ?)
-            ''', (listing_id, notification_type, message[:200]))  # store preview
-            self.conn.commit()
-            self._invalidate_cache()
+        """Log a sent notification (buffered; committed by the background flusher)"""
+        self._enqueue_write("notification_log", (listing_id, notification_type, message[:200]))  # store preview
 
     def log_notification_delivery(
         self,
@@ -1131,85 +1446,84 @@ class DatabaseManager:
 
     def get_notification_logs(self, limit: int = 50, offset: int = 0) -> list:
         """Get notification logs"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT nl.*, l.title, l.platform, l.price, l.url
-                FROM notification_log nl
-                JOIN listings l ON nl.listing_id = l.id
-                ORDER BY nl.sent_at DESC
-                LIMIT ? OFFSET ?
-            ''', (limit, offset))
-            return [dict(row) for row in cursor.fetchall()]
+        self.flush()
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('''
+            SELECT nl.*, l.title, l.platform, l.price, l.url
+            FROM notification_log nl
+            JOIN listings l ON nl.listing_id = l.id
+            ORDER BY nl.sent_at DESC
+            LIMIT ? OFFSET ?
+        ''', (limit, offset))
+        return [dict(row) for row in cursor.fetchall()]
 
     def get_notification_delivery_summary(self, days: int = 7) -> dict[str, dict[str, Any]]:
         """Summarize delivery success/failure and last events per channel."""
-        with self.lock:
-            cursor = self.conn.cursor()
-            channels = ("telegram", "discord", "slack")
-            summary: dict[str, dict[str, Any]] = {
-                channel: {
-                    "success_count": 0,
-                    "failed_count": 0,
-                    "success_rate": 0.0,
-                    "last_success_at": None,
-                    "last_failure_at": None,
-                    "last_failure_message": None,
-                    "last_rate_limited_at": None,
-                }
-                for channel in channels
+        cursor = self._get_read_conn().cursor()
+        channels = ("telegram", "discord", "slack")
+        summary: dict[str, dict[str, Any]] = {
+            channel: {
+                "success_count": 0,
+                "failed_count": 0,
+                "success_rate": 0.0,
+                "last_success_at": None,
+                "last_failure_at": None,
+                "last_failure_message": None,
+                "last_rate_limited_at": None,
             }
+            for channel in channels
+        }
+
+        cursor.execute(
+            '''
+            SELECT
+                notification_type,
+                SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) AS success_count,
+                SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) AS failed_count,
+                MAX(CASE WHEN status = 'success' THEN sent_at END) AS last_success_at,
+                MAX(CASE WHEN status = 'failed' THEN sent_at END) AS last_failure_at,
+                MAX(CASE WHEN rate_limited = 1 THEN sent_at END) AS last_rate_limited_at
+            FROM notification_delivery_log
+            WHERE sent_at >= datetime('now', ?)
+            GROUP BY notification_type
+            ''',
+            (f'-{days} days',),
+        )
+        for row in cursor.fetchall():
+            channel = str(row["notification_type"] or "")
+            if channel not in summary:
+                continue
+            success_count = int(row["success_count"] or 0)
+            failed_count = int(row["failed_count"] or 0)
+            total = success_count + failed_count
+            summary[channel].update(
+                {
+                    "success_count": success_count,
+                    "failed_count": failed_count,
+                    "success_rate": round((success_count / total) * 100.0, 1) if total else 0.0,
+                    "last_success_at": row["last_success_at"],
+                    "last_failure_at": row["last_failure_at"],
+                    "last_rate_limited_at": row["last_rate_limited_at"],
+                }
+            )
 
+        for channel in channels:
             cursor.execute(
                 '''
-                SELECT
-                    notification_type,
-                    SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) AS success_count,
-                    SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) AS failed_count,
-                    MAX(CASE WHEN status = 'success' THEN sent_at END) AS last_success_at,
-                    MAX(CASE WHEN status = 'failed' THEN sent_at END) AS last_failure_at,
-                    MAX(CASE WHEN rate_limited = 1 THEN sent_at END) AS last_rate_limited_at
+                SELECT error_message
                 FROM notification_delivery_log
-                WHERE sent_at >= datetime('now', ?)
-                GROUP BY notification_type
+                WHERE notification_type = ?
+                  AND status = 'failed'
+                  AND sent_at >= datetime('now', ?)
+                ORDER BY sent_at DESC
+                LIMIT 1
                 ''',
-                (f'-{days} days',),
+                (channel, f'-{days} days'),
             )
-            for row in cursor.fetchall():
-                channel = str(row["notification_type"] or "")
-                if channel not in summary:
-                    continue
-                success_count = int(row["success_count"] or 0)
-                failed_count = int(row["failed_count"] or 0)
-                total = success_count + failed_count
-                summary[channel].update(
-                    {
-                        "success_count": success_count,
-                        "failed_count": failed_count,
-                        "success_rate": round((success_count / total) * 100.0, 1) if total else 0.0,
-                        "last_success_at": row["last_success_at"],
-                        "last_failure_at": row["last_failure_at"],
-                        "last_rate_limited_at": row["last_rate_limited_at"],
-                    }
-                )
-
-            for channel in channels:
-                cursor.execute(
-                    '''
-                    SELECT error_message
-                    FROM notification_delivery_log
-                    WHERE notification_type = ?
-                      AND status = 'failed'
-                      AND sent_at >= datetime('now', ?)
-                    ORDER BY sent_at DESC
-                    LIMIT 1
-                    ''',
-                    (channel, f'-{days} days'),
-                )
-                row = cursor.fetchone()
-                summary[channel]["last_failure_message"] = row["error_message"] if row else None
+            row = cursor.fetchone()
+            summary[channel]["last_failure_message"] = row["error_message"] if row else None
 
-            return summary
+        return summary
 
     # Seller Management
     def add_seller_filter(self, seller_name: str, platform: str, is_blocked: bool = True, notes: str = ""):
@@ -1226,6 +1540,7 @@ class DatabaseManager:
             ''', (seller_name, platform, is_blocked, notes))
             self.conn.commit()
             self._invalidate_cache()
+            self._reload_blocked_sellers()
 
     def remove_seller_filter(self, seller_name: str, platform: str):
         """Remove a seller filter"""
@@ -1237,60 +1552,98 @@ class DatabaseManager:
             ''', (seller_name, platform))
             self.conn.commit()
             self._invalidate_cache()
+            self._reload_blocked_sellers()
+
+    def _reload_blocked_sellers(self) -> None:
+        """Refresh the in-memory block list. Caller must hold self.lock."""
+        cursor = self.conn.cursor()
+        cursor.execute("PRAGMA data_version")
+        self._blocked_sellers_version = cursor.fetchone()[0]
+        cursor.execute("SELECT seller_name, platform FROM seller_filters WHERE is_blocked = 1")
+        self._blocked_sellers = frozenset(
+            (row["seller_name"], row["platform"]) for row in cursor.fetchall()
+        )
 
-    def get_blocked_sellers(self) -> list:
-        """Get list of blocked sellers"""
+    def get_blocked_seller_keys(self) -> frozenset[tuple[str, Optional[str]]]:
+        """
+        Get (seller_name, platform) pairs of blocked sellers.
+        Reloads only when another connection has committed since the last load.
+        """
         with self.lock:
             cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT seller_name, platform, created_at
-                FROM seller_filters 
-                WHERE is_blocked = 1
-                ORDER BY created_at DESC
-            ''')
-            return [dict(row) for row in cursor.fetchall()]
+            cursor.execute("PRAGMA data_version")
+            if cursor.fetchone()[0] != self._blocked_sellers_version:
+                self._reload_blocked_sellers()
+            return self._blocked_sellers
+
+    def is_seller_blocked(self, seller_name: str, platform: str) -> bool:
+        """Check the in-memory block list (platform-less entries block everywhere)."""
+        blocked = self.get_blocked_seller_keys()
+        return (
+            (seller_name, platform) in blocked
+            or (seller_name, None) in blocked
+            or (seller_name, "") in blocked
+        )
+
+    def get_blocked_sellers(self) -> list:
+        """Get list of blocked sellers"""
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('''
+            SELECT seller_name, platform, created_at
+            FROM seller_filters 
+            WHERE is_blocked = 1
+            ORDER BY created_at DESC
+        ''')
+        return [dict(row) for row in cursor.fetchall()]
 
     def get_seller_filters(self) -> list:
         """Get all seller filters"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT * FROM seller_filters ORDER BY created_at DESC')
-            return [dict(row) for row in cursor.fetchall()]
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('SELECT * FROM seller_filters ORDER BY created_at DESC')
+        return [dict(row) for row in cursor.fetchall()]
     
     def close(self):
-        """Close database connection"""
-        self.conn.close()
+        """Flush queued writes and close database connection"""
+        self._flusher_stop.set()
+        if self._flusher.is_alive() and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=5)
+        with self.lock:
+            try:
+                self._flush_pending_writes()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Final write flush failed: {e}")
+            try:
+                # Refresh planner statistics where SQLite deems it worthwhile.
+                self.conn.execute('PRAGMA optimize')
+            except sqlite3.Error as e:
+                self.logger.debug(f"PRAGMA optimize skipped: {e}")
+            self.conn.close()
+        with self._reader_conns_lock:
+            for conn in self._reader_conns:
+                conn.close()
+            self._reader_conns.clear()
     
     # Search History Methods
     def add_search_history(self, keyword: str):
-        """Add or update search history entry"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT INTO search_history (keyword)
-                VALUES (?)
-                ON CONFLICT(keyword) DO UPDATE SET
-                use_count = use_count + 1,
-                last_used = CURRENT_TIMESTAMP
-            ''', (keyword,))
-            self.conn.commit()
-            self._invalidate_cache()
+        """Add or update search history entry (buffered; committed by the background flusher)"""
+        self._enqueue_write("search_history", (keyword,))
     
     def get_search_history(self, limit: int = 10) -> list:
         """Get recent search keywords, ordered by last used"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT keyword, use_count, last_used
-                FROM search_history
-                ORDER BY last_used DESC
-                LIMIT ?
-            ''', (limit,))
-            return [row['keyword'] for row in cursor.fetchall()]
+        self.flush()
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('''
+            SELECT keyword, use_count, last_used
+            FROM search_history
+            ORDER BY last_used DESC
+            LIMIT ?
+        ''', (limit,))
+        return [row['keyword'] for row in cursor.fetchall()]
     
     def clear_search_history(self):
         """Clear all search history"""
         with self.lock:
+            self._flush_pending_writes()
             cursor = self.conn.cursor()
             cursor.execute('DELETE FROM search_history')
             self.conn.commit()
@@ -1318,15 +1671,14 @@ class DatabaseManager:
     
     def get_listing_note(self, listing_id: int) -> Optional[dict]:
         """Get note for a listing"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT note, status_tag, created_at, updated_at
-                FROM listing_notes
-                WHERE listing_id = ?
-            ''', (listing_id,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('''
+            SELECT note, status_tag, created_at, updated_at
+            FROM listing_notes
+            WHERE listing_id = ?
+        ''', (listing_id,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
     
     def delete_listing_note(self, listing_id: int):
         """Delete a listing note"""
@@ -1338,28 +1690,27 @@ class DatabaseManager:
     
     def get_listings_with_notes(self) -> list:
         """Get all listings that have notes"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT l.*, ln.note, ln.status_tag,
-                       COALESCE(
-                           (
-                               SELECT json_group_array(tag_name)
-                               FROM (
-                                   SELECT tag_name
-                                   FROM listing_auto_tags lat
-                                   WHERE lat.listing_id = l.id
-                                   ORDER BY tag_name
-                               )
-                           ),
-                           '[]'
-                       ) as auto_tags,
-                       ln.updated_at as note_updated
-                FROM listing_notes ln
-                JOIN listings l ON ln.listing_id = l.id
-                ORDER BY ln.updated_at DESC
-            ''')
-            return [dict(row) for row in cursor.fetchall()]
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('''
+            SELECT l.*, ln.note, ln.status_tag,
+                   COALESCE(
+                       (
+                           SELECT json_group_array(tag_name)
+                           FROM (
+                               SELECT tag_name
+                               FROM listing_auto_tags lat
+                               WHERE lat.listing_id = l.id
+                               ORDER BY tag_name
+                           )
+                       ),
+                       '[]'
+                   ) as auto_tags,
+                   ln.updated_at as note_updated
+            FROM listing_notes ln
+            JOIN listings l ON ln.listing_id = l.id
+            ORDER BY ln.updated_at DESC
+        ''')
+        return [dict(row) for row in cursor.fetchall()]
     
     # ===== Feature #12: Sale Status =====
     
@@ -1388,10 +1739,11 @@ class DatabaseManager:
     
     def detect_sale_status(self, title: str) -> str:
         """Detect sale status from title text"""
-        title_lower = title.lower() if title else ""
-        if any(keyword in title_lower for keyword in ["판매완료", "거래완료", "sold"]):
+        if not title:
+            return "for_sale"
+        if _SOLD_TITLE_PATTERN.search(title):
             return "sold"
-        elif any(keyword in title_lower for keyword in ["예약중", "예약", "reserved"]):
+        if _RESERVED_TITLE_PATTERN.search(title):
             return "reserved"
         return "for_sale"
 
@@ -1418,156 +1770,127 @@ class DatabaseManager:
         search: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        cursor_created_at: str | None = None,
+        cursor_id: int | None = None,
     ) -> list:
-        """Get listings filtered by sale status"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            query = 'SELECT * FROM listings WHERE 1=1'
-            params = []
-            
-            if status and status != 'all':
-                query += ' AND sale_status = ?'
-                params.append(status)
-            
-            if platform:
-                query += ' AND platform = ?'
-                params.append(platform)
-            
-            if search:
-                query += ' AND title LIKE ?'
-                params.append(f'%{search}%')
-            
-            query += ' ORDER BY created_at DESC LIMIT ? OFFSET ?'
-            params.extend([limit, offset])
-            
-            cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+        """Get listings filtered by sale status.
+
+        Passing the (created_at, id) of the last row of the previous page as
+        cursor_created_at/cursor_id seeks straight to the next page instead of
+        skipping `offset` rows.
+        """
+        cursor = self._get_read_conn().cursor()
+        where, params = self._listing_filter_clause(platform, search, status)
+        if cursor_created_at is not None and cursor_id is not None:
+            where += ' AND (created_at, id) < (?, ?)'
+            params = [*params, cursor_created_at, cursor_id]
+            offset = 0
+        cursor.execute(
+            f'SELECT * FROM listings WHERE {where} ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?',
+            [*params, limit, offset],
+        )
+        return [dict(row) for row in cursor.fetchall()]
     
     def get_status_counts(self) -> dict:
         """Get count of listings by sale status"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT sale_status, COUNT(*) as count
-                FROM listings
-                GROUP BY sale_status
-            ''')
-            return {row['sale_status'] or 'for_sale': row['count'] for row in cursor.fetchall()}
+        cursor = self._get_read_conn().cursor()
+        cursor.execute('''
+            SELECT sale_status, COUNT(*) as count
+            FROM listings
+            GROUP BY sale_status
+        ''')
+        counts: dict[str, int] = {}
+        for row in cursor.fetchall():
+            # NULL status (legacy rows) is reported as for_sale; merge rather than overwrite.
+            key = row['sale_status'] or 'for_sale'
+            counts[key] = counts.get(key, 0) + row['count']
+        return counts
 
     def get_status_history(self, limit: int = 20) -> list:
         """Get recent sale status changes."""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                '''
-                SELECT
-                    l.platform,
-                    l.title,
-                    l.url,
-                    ssh.old_status,
-                    ssh.new_status,
-                    ssh.changed_at
-                FROM sale_status_history ssh
-                JOIN listings l ON ssh.listing_id = l.id
-                ORDER BY ssh.changed_at DESC
-                LIMIT ?
-                ''',
-                (limit,),
-            )
-            return [dict(row) for row in cursor.fetchall()]
+        cursor = self._get_read_conn().cursor()
+        cursor.execute(
+            '''
+            SELECT
+                l.platform,
+                l.title,
+                l.url,
+                ssh.old_status,
+                ssh.new_status,
+                ssh.changed_at
+            FROM sale_status_history ssh
+            JOIN listings l ON ssh.listing_id = l.id
+            ORDER BY ssh.changed_at DESC
+            LIMIT ?
+            ''',
+            (limit,),
+        )
+        return [dict(row) for row in cursor.fetchall()]
     
     # ===== Feature #18: Cleanup =====
     
+    @staticmethod
+    def _cleanup_filter(days: int, exclude_favorites: bool, exclude_noted: bool) -> tuple[str, list]:
+        """WHERE clause (over listings) selecting cleanup candidates."""
+        where = "listings.created_at < datetime('now', ?)"
+        if exclude_favorites:
+            where += ' AND NOT EXISTS (SELECT 1 FROM favorites f WHERE f.listing_id = listings.id)'
+        if exclude_noted:
+            where += ' AND NOT EXISTS (SELECT 1 FROM listing_notes ln WHERE ln.listing_id = listings.id)'
+        return where, [f'-{days} days']
+
     def get_cleanup_preview(self, days: int = 30, 
                             exclude_favorites: bool = True,
                             exclude_noted: bool = True) -> dict:
         """Preview how many listings would be deleted"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            
-            query = '''
-                SELECT COUNT(*) as count FROM listings
-                WHERE created_at < datetime('now', ?)
-            '''
-            params = [f'-{days} days']
-            
-            if exclude_favorites:
-                query += ' AND id NOT IN (SELECT listing_id FROM favorites)'
-            
-            if exclude_noted:
-                query += ' AND id NOT IN (SELECT listing_id FROM listing_notes)'
-            
-            cursor.execute(query, params)
-            delete_count = cursor.fetchone()['count']
-            
-            # Get total count
-            cursor.execute('SELECT COUNT(*) as count FROM listings')
-            total_count = cursor.fetchone()['count']
-            
-            return {
-                'delete_count': delete_count,
-                'total_count': total_count,
-                'days': days,
-                'exclude_favorites': exclude_favorites,
-                'exclude_noted': exclude_noted
-            }
+        cursor = self._get_read_conn().cursor()
+        
+        where, params = self._cleanup_filter(days, exclude_favorites, exclude_noted)
+        cursor.execute(f'SELECT COUNT(*) as count FROM listings WHERE {where}', params)
+        delete_count = cursor.fetchone()['count']
+        
+        # Get total count
+        cursor.execute('SELECT COUNT(*) as count FROM listings')
+        total_count = cursor.fetchone()['count']
+        
+        return {
+            'delete_count': delete_count,
+            'total_count': total_count,
+            'days': days,
+            'exclude_favorites': exclude_favorites,
+            'exclude_noted': exclude_noted
+        }
     
     def cleanup_old_listings(self, days: int = 30,
                              exclude_favorites: bool = True,
                              exclude_noted: bool = True) -> int:
         """Delete old listings and return count deleted"""
         with self.lock:
+            self._flush_pending_writes()
             cursor = self.conn.cursor()
             
-            # First, delete related records
-            subquery = '''
-                SELECT id FROM listings
-                WHERE created_at < datetime('now', ?)
-            '''
-            params = [f'-{days} days']
-            
-            if exclude_favorites:
-                subquery += ' AND id NOT IN (SELECT listing_id FROM favorites)'
-            
-            if exclude_noted:
-                subquery += ' AND id NOT IN (SELECT listing_id FROM listing_notes)'
+            # Materialize the target ids once instead of re-running the filter per table
+            where, params = self._cleanup_filter(days, exclude_favorites, exclude_noted)
+            cursor.execute('CREATE TEMP TABLE IF NOT EXISTS cleanup_ids (id INTEGER PRIMARY KEY)')
+            cursor.execute('DELETE FROM cleanup_ids')
+            cursor.execute(f'INSERT INTO cleanup_ids (id) SELECT id FROM listings WHERE {where}', params)
             
-            # Delete price history for these listings
-            cursor.execute(f'''
-                DELETE FROM price_history WHERE listing_id IN ({subquery})
-            ''', params)
-            
-            # Delete notification logs for these listings
-            cursor.execute(f'''
-                DELETE FROM notification_log WHERE listing_id IN ({subquery})
-            ''', params)
-
-            cursor.execute(f'''
-                DELETE FROM notification_delivery_log WHERE listing_id IN ({subquery})
-            ''', params)
-
-            cursor.execute(f'''
-                DELETE FROM sale_status_history WHERE listing_id IN ({subquery})
-            ''', params)
-
-            cursor.execute(f'''
-                DELETE FROM listing_auto_tags WHERE listing_id IN ({subquery})
-            ''', params)
-
-            cursor.execute(f'''
-                DELETE FROM listing_notes WHERE listing_id IN ({subquery})
-            ''', params)
-
-            cursor.execute(f'''
-                DELETE FROM favorites WHERE listing_id IN ({subquery})
-            ''', params)
+            # First, delete related records
+            for table in (
+                'price_history',
+                'notification_log',
+                'notification_delivery_log',
+                'sale_status_history',
+                'listing_auto_tags',
+                'listing_notes',
+                'favorites',
+            ):
+                cursor.execute(f'DELETE FROM {table} WHERE listing_id IN (SELECT id FROM cleanup_ids)')
              
             # Delete the listings
-            delete_query = f'''
-                DELETE FROM listings WHERE id IN ({subquery})
-            '''
-            cursor.execute(delete_query, params)
+            cursor.execute('DELETE FROM listings WHERE id IN (SELECT id FROM cleanup_ids)')
             deleted_count = cursor.rowcount
+            cursor.execute('DELETE FROM cleanup_ids')
             
             self.conn.commit()
             self._invalidate_cache()
@@ -1594,18 +1917,33 @@ class DatabaseManager:
     
     def get_auto_tags(self, listing_id: int) -> list:
         """Get auto-generated tags for a listing"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                '''
-                SELECT tag_name
-                FROM listing_auto_tags
-                WHERE listing_id = ?
-                ORDER BY tag_name
-                ''',
-                (listing_id,),
-            )
-            return [str(row['tag_name']) for row in cursor.fetchall()]
+        cursor = self._get_read_conn().cursor()
+        cursor.execute(
+            '''
+            SELECT tag_name
+            FROM listing_auto_tags
+            WHERE listing_id = ?
+            ORDER BY tag_name
+            ''',
+            (listing_id,),
+        )
+        return [str(row['tag_name']) for row in cursor.fetchall()]
+
+    def get_listings_by_tag(self, tag_name: str, limit: int = 100) -> list:
+        """Get listings carrying an auto-generated tag, newest first"""
+        cursor = self._get_read_conn().cursor()
+        cursor.execute(
+            '''
+            SELECT l.*
+            FROM listing_auto_tags lat
+            JOIN listings l ON lat.listing_id = l.id
+            WHERE lat.tag_name = ?
+            ORDER BY l.created_at DESC
+            LIMIT ?
+            ''',
+            (str(tag_name).strip(), limit),
+        )
+        return [dict(row) for row in cursor.fetchall()]
     
     # ===== Feature #16: Enhanced Export =====
     
@@ -1619,58 +1957,124 @@ class DatabaseManager:
         include_sold: bool = True,
     ) -> list:
         """Get listings with all filters for export"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            query = '''
-                SELECT l.*, 
-                       COALESCE(ln.note, '') as note,
-                       COALESCE(ln.status_tag, '') as user_status,
-                       COALESCE(
-                           (
-                               SELECT json_group_array(tag_name)
-                               FROM (
-                                   SELECT tag_name
-                                   FROM listing_auto_tags lat
-                                   WHERE lat.listing_id = l.id
-                                   ORDER BY tag_name
-                               )
-                           ),
-                           '[]'
-                       ) as auto_tags
-                FROM listings l
-                LEFT JOIN listing_notes ln ON l.id = ln.listing_id
-                WHERE 1=1
-            '''
-            params = []
-            
-            if platform and platform != 'all':
-                query += ' AND l.platform = ?'
-                params.append(platform)
-            
-            if search:
-                query += ' AND l.title LIKE ?'
-                params.append(f'%{search}%')
-            
-            if status and status != 'all':
-                query += ' AND l.sale_status = ?'
-                params.append(status)
-            
-            if not include_sold:
-                query += ' AND l.sale_status != ?'
-                params.append('sold')
-            
-            if date_from:
-                query += ' AND l.created_at >= ?'
-                params.append(date_from)
-            
-            if date_to:
-                query += ' AND l.created_at <= ?'
-                params.append(date_to)
-            
-            query += ' ORDER BY l.created_at DESC'
-            
-            cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+        return list(
+            self.iter_listings_for_export(
+                platform=platform,
+                search=search,
+                status=status,
+                date_from=date_from,
+                date_to=date_to,
+                include_sold=include_sold,
+            )
+        )
+
+    def count_listings_for_export(
+        self,
+        platform: str | None = None,
+        search: str | None = None,
+        status: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        include_sold: bool = True,
+    ) -> int:
+        """Number of rows iter_listings_for_export would yield (for progress reporting)"""
+        cursor = self._get_read_conn().cursor()
+        where, params = self._export_filter_clause(
+            platform, search, status, date_from, date_to, include_sold
+        )
+        cursor.execute(f'SELECT COUNT(*) FROM listings l WHERE {where}', params)
+        return cursor.fetchone()[0]
+
+    def _export_filter_clause(
+        self,
+        platform: str | None,
+        search: str | None,
+        status: str | None,
+        date_from: str | None,
+        date_to: str | None,
+        include_sold: bool,
+    ) -> tuple[str, list]:
+        """WHERE clause shared by the export query and its count (listings aliased as l)"""
+        where, params = self._listing_filter_clause(platform, search, status, alias="l.")
+        
+        if not include_sold:
+            where += ' AND l.sale_status != ?'
+            params.append('sold')
+        
+        if date_from:
+            where += ' AND l.created_at >= ?'
+            params.append(date_from)
+        
+        if date_to:
+            where += ' AND l.created_at <= ?'
+            params.append(date_to)
+        
+        return where, params
+
+    def iter_listings_for_export(
+        self,
+        platform: str | None = None,
+        search: str | None = None,
+        status: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        include_sold: bool = True,
+        batch_size: int = 500,
+        raw: bool = False,
+        chunk_rows: int = 10_000,
+    ) -> Iterator[Any]:
+        """
+        Yield export rows in fetchmany() batches instead of loading them all at once.
+        With raw=True the sqlite3.Row objects are yielded as fetched (no dict copy).
+
+        Rows are read in keyset-paginated chunks of chunk_rows on (created_at, id),
+        so no single read statement (and WAL snapshot) spans the whole export.
+        """
+        cursor = self._get_read_conn().cursor()
+        query = '''
+            SELECT l.*, 
+                   COALESCE(ln.note, '') as note,
+                   COALESCE(ln.status_tag, '') as user_status,
+                   COALESCE(
+                       (
+                           SELECT group_concat(tag_name, ', ')
+                           FROM (
+                               SELECT tag_name
+                               FROM listing_auto_tags lat
+                               WHERE lat.listing_id = l.id
+                               ORDER BY tag_name
+                           )
+                       ),
+                       ''
+                   ) as auto_tags_flat
+            FROM listings l
+            LEFT JOIN listing_notes ln ON l.id = ln.listing_id
+        '''
+        where, params = self._export_filter_clause(
+            platform, search, status, date_from, date_to, include_sold
+        )
+        order = ' ORDER BY l.created_at DESC, l.id DESC LIMIT ?'
+        first_page = f'{query} WHERE {where}{order}'
+        next_page = f'{query} WHERE {where} AND (l.created_at, l.id) < (?, ?){order}'
+        
+        cursor.execute(first_page, [*params, chunk_rows])
+        while True:
+            fetched = 0
+            last = None
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                fetched += len(rows)
+                last = rows[-1]
+                if raw:
+                    yield from rows
+                else:
+                    for row in rows:
+                        yield dict(row)
+            if fetched < chunk_rows or last is None:
+                break
+            cursor.execute(next_page, [*params, last['created_at'], last['id'], chunk_rows])
 
 
 if __name__ == "__main__":
@@ -2,39 +2,102 @@
 """Data export manager with detailed error messages"""
 
 import csv
+import itertools
 import logging
-from typing import Any, Mapping, Sequence
+from operator import itemgetter
+from typing import Any, Iterable, Mapping, Sequence
+
+# Optional Excel backends, imported on first use and cached here.
+# None = not tried yet; False = not installed.
+_openpyxl: Any = None
+_xlsxwriter: Any = None
+
+
+def _load_openpyxl() -> Any:
+    """Return the openpyxl module (with openpyxl.utils loaded), or False if missing."""
+    global _openpyxl
+    if _openpyxl is None:
+        try:
+            import openpyxl
+            import openpyxl.utils
+            _openpyxl = openpyxl
+        except ImportError:
+            _openpyxl = False
+    return _openpyxl
+
+
+def _load_xlsxwriter() -> Any:
+    """Return the xlsxwriter module, or False if missing."""
+    global _xlsxwriter
+    if _xlsxwriter is None:
+        try:
+            import xlsxwriter
+            _xlsxwriter = xlsxwriter
+        except ImportError:
+            _xlsxwriter = False
+    return _xlsxwriter
 
 
 class ExportManager:
     """Manages data export to various formats"""
     
+    EXCEL_WIDTH_SAMPLE_ROWS = 50
+    CSV_BUFFER_SIZE = 1 << 20
+    
     @staticmethod
     def export_to_csv(
-        data: Sequence[Mapping[str, Any]],
+        data: Iterable[Mapping[str, Any] | Sequence[Any]],
         filename: str,
         fields: Sequence[str] | None = None,
     ) -> tuple[bool, str]:
         """
-        Export list of dicts to CSV.
+        Export dicts to CSV.
+        Rows are streamed from any iterable (list, generator, DB iterator),
+        so callers do not need to materialize the full result set.
+        Rows may also be value sequences already in `fields` order.
         
         Returns:
             Tuple of (success: bool, message: str)
         """
-        if not data:
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
             return False, "내보낼 데이터가 없습니다."
             
         try:
-            field_names = list(fields) if fields else list(data[0].keys())
+            field_names = list(fields) if fields else list(first.keys())
+            count = 0
+            # itemgetter runs in C; rows missing a field fall back to .get() so they
+            # are written blank like before.
+            getter = itemgetter(*field_names)
+            single = len(field_names) == 1
+
+            def _values():
+                nonlocal count
+                for row in itertools.chain((first,), rows):
+                    count += 1
+                    try:
+                        values = getter(row)
+                    except KeyError:
+                        yield [row.get(k) for k in field_names]
+                        continue
+                    yield (values,) if single else values
+            
+            def _sequences():
+                nonlocal count
+                for values in itertools.chain((first,), rows):
+                    count += 1
+                    yield values
                 
-            with open(filename, 'w', newline='', encoding='utf-8-sig') as f:
-                writer = csv.DictWriter(f, fieldnames=field_names)
-                writer.writeheader()
-                for row in data:
-                    # Filter row to only include requested fields
-                    filtered = {k: row.get(k) for k in field_names}
-                    writer.writerow(filtered)
-            return True, f"{len(data):,}개 항목을 저장했습니다."
+            # A 1MB buffer keeps large exports from issuing a write() every few rows
+            with open(
+                filename, 'w', newline='', encoding='utf-8-sig',
+                buffering=ExportManager.CSV_BUFFER_SIZE,
+            ) as f:
+                writer = csv.writer(f)
+                writer.writerow(field_names)
+                writer.writerows(_values() if isinstance(first, Mapping) else _sequences())
+            return True, f"{count:,}개 항목을 저장했습니다."
         except PermissionError:
             msg = "파일 쓰기 권한이 없습니다. 다른 프로그램에서 파일을 사용 중인지 확인하세요."
             logging.error(f"CSV export failed: {msg}")
@@ -48,57 +111,145 @@ class ExportManager:
             logging.error(f"CSV export failed: {e}")
             return False, msg
 
+    @staticmethod
+    def _row_values(first: Mapping[str, Any] | Sequence[Any], field_names: Sequence[str]):
+        """Row -> cell values: dicts are projected onto field_names, sequences pass through."""
+        if isinstance(first, Mapping):
+            return lambda row: [row.get(k) for k in field_names]
+        return lambda row: row
+
+    @staticmethod
+    def _column_widths(field_names: Sequence[str], sample_values: Iterable[Sequence[Any]]) -> list[int]:
+        """Approximate column widths from the header and a sample of row values."""
+        widths = [len(str(field)) for field in field_names]
+        for values in sample_values:
+            for i, value in enumerate(values):
+                if value is None:
+                    continue
+                length = min(len(str(value)), 50)  # Cap at 50 chars
+                if length > widths[i]:
+                    widths[i] = length
+        return [width + 2 for width in widths]
+
     @staticmethod
     def export_to_excel(
-        data: Sequence[Mapping[str, Any]],
+        data: Iterable[Mapping[str, Any] | Sequence[Any]],
         filename: str,
         fields: Sequence[str] | None = None,
     ) -> tuple[bool, str]:
         """
-        Export list of dicts to Excel.
+        Export dicts to Excel.
+        Uses an openpyxl write-only workbook so rows are streamed to disk
+        instead of being kept as Cell objects.
         
         Returns:
             Tuple of (success: bool, message: str)
         """
-        try:
-            from openpyxl import Workbook
-            from openpyxl.utils import get_column_letter
-        except ImportError:
+        openpyxl = _load_openpyxl()
+        if not openpyxl:
             msg = "openpyxl 패키지가 설치되어 있지 않습니다. 'pip install openpyxl'을 실행하세요."
             logging.error(msg)
             return False, msg
             
-        if not data:
+        rows = iter(data)
+        # Write-only sheets need column widths before the first append, so widths
+        # are estimated from a leading sample that is then written as-is.
+        sample = list(itertools.islice(rows, ExportManager.EXCEL_WIDTH_SAMPLE_ROWS))
+        if not sample:
             return False, "내보낼 데이터가 없습니다."
             
         try:
-            wb = Workbook()
-            ws = wb.active
-            if ws is None:
-                return False, "내보내기 실패: 워크시트를 생성하지 못했습니다."
-            ws.title = "매물 목록"
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet(title="매물 목록")
             
-            field_names = list(fields) if fields else list(data[0].keys())
+            field_names = list(fields) if fields else list(sample[0].keys())
+            row_values = ExportManager._row_values(sample[0], field_names)
+            sample_values = [row_values(row) for row in sample]
             
-            # Header with styling
+            # Auto-adjust column widths (approximate)
+            widths = ExportManager._column_widths(field_names, sample_values)
+            for i, width in enumerate(widths, 1):
+                ws.column_dimensions[openpyxl.utils.get_column_letter(i)].width = width
+            
+            # Header
             ws.append(field_names)
             
             # Data
-            for row in data:
-                values = [row.get(k) for k in field_names]
+            for values in sample_values:
                 ws.append(values)
-            
-            # Auto-adjust column widths (approximate)
-            for i, field in enumerate(field_names, 1):
-                max_length = len(str(field))
-                for row in data[:50]:  # Check first 50 rows for performance
-                    cell_value = str(row.get(field, ''))
-                    if len(cell_value) > max_length:
-                        max_length = min(len(cell_value), 50)  # Cap at 50 chars
-                ws.column_dimensions[get_column_letter(i)].width = max_length + 2
+            count = len(sample_values)
+            for row in rows:
+                ws.append(row_values(row))
+                count += 1
             
             wb.save(filename)
-            return True, f"{len(data):,}개 항목을 저장했습니다."
+            return True, f"{count:,}개 항목을 저장했습니다."
+        except PermissionError:
+            msg = "파일 쓰기 권한이 없습니다. 다른 프로그램에서 파일을 사용 중인지 확인하세요."
+            logging.error(f"Excel export failed: {msg}")
+            return False, msg
+        except OSError as e:
+            msg = f"파일 저장 실패: {e.strerror}"
+            logging.error(f"Excel export failed: {msg}")
+            return False, msg
+        except Exception as e:
+            msg = f"내보내기 실패: {str(e)}"
+            logging.error(f"Excel export failed: {e}")
+            return False, msg
+
+    @staticmethod
+    def export_to_excel_fast(
+        data: Iterable[Mapping[str, Any] | Sequence[Any]],
+        filename: str,
+        fields: Sequence[str] | None = None,
+    ) -> tuple[bool, str]:
+        """
+        Export dicts to Excel with xlsxwriter in constant-memory mode.
+        Falls back to export_to_excel (openpyxl) when xlsxwriter is not installed.
+        
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        xlsxwriter = _load_xlsxwriter()
+        if not xlsxwriter:
+            return ExportManager.export_to_excel(data, filename, fields)
+            
+        rows = iter(data)
+        sample = list(itertools.islice(rows, ExportManager.EXCEL_WIDTH_SAMPLE_ROWS))
+        if not sample:
+            return False, "내보낼 데이터가 없습니다."
+            
+        wb = None
+        try:
+            # strings_to_urls off: URL cells stay plain strings, as in the openpyxl
+            # path (xlsxwriter drops URLs past its per-sheet hyperlink limits)
+            wb = xlsxwriter.Workbook(
+                filename, {'constant_memory': True, 'strings_to_urls': False}
+            )
+            ws = wb.add_worksheet("매물 목록")
+            
+            field_names = list(fields) if fields else list(sample[0].keys())
+            row_values = ExportManager._row_values(sample[0], field_names)
+            sample_values = [row_values(row) for row in sample]
+            
+            widths = ExportManager._column_widths(field_names, sample_values)
+            for i, width in enumerate(widths):
+                ws.set_column(i, i, width)
+            
+            # Header
+            ws.write_row(0, 0, field_names)
+            
+            # Data (constant_memory mode requires rows in ascending order)
+            row_index = 0
+            for row_index, values in enumerate(sample_values, 1):
+                ws.write_row(row_index, 0, values)
+            for row in rows:
+                row_index += 1
+                ws.write_row(row_index, 0, row_values(row))
+            
+            closing, wb = wb, None
+            closing.close()
+            return True, f"{row_index:,}개 항목을 저장했습니다."
         except PermissionError:
             msg = "파일 쓰기 권한이 없습니다. 다른 프로그램에서 파일을 사용 중인지 확인하세요."
             logging.error(f"Excel export failed: {msg}")
@@ -111,3 +262,10 @@ class ExportManager:
             msg = f"내보내기 실패: {str(e)}"
             logging.error(f"Excel export failed: {e}")
             return False, msg
+        finally:
+            # A failed write still has to release constant_memory's temp files
+            if wb is not None:
+                try:
+                    wb.close()
+                except Exception:
+                    pass
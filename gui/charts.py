@@ -1,40 +1,104 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from typing import Any
-import warnings
 
 FigureCanvas: Any = None
 Figure: Any = None
+HAS_MATPLOTLIB = False
+_matplotlib_loaded = False
 
-try:
-    import matplotlib
-    matplotlib.use('Qt5Agg')
-    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-    from matplotlib.figure import Figure
-    import matplotlib.pyplot as plt
-    
-    # Configure Korean font
-    plt.rcParams['font.family'] = ['Malgun Gothic', 'DejaVu Sans']
-    plt.rcParams['axes.unicode_minus'] = False
-    
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
 
+def _ensure_matplotlib() -> bool:
+    """Import matplotlib on first use; it is slow to import and only needed
+    once a chart is actually displayed."""
+    global FigureCanvas, Figure, HAS_MATPLOTLIB, _matplotlib_loaded
+    if _matplotlib_loaded:
+        return HAS_MATPLOTLIB
+    _matplotlib_loaded = True
+    try:
+        import matplotlib
+        matplotlib.use('Qt5Agg')
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+        from matplotlib.figure import Figure as _Figure
+        import matplotlib.pyplot as plt
+        
+        # Configure Korean font
+        plt.rcParams['font.family'] = ['Malgun Gothic', 'DejaVu Sans']
+        plt.rcParams['axes.unicode_minus'] = False
+        
+        FigureCanvas = FigureCanvasQTAgg
+        Figure = _Figure
+        HAS_MATPLOTLIB = True
+    except ImportError:
+        HAS_MATPLOTLIB = False
+    return HAS_MATPLOTLIB
 
-class PlatformChart(QWidget):
-    """Platform distribution pie chart"""
+
+class _LazyChart(QWidget):
+    """Chart widget whose matplotlib canvas is built on first show.
+    
+    update_chart() only records the latest data; redraws are coalesced by a
+    single-shot timer to at most one per UPDATE_INTERVAL_MS, and updates that
+    arrive before the first show are replayed then, so matplotlib is only
+    imported once a chart is actually displayed.
+    """
+    
+    UPDATE_INTERVAL_MS = 100
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._canvas_built = False
+        self._has_pending = False
+        self._pending_data: Any = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_INTERVAL_MS)
+        self._update_timer.timeout.connect(self._flush_update)
         self.setup_ui()
     
     def setup_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
-        if HAS_MATPLOTLIB and Figure is not None and FigureCanvas is not None:
-            self.figure = Figure(figsize=(4, 3), facecolor='#1e1e2e')
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._canvas_built:
+            return
+        self._canvas_built = True
+        self._build_canvas(self._layout)
+        self._flush_update()
+    
+    def update_chart(self, data: Any):
+        self._pending_data = data
+        self._has_pending = True
+        if self._canvas_built and not self._update_timer.isActive():
+            self._update_timer.start()
+    
+    def _flush_update(self):
+        if not self._has_pending:
+            return
+        data = self._pending_data
+        self._has_pending = False
+        self._pending_data = None
+        self._do_update_chart(data)
+    
+    def _build_canvas(self, layout: QVBoxLayout):
+        raise NotImplementedError
+    
+    def _do_update_chart(self, data: Any):
+        raise NotImplementedError
+
+
+class PlatformChart(_LazyChart):
+    """Platform distribution pie chart"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._last_key = None  # input of the last drawn chart; identical refreshes are skipped
+    
+    def _build_canvas(self, layout: QVBoxLayout):
+        if _ensure_matplotlib() and Figure is not None and FigureCanvas is not None:
+            self.figure = Figure(figsize=(4, 3), facecolor='#1e1e2e', layout='constrained')
             self.canvas = FigureCanvas(self.figure)
             self.canvas.setStyleSheet("background-color: transparent;")
             layout.addWidget(self.canvas)
@@ -55,12 +119,17 @@ class PlatformChart(QWidget):
         ax.set_facecolor('#1e1e2e')
         ax.axis('off')
         self.figure.patch.set_facecolor('#1e1e2e')
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
-    def update_chart(self, data: dict):
+    def _do_update_chart(self, data: dict):
         if not HAS_MATPLOTLIB or not hasattr(self, "figure") or not hasattr(self, "canvas"):
             return
         
+        key = tuple(sorted(data.items())) if data else ()
+        if key == self._last_key:
+            return
+        self._last_key = key
+        
         if not data or all(v == 0 for v in data.values()):
             self._draw_empty()
             return
@@ -93,26 +162,23 @@ class PlatformChart(QWidget):
         ax.axis('equal')
         self.figure.patch.set_facecolor('#1e1e2e')
         
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", UserWarning)
-            self.figure.tight_layout()
-        
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
 
-class DailyChart(QWidget):
+class DailyChart(_LazyChart):
     """Daily stats line/bar chart"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setup_ui()
+        self._last_key = None  # input of the last drawn chart; identical refreshes are skipped
+        # Artists reused across refreshes while the number of days is unchanged
+        self._ax = None
+        self._bars1 = None
+        self._bars2 = None
     
-    def setup_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
-        if HAS_MATPLOTLIB and Figure is not None and FigureCanvas is not None:
-            self.figure = Figure(figsize=(6, 3), facecolor='#1e1e2e')
+    def _build_canvas(self, layout: QVBoxLayout):
+        if _ensure_matplotlib() and Figure is not None and FigureCanvas is not None:
+            self.figure = Figure(figsize=(6, 3), facecolor='#1e1e2e', layout='constrained')
             self.canvas = FigureCanvas(self.figure)
             self.canvas.setStyleSheet("background-color: transparent;")
             layout.addWidget(self.canvas)
@@ -126,6 +192,7 @@ class DailyChart(QWidget):
     def _draw_empty(self):
         if not hasattr(self, "figure") or not hasattr(self, "canvas"):
             return
+        self._ax = self._bars1 = self._bars2 = None
         self.figure.clear()
         ax = self.figure.add_subplot(111)
         ax.text(0.5, 0.5, '데이터 없음', ha='center', va='center', 
@@ -133,27 +200,48 @@ class DailyChart(QWidget):
         ax.set_facecolor('#1e1e2e')
         ax.axis('off')
         self.figure.patch.set_facecolor('#1e1e2e')
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
-    def update_chart(self, data: list):
+    def _do_update_chart(self, data: list):
+        key = tuple((d['date'], d['items_found'], d['new_items']) for d in data) if data else ()
+        if key == self._last_key:
+            return
+        self._last_key = key
+        
         if not HAS_MATPLOTLIB or not hasattr(self, "figure") or not hasattr(self, "canvas") or not data:
             if HAS_MATPLOTLIB and hasattr(self, "figure") and hasattr(self, "canvas"):
                 self._draw_empty()
             return
         
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
         dates = [d['date'][-5:] for d in data]  # MM-DD format
         items_found = [d['items_found'] or 0 for d in data]
         new_items = [d['new_items'] or 0 for d in data]
         
-        x = range(len(dates))
+        if self._ax is not None and self._bars1 is not None and len(self._bars1) == len(dates):
+            # Same shape: update bar heights and labels in place instead of
+            # rebuilding the axes, spines, ticks and legend.
+            for rect, h in zip(self._bars1, items_found):
+                rect.set_height(h)
+            for rect, h in zip(self._bars2, new_items):
+                rect.set_height(h)
+            self._ax.set_xticklabels(dates, color='#7982a9', fontsize=9)
+            self._ax.relim()
+            self._ax.autoscale_view()
+            self.canvas.draw_idle()
+            return
+        
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        
+        # numpy is already loaded by matplotlib; imported here to keep module import light
+        import numpy as np
+        
+        x = np.arange(len(dates))
         width = 0.35
         
-        bars1 = ax.bar([i - width/2 for i in x], items_found, width, 
+        bars1 = ax.bar(x - width/2, np.asarray(items_found), width, 
                        label='검색됨', color='#7aa2f7', alpha=0.8)
-        bars2 = ax.bar([i + width/2 for i in x], new_items, width, 
+        bars2 = ax.bar(x + width/2, np.asarray(new_items), width, 
                        label='새 상품', color='#9ece6a', alpha=0.8)
         
         ax.set_xticks(x)
@@ -168,9 +256,6 @@ class DailyChart(QWidget):
         ax.spines['bottom'].set_color('#3b4261')
         
         self.figure.patch.set_facecolor('#1e1e2e')
+        self._ax, self._bars1, self._bars2 = ax, bars1, bars2
         
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", UserWarning)
-            self.figure.tight_layout()
-        
-        self.canvas.draw()
+        self.canvas.draw_idle()
@@ -1,13 +1,209 @@
 # gui/compare_dialog.py
 """Enhanced dialog for comparing multiple listings side by side"""
 
+import re
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTableWidget, QTableWidgetItem, QHeaderView, QFrame,
-    QTextEdit, QMessageBox, QFileDialog, QApplication
+    QTextEdit, QMessageBox, QFileDialog, QApplication, QWidget
+)
+from PyQt6.QtCore import Qt, QUrl, QRectF, QSize
+from PyQt6.QtGui import QDesktopServices, QColor, QFont, QFontMetrics, QPainter
+
+_DIGITS_RE = re.compile(r'\d+')
+
+# Comparison rows (label, listing key), top to bottom
+_COMPARE_ROWS = (
+    ("플랫폼", 'platform'),
+    ("제목", 'title'),
+    ("가격", 'price'),
+    ("판매자", 'seller'),
+    ("지역", 'location'),
+    ("등록일", 'created_at'),
+    ("상태", 'sale_status'),
+    ("링크", 'url'),
 )
-from PyQt6.QtCore import Qt, QUrl
-from PyQt6.QtGui import QDesktopServices, QColor
+_LINK_ROW = len(_COMPARE_ROWS) - 1
+
+_PLATFORM_ICONS = {
+    'danggeun': '🥕 당근마켓',
+    'bunjang': '⚡ 번개장터',
+    'joonggonara': '🛒 중고나라'
+}
+
+_STATUS_MAP = {
+    'for_sale': '🟢 판매중',
+    'reserved': '🟡 예약중',
+    'sold': '🔴 판매완료',
+}
+
+# Shared colours and stylesheets (parsed once per process, not per dialog)
+_COLOR_BEST_BG = QColor("#2a4d3e")
+_COLOR_BEST = QColor("#a6e3a1")
+_COLOR_BAR = QColor("#89b4fa")
+_COLOR_TEXT = QColor("#cdd6f4")
+_COLOR_MUTED = QColor("#6c7086")
+
+_COPY_BTN_STYLE = """
+    QPushButton {
+        background-color: #89b4fa;
+        color: #1e1e2e;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 8px;
+        font-weight: bold;
+    }
+    QPushButton:hover { background-color: #b4befe; }
+"""
+
+_EXPORT_BTN_STYLE = """
+    QPushButton {
+        background-color: #f9e2af;
+        color: #1e1e2e;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 8px;
+        font-weight: bold;
+    }
+    QPushButton:hover { background-color: #fab387; }
+"""
+
+_CLOSE_BTN_STYLE = """
+    QPushButton {
+        background-color: #45475a;
+        color: #cdd6f4;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 8px;
+    }
+    QPushButton:hover { background-color: #585b70; }
+"""
+
+_PANEL_FRAME_STYLE_PADDED = """
+    QFrame {
+        background-color: #313244;
+        border-radius: 8px;
+        padding: 8px;
+    }
+"""
+
+_TABLE_STYLE = """
+    QTableWidget {
+        background-color: #1e1e2e;
+        gridline-color: #45475a;
+        border: none;
+        border-radius: 8px;
+    }
+    QTableWidget::item {
+        padding: 8px;
+        color: #cdd6f4;
+    }
+    QTableWidget::item:selected {
+        background-color: #89b4fa;
+        color: #1e1e2e;
+    }
+    QHeaderView::section {
+        background-color: #181825;
+        color: #a6adc8;
+        padding: 8px;
+        border: none;
+        border-bottom: 2px solid #45475a;
+        font-weight: bold;
+    }
+"""
+
+_PANEL_FRAME_STYLE = """
+    QFrame {
+        background-color: #313244;
+        border-radius: 8px;
+    }
+"""
+
+_NOTES_EDIT_STYLE = """
+    QTextEdit {
+        background-color: #1e1e2e;
+        color: #cdd6f4;
+        border: 1px solid #45475a;
+        border-radius: 6px;
+        padding: 8px;
+    }
+"""
+
+
+class _PriceBars(QWidget):
+    """Price comparison bars painted by one widget instead of a frame/label set per listing"""
+    
+    BAR_WIDTH = 60
+    BAR_MAX_HEIGHT = 40
+    BAR_MIN_HEIGHT = 5
+    SPACING = 4
+    COLUMN_PADDING = 16
+    
+    def __init__(self, prices: list, price_texts: list, best_flags: list, max_price: int, parent=None):
+        super().__init__(parent)
+        self._prices = prices
+        self._texts = [f"⭐ {text}" if best else text for text, best in zip(price_texts, best_flags)]
+        self._best = best_flags
+        self._max_price = max_price
+        
+        self._price_font = QFont(self.font())
+        self._price_font.setPointSize(10)
+        self._best_font = QFont(self.font())
+        self._best_font.setPointSize(11)
+        self._best_font.setBold(True)
+        self._num_font = QFont(self.font())
+        self._num_font.setPointSize(9)
+        
+        price_fm = QFontMetrics(self._price_font)
+        best_fm = QFontMetrics(self._best_font)
+        self._text_height = max(price_fm.height(), best_fm.height())
+        self._num_height = QFontMetrics(self._num_font).height()
+        self._col_widths = [
+            max(self.BAR_WIDTH, (best_fm if best else price_fm).horizontalAdvance(text)) + self.COLUMN_PADDING
+            for text, best in zip(self._texts, self._best)
+        ]
+        self.setMinimumSize(self.sizeHint())
+    
+    def sizeHint(self) -> QSize:
+        height = self._text_height + self.BAR_MAX_HEIGHT + self._num_height + self.SPACING * 2
+        return QSize(sum(self._col_widths), height)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        bar_bottom = self._text_height + self.SPACING + self.BAR_MAX_HEIGHT
+        x = 0.0
+        for i, (price, text, best, col_width) in enumerate(
+            zip(self._prices, self._texts, self._best, self._col_widths)
+        ):
+            # Price label
+            painter.setFont(self._best_font if best else self._price_font)
+            painter.setPen(_COLOR_BEST if best else _COLOR_TEXT)
+            painter.drawText(QRectF(x, 0, col_width, self._text_height), Qt.AlignmentFlag.AlignCenter, text)
+            
+            # Bar
+            if self._max_price > 0 and price > 0:
+                bar_height = max(1, int((price / self._max_price) * self.BAR_MAX_HEIGHT))
+            else:
+                bar_height = self.BAR_MIN_HEIGHT
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(_COLOR_BEST if best else _COLOR_BAR)
+            painter.drawRoundedRect(
+                QRectF(x + (col_width - self.BAR_WIDTH) / 2, bar_bottom - bar_height, self.BAR_WIDTH, bar_height),
+                4, 4,
+            )
+            
+            # Item number
+            painter.setFont(self._num_font)
+            painter.setPen(_COLOR_MUTED)
+            painter.drawText(
+                QRectF(x, bar_bottom + self.SPACING, col_width, self._num_height),
+                Qt.AlignmentFlag.AlignCenter,
+                f"매물 {i+1}",
+            )
+            x += col_width
+        painter.end()
 
 
 class CompareDialog(QDialog):
@@ -16,7 +212,6 @@ class CompareDialog(QDialog):
     def __init__(self, listings: list, parent=None):
         super().__init__(parent)
         self.listings = listings
-        self.notes = {}  # Row notes for comparison
         self.setup_ui()
     
     def setup_ui(self):
@@ -38,62 +233,27 @@ class CompareDialog(QDialog):
         
         # Copy comparison button
         copy_btn = QPushButton("📋 복사")
-        copy_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #89b4fa;
-                color: #1e1e2e;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 8px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #b4befe; }
-        """)
+        copy_btn.setStyleSheet(_COPY_BTN_STYLE)
         copy_btn.setToolTip("비교 내용을 클립보드에 복사")
         copy_btn.clicked.connect(self._copy_to_clipboard)
         header.addWidget(copy_btn)
         
         # Export button
         export_btn = QPushButton("📥 저장")
-        export_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f9e2af;
-                color: #1e1e2e;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 8px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #fab387; }
-        """)
+        export_btn.setStyleSheet(_EXPORT_BTN_STYLE)
         export_btn.setToolTip("비교 결과를 텍스트 파일로 저장")
         export_btn.clicked.connect(self._export_comparison)
         header.addWidget(export_btn)
         
         close_btn = QPushButton("✖ 닫기")
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #45475a;
-                color: #cdd6f4;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 8px;
-            }
-            QPushButton:hover { background-color: #585b70; }
-        """)
+        close_btn.setStyleSheet(_CLOSE_BTN_STYLE)
         close_btn.clicked.connect(self.close)
         header.addWidget(close_btn)
         layout.addLayout(header)
         
         # Price comparison bar chart (simple visual representation)
         price_frame = QFrame()
-        price_frame.setStyleSheet("""
-            QFrame {
-                background-color: #313244;
-                border-radius: 8px;
-                padding: 8px;
-            }
-        """)
+        price_frame.setStyleSheet(_PANEL_FRAME_STYLE_PADDED)
         price_layout = QHBoxLayout(price_frame)
         price_layout.setContentsMargins(16, 12, 16, 12)
         
@@ -107,121 +267,91 @@ class CompareDialog(QDialog):
             price_num = item.get('price_numeric', 0)
             if not price_num:
                 # Try to parse from price string
-                price_str = item.get('price', '')
-                try:
-                    price_num = int(''.join(c for c in price_str if c.isdigit()) or '0')
-                except:
-                    price_num = 0
+                digits = _DIGITS_RE.findall(item.get('price') or '')
+                price_num = int(''.join(digits)) if digits else 0
             prices.append(price_num)
         
-        max_price = max(prices) if prices and max(prices) > 0 else 1
-        min_price = min(p for p in prices if p > 0) if any(p > 0 for p in prices) else 0
+        # Single pass: largest price (at least 1) and smallest positive price (0 if none)
+        max_price = 1
+        min_price = 0
+        for p in prices:
+            if p > max_price:
+                max_price = p
+            if p > 0 and (min_price == 0 or p < min_price):
+                min_price = p
+        # Lowest-price flags, shared by the bar chart and the table
+        is_best = [min_price > 0 and p == min_price for p in prices]
         
-        for i, (item, price) in enumerate(zip(self.listings, prices)):
-            bar_widget = QFrame()
-            bar_layout = QVBoxLayout(bar_widget)
-            bar_layout.setSpacing(4)
-            bar_layout.setContentsMargins(8, 0, 8, 0)
-            
-            # Price label
-            price_str = item.get('price', '가격미정')
-            price_label = QLabel(price_str)
-            
-            # Highlight lowest price
-            if price == min_price and min_price > 0:
-                price_label.setStyleSheet("color: #a6e3a1; font-weight: bold; font-size: 11pt;")
-                price_label.setText(f"⭐ {price_str}")
-            else:
-                price_label.setStyleSheet("color: #cdd6f4; font-size: 10pt;")
-            
-            bar_layout.addWidget(price_label, alignment=Qt.AlignmentFlag.AlignCenter)
-            
-            # Bar
-            bar_height = int((price / max_price) * 40) if max_price > 0 and price > 0 else 5
-            bar = QFrame()
-            bar_color = "#a6e3a1" if price == min_price and min_price > 0 else "#89b4fa"
-            bar.setStyleSheet(f"""
-                background-color: {bar_color};
-                border-radius: 4px;
-                min-width: 60px;
-                min-height: {bar_height}px;
-                max-height: {bar_height}px;
-            """)
-            bar_layout.addWidget(bar, alignment=Qt.AlignmentFlag.AlignCenter)
-            
-            # Item number
-            num_label = QLabel(f"매물 {i+1}")
-            num_label.setStyleSheet("color: #6c7086; font-size: 9pt;")
-            bar_layout.addWidget(num_label, alignment=Qt.AlignmentFlag.AlignCenter)
-            
-            price_layout.addWidget(bar_widget)
+        price_layout.addWidget(_PriceBars(
+            prices,
+            [item.get('price', '가격미정') for item in self.listings],
+            is_best,
+            max_price,
+        ))
         
         price_layout.addStretch()
         layout.addWidget(price_frame)
         
         # Comparison table (rows = attributes, columns = items)
         self.table = QTableWidget()
+        # Attribute rows have a fixed order; the grid never sorts, so setItem never re-sorts
+        self.table.setSortingEnabled(False)
         self.table.setColumnCount(len(self.listings))
-        self.table.setRowCount(8)  # Platform, Title, Price, Seller, Location, Date, Status, Link
+        self.table.setRowCount(len(_COMPARE_ROWS))
         
         # Row headers
-        row_labels = ["플랫폼", "제목", "가격", "판매자", "지역", "등록일", "상태", "링크"]
-        self.table.setVerticalHeaderLabels(row_labels)
+        self.table.setVerticalHeaderLabels([label for label, _ in _COMPARE_ROWS])
         
         # Column headers (item numbers)
         col_labels = [f"매물 {i+1}" for i in range(len(self.listings))]
         self.table.setHorizontalHeaderLabels(col_labels)
         
-        # Fill data
-        for col, item in enumerate(self.listings):
-            platform_icons = {
-                'danggeun': '🥕 당근마켓',
-                'bunjang': '⚡ 번개장터',
-                'joonggonara': '🛒 중고나라'
-            }
-            
-            # Row 0: Platform
-            self.table.setItem(0, col, QTableWidgetItem(
-                platform_icons.get(item.get('platform', ''), item.get('platform', ''))
-            ))
-            
-            # Row 1: Title
-            title_item = QTableWidgetItem(item.get('title', ''))
-            title_item.setToolTip(item.get('title', ''))  # Show full title on hover
-            self.table.setItem(1, col, title_item)
-            
-            # Row 2: Price
-            price_item = QTableWidgetItem(item.get('price', ''))
-            if prices[col] == min_price and min_price > 0:
-                price_item.setBackground(QColor("#2a4d3e"))
-                price_item.setText(f"⭐ {item.get('price', '')} (최저가)")
-            self.table.setItem(2, col, price_item)
-            
-            # Row 3: Seller
-            self.table.setItem(3, col, QTableWidgetItem(item.get('seller', '-')))
-            
-            # Row 4: Location
-            self.table.setItem(4, col, QTableWidgetItem(item.get('location', '-')))
-            
-            # Row 5: Date
-            created = item.get('created_at', '')
-            if created:
-                created = created[:10]  # Just the date part
-            self.table.setItem(5, col, QTableWidgetItem(created or '-'))
-            
-            # Row 6: Status
-            status_map = {
-                'for_sale': '🟢 판매중',
-                'reserved': '🟡 예약중',
-                'sold': '🔴 판매완료',
-            }
-            status = item.get('sale_status', 'for_sale')
-            self.table.setItem(6, col, QTableWidgetItem(status_map.get(status, status or '알수없음')))
-            
-            # Row 7: Link
-            link_item = QTableWidgetItem("🔗 열기")
-            link_item.setData(Qt.ItemDataRole.UserRole, item.get('url', ''))
-            self.table.setItem(7, col, link_item)
+        # Fill data with repaints and signals suspended so Qt lays out once
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            for col, item in enumerate(self.listings):
+                get = item.get
+                platform = get('platform', '')
+                title = get('title', '')
+                price = get('price', '')
+                created = get('created_at', '')
+                status = get('sale_status', 'for_sale')
+                
+                # Row 0: Platform
+                self.table.setItem(0, col, QTableWidgetItem(_PLATFORM_ICONS.get(platform, platform)))
+                
+                # Row 1: Title
+                title_item = QTableWidgetItem(title)
+                title_item.setToolTip(title)  # Show full title on hover
+                self.table.setItem(1, col, title_item)
+                
+                # Row 2: Price
+                price_item = QTableWidgetItem(price)
+                if is_best[col]:
+                    price_item.setBackground(_COLOR_BEST_BG)
+                    price_item.setText(f"⭐ {price} (최저가)")
+                self.table.setItem(2, col, price_item)
+                
+                # Row 3: Seller
+                self.table.setItem(3, col, QTableWidgetItem(get('seller', '-')))
+                
+                # Row 4: Location
+                self.table.setItem(4, col, QTableWidgetItem(get('location', '-')))
+                
+                # Row 5: Date (just the date part)
+                self.table.setItem(5, col, QTableWidgetItem(created[:10] if created else '-'))
+                
+                # Row 6: Status
+                self.table.setItem(6, col, QTableWidgetItem(_STATUS_MAP.get(status, status or '알수없음')))
+                
+                # Row 7: Link
+                link_item = QTableWidgetItem("🔗 열기")
+                link_item.setData(Qt.ItemDataRole.UserRole, get('url', ''))
+                self.table.setItem(_LINK_ROW, col, link_item)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
         
         # Style
         h_header = self.table.horizontalHeader()
@@ -230,42 +360,14 @@ class CompareDialog(QDialog):
         v_header = self.table.verticalHeader()
         if v_header is not None:
             v_header.setDefaultSectionSize(45)
-        self.table.setStyleSheet("""
-            QTableWidget {
-                background-color: #1e1e2e;
-                gridline-color: #45475a;
-                border: none;
-                border-radius: 8px;
-            }
-            QTableWidget::item {
-                padding: 8px;
-                color: #cdd6f4;
-            }
-            QTableWidget::item:selected {
-                background-color: #89b4fa;
-                color: #1e1e2e;
-            }
-            QHeaderView::section {
-                background-color: #181825;
-                color: #a6adc8;
-                padding: 8px;
-                border: none;
-                border-bottom: 2px solid #45475a;
-                font-weight: bold;
-            }
-        """)
+        self.table.setStyleSheet(_TABLE_STYLE)
         self.table.cellDoubleClicked.connect(self._on_cell_clicked)
         
         layout.addWidget(self.table)
         
         # Notes section
         notes_frame = QFrame()
-        notes_frame.setStyleSheet("""
-            QFrame {
-                background-color: #313244;
-                border-radius: 8px;
-            }
-        """)
+        notes_frame.setStyleSheet(_PANEL_FRAME_STYLE)
         notes_layout = QVBoxLayout(notes_frame)
         notes_layout.setContentsMargins(12, 12, 12, 12)
         
@@ -276,56 +378,44 @@ class CompareDialog(QDialog):
         self.notes_edit = QTextEdit()
         self.notes_edit.setPlaceholderText("비교하면서 메모할 내용을 입력하세요...")
         self.notes_edit.setMaximumHeight(80)
-        self.notes_edit.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e2e;
-                color: #cdd6f4;
-                border: 1px solid #45475a;
-                border-radius: 6px;
-                padding: 8px;
-            }
-        """)
+        self.notes_edit.setStyleSheet(_NOTES_EDIT_STYLE)
         notes_layout.addWidget(self.notes_edit)
         
         layout.addWidget(notes_frame)
     
     def _on_cell_clicked(self, row, col):
         """Open link when link row is clicked"""
-        if row == 7:  # Link row
+        if row == _LINK_ROW:
             item = self.table.item(row, col)
             if item:
                 url = item.data(Qt.ItemDataRole.UserRole)
                 if url:
                     QDesktopServices.openUrl(QUrl(url))
     
-    def _generate_comparison_text(self) -> str:
-        """Generate text summary of comparison"""
-        lines = ["📊 매물 비교 결과", "=" * 40, ""]
+    def _iter_comparison_text(self):
+        """Yield the comparison summary in chunks (joined, they form the full text)"""
+        yield "📊 매물 비교 결과\n" + "=" * 40 + "\n"
         
         for i, item in enumerate(self.listings):
-            platform_icons = {
-                'danggeun': '🥕 당근마켓',
-                'bunjang': '⚡ 번개장터',
-                'joonggonara': '🛒 중고나라'
-            }
-            
-            lines.append(f"[매물 {i+1}]")
-            lines.append(f"  플랫폼: {platform_icons.get(item.get('platform', ''), item.get('platform', ''))}")
-            lines.append(f"  제목: {item.get('title', '-')}")
-            lines.append(f"  가격: {item.get('price', '-')}")
-            lines.append(f"  판매자: {item.get('seller', '-')}")
-            lines.append(f"  지역: {item.get('location', '-')}")
-            lines.append(f"  링크: {item.get('url', '-')}")
-            lines.append("")
+            platform = item.get('platform', '')
+            yield (
+                f"\n[매물 {i+1}]\n"
+                f"  플랫폼: {_PLATFORM_ICONS.get(platform, platform)}\n"
+                f"  제목: {item.get('title', '-')}\n"
+                f"  가격: {item.get('price', '-')}\n"
+                f"  판매자: {item.get('seller', '-')}\n"
+                f"  지역: {item.get('location', '-')}\n"
+                f"  링크: {item.get('url', '-')}\n"
+            )
         
         # Add notes if any
         notes = self.notes_edit.toPlainText().strip()
         if notes:
-            lines.append("📝 메모:")
-            lines.append(notes)
-            lines.append("")
-        
-        return "\n".join(lines)
+            yield f"\n📝 메모:\n{notes}\n"
+    
+    def _generate_comparison_text(self) -> str:
+        """Generate text summary of comparison"""
+        return "".join(self._iter_comparison_text())
     
     def _copy_to_clipboard(self):
         """Copy comparison to clipboard"""
@@ -351,9 +441,8 @@ class CompareDialog(QDialog):
         
         if file_path:
             try:
-                text = self._generate_comparison_text()
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(text)
+                    f.writelines(self._iter_comparison_text())
                 QMessageBox.information(self, "저장 완료", f"📥 비교 결과가 저장되었습니다.\n\n{file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "오류", f"저장 중 오류가 발생했습니다:\n{str(e)}")
@@ -3,15 +3,175 @@
 Reusable modern UI components with animations and effects.
 """
 
+import heapq
+import html
+import itertools
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from weakref import ref
+
 from PyQt6.QtWidgets import (
     QFrame, QPushButton, QLabel, QWidget,
-    QVBoxLayout, QHBoxLayout, QGraphicsDropShadowEffect
+    QVBoxLayout, QHBoxLayout, QGraphicsOpacityEffect
+)
+from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer, QRectF
+from PyQt6.QtGui import QColor, QPainter, QPixmap
+from PyQt6 import sip
+
+
+# Space reserved around shadowed frames (via QSS margin) for the shadow to fall into
+_SHADOW_MARGIN = 10
+_SHADOW_CACHE: OrderedDict[tuple, QPixmap] = OrderedDict()
+_SHADOW_CACHE_MAX = 32
+
+# Stylesheet templates, filled with str.format by the widgets below
+_PULSING_DOT_QSS = """
+    color: {color}; 
+    font-size: 12pt; 
+    background: transparent;
+"""
+
+_STAT_CARD_QSS = """
+    QFrame#statCard {{ margin: {margin}px; }}
+    QFrame#statCard QLabel {{ background: transparent; }}
+    QFrame#statCard QLabel#statIcon {{ font-size: 20pt; }}
+    QFrame#statCard QLabel#statTitle {{
+        font-size: 11pt; 
+        color: #a6adc8; 
+    }}
+    QFrame#statCard QLabel#statValue {{
+        font-size: 28pt; 
+        font-weight: bold; 
+        color: {color};
+    }}
+"""
+
+_EMPTY_STATE_ICON_HTML = '<p align="center" style="font-size: 48pt; color: #6c7086;">{}</p>'
+_EMPTY_STATE_TITLE_HTML = (
+    '<p align="center" style="font-size: 16pt; font-weight: bold; color: #cdd6f4; margin-top: 16px;">{}</p>'
 )
-from PyQt6.QtCore import (
-    Qt, QPropertyAnimation, QEasingCurve, 
-    QTimer
+_EMPTY_STATE_MESSAGE_HTML = (
+    '<p align="center" style="font-size: 11pt; color: #6c7086; margin-top: 16px; line-height: 150%;">{}</p>'
 )
-from PyQt6.QtGui import QColor, QFont
+
+_TOAST_QSS = """
+    QFrame#toast {{
+        margin: {margin}px;
+        background-color: rgba(49, 50, 68, 0.95);
+        border: 1px solid {color};
+        border-left: 4px solid {color};
+        border-radius: 8px;
+        padding: 12px 16px;
+    }}
+"""
+
+
+def _shadow_pixmap(
+    width: int, height: int, blur: int, offset_y: int, alpha: int, radius: int, dpr: float
+) -> QPixmap:
+    """
+    Pre-rendered drop shadow for a frame of the given size.
+
+    Replaces QGraphicsDropShadowEffect, which re-blurs the whole widget offscreen
+    on every repaint. The shadow is rendered once per size/parameter set and
+    blitted from an LRU cache afterwards.
+    """
+    key = (width, height, blur, offset_y, alpha, radius, dpr)
+    pixmap = _SHADOW_CACHE.get(key)
+    if pixmap is not None:
+        _SHADOW_CACHE.move_to_end(key)
+        return pixmap
+    
+    pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    body = QRectF(
+        _SHADOW_MARGIN, _SHADOW_MARGIN + offset_y,
+        width - 2 * _SHADOW_MARGIN, height - 2 * _SHADOW_MARGIN
+    )
+    # Stack translucent rounded rects that grow outward: alpha falls off
+    # linearly with distance from the body, a cheap stand-in for a gaussian blur.
+    spread = max(1, min(blur // 2, _SHADOW_MARGIN))
+    painter.setBrush(QColor(0, 0, 0, max(1, alpha // spread)))
+    for i in range(spread, 0, -1):
+        painter.drawRoundedRect(body.adjusted(-i, -i, i, i), radius + i, radius + i)
+    # The stylesheet body and border are already painted when paintEvent runs,
+    # so punch the body out: only the margin ring may be shaded.
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Clear)
+    painter.setBrush(QColor(0, 0, 0, 255))
+    painter.drawRoundedRect(body.translated(0, -offset_y), radius, radius)
+    painter.end()
+    
+    _SHADOW_CACHE[key] = pixmap
+    if len(_SHADOW_CACHE) > _SHADOW_CACHE_MAX:
+        _SHADOW_CACHE.popitem(last=False)
+    return pixmap
+
+
+def _paint_shadow(widget: QWidget, blur: int, offset_y: int, alpha: int, radius: int):
+    """Blit the cached shadow into the margin ring around widget's stylesheet-drawn body"""
+    painter = QPainter(widget)
+    painter.drawPixmap(0, 0, _shadow_pixmap(
+        widget.width(), widget.height(), blur, offset_y, alpha, radius,
+        widget.devicePixelRatioF()
+    ))
+    painter.end()
+
+
+def pause_effects_while_scrolling(scroll_area, delay_ms: int = 150):
+    """
+    Disable the QGraphicsEffects of scroll_area's cards while it is moving and
+    restore them delay_ms after it stops. Pixmap-shadowed widgets are unaffected.
+    """
+    paused: list[QWidget] = []
+    resume_timer = QTimer(scroll_area)
+    resume_timer.setSingleShot(True)
+    resume_timer.setInterval(delay_ms)
+    
+    def _resume():
+        for widget in paused:
+            if not sip.isdeleted(widget):
+                effect = widget.graphicsEffect()
+                if effect is not None:
+                    effect.setEnabled(True)
+        paused.clear()
+    
+    def _on_scroll(_value):
+        if not resume_timer.isActive():
+            content = scroll_area.widget()
+            if content is not None:
+                for widget in content.findChildren(
+                    QWidget, options=Qt.FindChildOption.FindDirectChildrenOnly
+                ):
+                    effect = widget.graphicsEffect()
+                    if effect is not None and effect.isEnabled():
+                        effect.setEnabled(False)
+                        paused.append(widget)
+        resume_timer.start()
+    
+    resume_timer.timeout.connect(_resume)
+    scroll_area.verticalScrollBar().valueChanged.connect(_on_scroll)
+
+
+@lru_cache(maxsize=64)
+def _lighten_color(hex_color: str) -> str:
+    """Lighten a hex color"""
+    # Simple lightening by blending with white
+    r = int(hex_color[1:3], 16)
+    g = int(hex_color[3:5], 16)
+    b = int(hex_color[5:7], 16)
+    
+    factor = 0.3
+    r = int(r + (255 - r) * factor)
+    g = int(g + (255 - g) * factor)
+    b = int(b + (255 - b) * factor)
+    
+    return f"#{r:02x}{g:02x}{b:02x}"
 
 
 class GlassCard(QFrame):
@@ -22,17 +182,19 @@ class GlassCard(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("glassCard")
-        self._setup_shadow()
         self._base_shadow_blur = 15
         self._hover_shadow_blur = 25
+        self._setup_shadow()
         
     def _setup_shadow(self):
-        """Setup drop shadow effect"""
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(15)
-        self.shadow.setColor(QColor(0, 0, 0, 60))
-        self.shadow.setOffset(0, 4)
-        self.setGraphicsEffect(self.shadow)
+        """Setup drop shadow (painted from a cached pixmap)"""
+        self.setStyleSheet(f"QFrame#glassCard {{ margin: {_SHADOW_MARGIN}px; }}")
+        self._shadow_blur = self._base_shadow_blur
+        self._shadow_offset = 4
+    
+    def paintEvent(self, a0):
+        _paint_shadow(self, self._shadow_blur, self._shadow_offset, 60, 16)
+        super().paintEvent(a0)
     
     def enterEvent(self, event):
         """Animate shadow on hover"""
@@ -46,9 +208,10 @@ class GlassCard(QFrame):
     
     def _animate_shadow(self, blur: int, offset_y: int):
         """Animate shadow properties"""
-        # Simple animation by directly setting (for performance)
-        self.shadow.setBlurRadius(blur)
-        self.shadow.setOffset(0, offset_y)
+        # Swap to the other cached shadow variant (no live effect to mutate)
+        self._shadow_blur = blur
+        self._shadow_offset = offset_y
+        self.update()
 
 
 class AnimatedButton(QPushButton):
@@ -58,21 +221,6 @@ class AnimatedButton(QPushButton):
     
     def __init__(self, text: str = "", parent=None):
         super().__init__(text, parent)
-        self._setup_animation()
-    
-    def _setup_animation(self):
-        """Setup press animation"""
-        self.press_anim = QPropertyAnimation(self, b"geometry")
-        self.press_anim.setDuration(100)
-        self.press_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-    
-    def mousePressEvent(self, e):
-        """Slight scale down on press"""
-        super().mousePressEvent(e)
-    
-    def mouseReleaseEvent(self, e):
-        """Scale back up on release"""
-        super().mouseReleaseEvent(e)
 
 
 class PulsingDot(QLabel):
@@ -83,46 +231,42 @@ class PulsingDot(QLabel):
     def __init__(self, color: str = "#a6e3a1", parent=None):
         super().__init__("●", parent)
         self._color = color
-        self._is_pulsing = False
-        self._pulse_timer = QTimer(self)
-        self._pulse_timer.timeout.connect(self._pulse_step)
-        self._pulse_state = 0
+        self._setup_animation()
         self._update_style()
     
+    def _setup_animation(self):
+        """Pulse via the opacity effect so ticks never touch the stylesheet"""
+        self._opacity_effect = QGraphicsOpacityEffect(self)
+        self._opacity_effect.setOpacity(1.0)
+        self.setGraphicsEffect(self._opacity_effect)
+        
+        self._anim = QPropertyAnimation(self._opacity_effect, b"opacity", self)
+        self._anim.setDuration(1000)
+        self._anim.setKeyValueAt(0.0, 1.0)
+        self._anim.setKeyValueAt(0.5, 0.4)
+        self._anim.setKeyValueAt(1.0, 1.0)
+        self._anim.setEasingCurve(QEasingCurve.Type.InOutSine)
+        self._anim.setLoopCount(-1)
+    
     def _update_style(self):
-        self.setStyleSheet(f"""
-            color: {self._color}; 
-            font-size: 12pt; 
-            background: transparent;
-        """)
+        self.setStyleSheet(_PULSING_DOT_QSS.format(color=self._color))
     
     def set_color(self, color: str):
         """Set dot color"""
+        if color == self._color:
+            return
         self._color = color
         self._update_style()
     
     def start_pulsing(self):
         """Start pulse animation"""
-        if not self._is_pulsing:
-            self._is_pulsing = True
-            self._pulse_timer.start(500)  # Toggle every 500ms
+        if self._anim.state() != QPropertyAnimation.State.Running:
+            self._anim.start()
     
     def stop_pulsing(self):
         """Stop pulse animation"""
-        self._is_pulsing = False
-        self._pulse_timer.stop()
-        self._update_style()
-    
-    def _pulse_step(self):
-        """Toggle opacity for pulse effect"""
-        self._pulse_state = 1 - self._pulse_state
-        opacity = "1.0" if self._pulse_state else "0.4"
-        self.setStyleSheet(f"""
-            color: {self._color}; 
-            font-size: 12pt; 
-            background: transparent;
-            opacity: {opacity};
-        """)
+        self._anim.stop()
+        self._opacity_effect.setOpacity(1.0)
 
 
 class StatCard(QFrame):
@@ -141,8 +285,9 @@ class StatCard(QFrame):
         super().__init__(parent)
         self.setObjectName("statCard")
         self._color = color
+        self._last_value = value
         self._setup_ui(title, value, icon)
-        self._setup_shadow()
+        self._update_style()
     
     def _setup_ui(self, title: str, value: str, icon: str):
         layout = QVBoxLayout(self)
@@ -153,15 +298,11 @@ class StatCard(QFrame):
         header = QHBoxLayout()
         
         icon_label = QLabel(icon)
-        icon_label.setStyleSheet("font-size: 20pt; background: transparent;")
+        icon_label.setObjectName("statIcon")
         header.addWidget(icon_label)
         
         title_label = QLabel(title)
-        title_label.setStyleSheet(f"""
-            font-size: 11pt; 
-            color: #a6adc8; 
-            background: transparent;
-        """)
+        title_label.setObjectName("statTitle")
         header.addWidget(title_label)
         header.addStretch()
         
@@ -169,23 +310,23 @@ class StatCard(QFrame):
         
         # Value
         self.value_label = QLabel(value)
-        self.value_label.setStyleSheet(f"""
-            font-size: 28pt; 
-            font-weight: bold; 
-            color: {self._color};
-            background: transparent;
-        """)
+        self.value_label.setObjectName("statValue")
         layout.addWidget(self.value_label)
     
-    def _setup_shadow(self):
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 40))
-        shadow.setOffset(0, 4)
-        self.setGraphicsEffect(shadow)
+    def _update_style(self):
+        # One sheet on the card styles all three labels in a single polish pass
+        self.setStyleSheet(_STAT_CARD_QSS.format(margin=_SHADOW_MARGIN, color=self._color))
+    
+    def paintEvent(self, a0):
+        _paint_shadow(self, 20, 4, 40, 16)
+        super().paintEvent(a0)
     
     def set_value(self, value: str):
         """Update the displayed value"""
+        # Refresh loops mostly re-send the same value; skip the relayout/repaint
+        if value == self._last_value:
+            return
+        self._last_value = value
         self.value_label.setText(value)
 
 
@@ -200,40 +341,55 @@ class PlatformBadge(QLabel):
         'joonggonara': {'color': '#00C853', 'emoji': '🛒', 'name': '중고나라'},
     }
     
+    DEFAULT_COLOR = '#89b4fa'
+    _LABELS: dict[str, str]  # platform -> label, filled by _build_styles
+    
     def __init__(self, platform: str, parent=None):
         super().__init__(parent)
+        self.setObjectName("platformBadge")
         self._setup(platform)
     
     def _setup(self, platform: str):
-        info = self.PLATFORMS.get(platform, {'color': '#89b4fa', 'emoji': '🔍', 'name': platform})
-        
-        self.setText(f"{info['emoji']} {info['name']}")
+        label = self._LABELS.get(platform)
+        self.setText(label if label is not None else f"🔍 {platform}")
         
-        # Create gradient-like effect with CSS
-        base_color = info['color']
-        self.setStyleSheet(f"""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                stop:0 {base_color}, stop:1 {self._lighten(base_color)});
-            color: white;
-            padding: 4px 10px;
-            border-radius: 12px;
-            font-size: 9pt;
-            font-weight: bold;
-        """)
-    
-    def _lighten(self, hex_color: str) -> str:
-        """Lighten a hex color"""
-        # Simple lightening by blending with white
-        r = int(hex_color[1:3], 16)
-        g = int(hex_color[3:5], 16)
-        b = int(hex_color[5:7], 16)
-        
-        factor = 0.3
-        r = int(r + (255 - r) * factor)
-        g = int(g + (255 - g) * factor)
-        b = int(b + (255 - b) * factor)
-        
-        return f"#{r:02x}{g:02x}{b:02x}"
+        # Colours come from the shared BADGE_QSS via the property selector
+        self.setProperty("platform", platform if label is not None else "")
+    
+    @classmethod
+    def stylesheet(cls) -> str:
+        """QSS rules for every known platform, parsed once as part of the theme"""
+        rules = [f"""
+            QLabel#platformBadge {{
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+                    stop:0 {cls.DEFAULT_COLOR}, stop:1 {_lighten_color(cls.DEFAULT_COLOR)});
+                color: white;
+                padding: 4px 10px;
+                border-radius: 12px;
+                font-size: 9pt;
+                font-weight: bold;
+            }}
+        """]
+        rules.extend(info['qss'] for info in cls.PLATFORMS.values())
+        return "".join(rules)
+    
+    @classmethod
+    def _build_styles(cls):
+        """Precompute label text and QSS rule for every known platform"""
+        cls._LABELS = {}
+        for key, info in cls.PLATFORMS.items():
+            info['color_light'] = _lighten_color(info['color'])
+            info['label'] = f"{info['emoji']} {info['name']}"
+            cls._LABELS[key] = info['label']
+            info['qss'] = f"""
+            QLabel#platformBadge[platform="{key}"] {{
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+                    stop:0 {info['color']}, stop:1 {info['color_light']});
+            }}
+        """
+
+
+PlatformBadge._build_styles()
 
 
 class SectionHeader(QWidget):
@@ -287,39 +443,13 @@ class EmptyState(QWidget):
         layout.setSpacing(16)
         layout.setContentsMargins(40, 60, 40, 60)
         
-        # Icon
-        icon_label = QLabel(icon)
-        icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        icon_label.setStyleSheet("""
-            font-size: 48pt;
-            background: transparent;
-            color: #6c7086;
-        """)
-        layout.addWidget(icon_label)
-        
-        # Title
-        title_label = QLabel(title)
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            font-size: 16pt;
-            font-weight: bold;
-            color: #cdd6f4;
-            background: transparent;
-        """)
-        layout.addWidget(title_label)
-        
-        # Message
-        if message:
-            msg_label = QLabel(message)
-            msg_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            msg_label.setWordWrap(True)
-            msg_label.setStyleSheet("""
-                font-size: 11pt;
-                color: #6c7086;
-                background: transparent;
-                line-height: 1.5;
-            """)
-            layout.addWidget(msg_label)
+        # Icon, title and message rendered by one rich-text label
+        content_label = QLabel(self._content_html(icon, title, message))
+        content_label.setTextFormat(Qt.TextFormat.RichText)
+        content_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        content_label.setWordWrap(True)
+        content_label.setStyleSheet("background: transparent;")
+        layout.addWidget(content_label)
         
         # Action button
         if action_text:
@@ -341,6 +471,16 @@ class EmptyState(QWidget):
             """)
             layout.addWidget(self.action_btn, alignment=Qt.AlignmentFlag.AlignCenter)
     
+    @staticmethod
+    def _content_html(icon: str, title: str, message: str) -> str:
+        parts = [
+            _EMPTY_STATE_ICON_HTML.format(html.escape(icon)),
+            _EMPTY_STATE_TITLE_HTML.format(html.escape(title)),
+        ]
+        if message:
+            parts.append(_EMPTY_STATE_MESSAGE_HTML.format(html.escape(message)))
+        return "".join(parts)
+    
     def set_action(self, callback):
         """Set callback for action button"""
         self.action_callback = callback
@@ -348,9 +488,17 @@ class EmptyState(QWidget):
             self.action_btn.clicked.connect(callback)
 
 
+# Closed toasts are kept here and repopulated by Toast.acquire
+_TOAST_POOL: list["Toast"] = []
+_TOAST_POOL_MAX = 4
+
+
 class Toast(QFrame):
     """
     Toast notification popup.
+    
+    Prefer Toast.acquire() over the constructor: closed toasts return to a
+    small pool and are reused instead of rebuilding the widget tree.
     """
     
     TYPES = {
@@ -360,37 +508,48 @@ class Toast(QFrame):
         'info': {'color': '#89b4fa', 'icon': 'ℹ️'},
     }
     
+    # One timer closes every toast: a min-heap of (deadline, token, weakref)
+    _SCHED_TIMER: QTimer | None = None
+    _SCHED_HEAP: list[tuple[float, int, "ref[Toast]"]] = []
+    _SCHED_SEQ = itertools.count()
+    
     def __init__(self, message: str, toast_type: str = "info", duration: int = 3000, parent=None):
         super().__init__(parent)
-        self.duration = duration
-        self._setup_ui(message, toast_type)
-        self._setup_animation()
-    
-    def _setup_ui(self, message: str, toast_type: str):
-        type_info = self.TYPES.get(toast_type, self.TYPES['info'])
-        
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: rgba(49, 50, 68, 0.95);
-                border: 1px solid {type_info['color']};
-                border-left: 4px solid {type_info['color']};
-                border-radius: 8px;
-                padding: 12px 16px;
-            }}
-        """)
-        
+        self.setObjectName("toast")
+        # Frameless + translucent: the margin around the body stays see-through,
+        # so the pre-rendered shadow is alpha-blended by the compositor
+        self.setWindowFlag(Qt.WindowType.FramelessWindowHint)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self._show_token: int | None = None
+        self._setup_ui()
+        self._populate(message, toast_type, duration)
+    
+    @classmethod
+    def acquire(cls, message: str, toast_type: str = "info", duration: int = 3000, parent=None) -> "Toast":
+        """Return a pooled toast populated with message, or a new one if the pool is empty"""
+        while _TOAST_POOL:
+            toast = _TOAST_POOL.pop()
+            if sip.isdeleted(toast):
+                continue  # Its previous parent was destroyed
+            if toast.parent() is not parent:
+                toast.setParent(parent, toast.windowFlags())
+            toast._populate(message, toast_type, duration)
+            return toast
+        return cls(message, toast_type, duration, parent)
+    
+    def _setup_ui(self):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(12, 8, 12, 8)
         layout.setSpacing(12)
         
-        icon_label = QLabel(type_info['icon'])
-        icon_label.setStyleSheet("font-size: 16pt; background: transparent;")
-        layout.addWidget(icon_label)
+        self.icon_label = QLabel()
+        self.icon_label.setStyleSheet("font-size: 16pt; background: transparent;")
+        layout.addWidget(self.icon_label)
         
-        msg_label = QLabel(message)
-        msg_label.setStyleSheet(f"color: #cdd6f4; font-size: 10pt; background: transparent;")
-        msg_label.setWordWrap(True)
-        layout.addWidget(msg_label, 1)
+        self.msg_label = QLabel()
+        self.msg_label.setStyleSheet(f"color: #cdd6f4; font-size: 10pt; background: transparent;")
+        self.msg_label.setWordWrap(True)
+        layout.addWidget(self.msg_label, 1)
         
         close_btn = QPushButton("×")
         close_btn.setStyleSheet("""
@@ -406,22 +565,61 @@ class Toast(QFrame):
         """)
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
-        
-        # Setup shadow
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 80))
-        shadow.setOffset(0, 4)
-        self.setGraphicsEffect(shadow)
     
-    def _setup_animation(self):
-        self.fade_timer = QTimer(self)
-        self.fade_timer.setSingleShot(True)
-        self.fade_timer.timeout.connect(self.close)
+    def _populate(self, message: str, toast_type: str, duration: int):
+        """Fill in the per-notification content"""
+        type_info = self.TYPES.get(toast_type, self.TYPES['info'])
+        self.duration = duration
+        self.icon_label.setText(type_info['icon'])
+        self.msg_label.setText(message)
+        self.setStyleSheet(_TOAST_QSS.format(margin=_SHADOW_MARGIN, color=type_info['color']))
+    
+    def _reset(self):
+        self._show_token = None  # Orphans this toast's pending heap entry
+        self.msg_label.clear()
+    
+    def paintEvent(self, a0):
+        _paint_shadow(self, 20, 4, 80, 8)
+        super().paintEvent(a0)
     
     def show(self):
         super().show()
-        self.fade_timer.start(self.duration)
+        # A fresh token per show keeps a pooled toast from being closed by
+        # the deadline of its previous use
+        self._show_token = next(Toast._SCHED_SEQ)
+        deadline = time.monotonic() + self.duration / 1000
+        heapq.heappush(Toast._SCHED_HEAP, (deadline, self._show_token, ref(self)))
+        Toast._schedule_next()
+    
+    @classmethod
+    def _schedule_next(cls):
+        """Arm the shared timer for the earliest pending deadline"""
+        if cls._SCHED_TIMER is None:
+            cls._SCHED_TIMER = QTimer()
+            cls._SCHED_TIMER.setSingleShot(True)
+            cls._SCHED_TIMER.timeout.connect(cls._close_expired)
+        if not cls._SCHED_HEAP:
+            cls._SCHED_TIMER.stop()
+            return
+        delay = cls._SCHED_HEAP[0][0] - time.monotonic()
+        cls._SCHED_TIMER.start(max(0, int(delay * 1000) + 1))
+    
+    @classmethod
+    def _close_expired(cls):
+        now = time.monotonic()
+        heap = cls._SCHED_HEAP
+        while heap and heap[0][0] <= now:
+            _, token, toast_ref = heapq.heappop(heap)
+            toast = toast_ref()
+            if toast is not None and not sip.isdeleted(toast) and toast._show_token == token:
+                toast.close()
+        cls._schedule_next()
+    
+    def closeEvent(self, a0):
+        self._reset()
+        super().closeEvent(a0)
+        if len(_TOAST_POOL) < _TOAST_POOL_MAX and self not in _TOAST_POOL:
+            _TOAST_POOL.append(self)
 
 
 class StatusBadge(QLabel):
@@ -436,19 +634,62 @@ class StatusBadge(QLabel):
         'unknown': {'color': '#6c7086', 'bg': 'rgba(108, 112, 134, 0.2)', 'text': '알수없음', 'icon': '⚪'},
     }
     
+    _LOOKUP: dict[str, tuple[str, str]]  # status -> (key, label), filled by _build_styles
+    
     def __init__(self, status: str = 'for_sale', parent=None):
         super().__init__(parent)
+        self.setObjectName("statusBadge")
+        self._status = None
         self.set_status(status)
     
     def set_status(self, status: str):
-        info = self.STATUSES.get(status, self.STATUSES['unknown'])
-        self.setText(f"{info['icon']} {info['text']}")
-        self.setStyleSheet(f"""
-            background-color: {info['bg']};
-            color: {info['color']};
-            padding: 4px 10px;
-            border-radius: 10px;
-            font-size: 9pt;
-            font-weight: bold;
-        """)
+        # Flat (key, label) lookup; unknown values collapse onto 'unknown'
+        status, label = self._LOOKUP.get(status) or self._LOOKUP['unknown']
+        if status == self._status:
+            return
+        self._status = status
+        self.setText(label)
+        
+        # Re-polish so the shared BADGE_QSS picks up the new property value
+        self.setProperty("status", status)
+        style = self.style()
+        if style is not None:
+            style.unpolish(self)
+            style.polish(self)
+    
+    @classmethod
+    def stylesheet(cls) -> str:
+        """QSS rules for every known status, parsed once as part of the theme"""
+        rules = ["""
+            QLabel#statusBadge {
+                padding: 4px 10px;
+                border-radius: 10px;
+                font-size: 9pt;
+                font-weight: bold;
+            }
+        """]
+        rules.extend(info['qss'] for info in cls.STATUSES.values())
+        return "".join(rules)
+    
+    @classmethod
+    def _build_styles(cls):
+        """Precompute label text and QSS rule for every known status"""
+        cls._LOOKUP = {}
+        for key, info in cls.STATUSES.items():
+            info['label'] = f"{info['icon']} {info['text']}"
+            cls._LOOKUP[key] = (key, info['label'])
+            info['qss'] = f"""
+            QLabel#statusBadge[status="{key}"] {{
+                background-color: {info['bg']};
+                color: {info['color']};
+            }}
+        """
+
+
+StatusBadge._build_styles()
+
+
+# Badge rules appended to the application theme, so Qt parses them once
+# instead of once per badge instance.
+BADGE_QSS = PlatformBadge.stylesheet() + StatusBadge.stylesheet()
 
@@ -2,14 +2,42 @@
 """Favorites management widget"""
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QHeaderView, QPushButton, QLabel, QMessageBox, QMenu, QDialog, 
     QFormLayout, QLineEdit, QSpinBox, QTextEdit, QFrame
 )
-from PyQt6.QtCore import Qt, QUrl, pyqtSignal
-from PyQt6.QtGui import QDesktopServices, QAction, QColor, QFont
+from PyQt6.QtCore import Qt, QUrl, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QDesktopServices, QAction, QBrush, QColor, QFont
 from db import DatabaseManager
 
+_FAVORITES_TABLE_QSS = """
+    QTableView#favoritesTable {
+        background-color: #1e1e2e;
+        alternate-background-color: #313244;
+        gridline-color: #45475a;
+        border: none;
+        border-radius: 8px;
+    }
+    QTableView#favoritesTable::item {
+        padding: 8px;
+    }
+    QTableView#favoritesTable::item:hover {
+        background-color: #45475a;
+    }
+    QTableView#favoritesTable::item:selected {
+        background-color: #89b4fa;
+        color: #1e1e2e;
+    }
+    QTableView#favoritesTable QHeaderView::section {
+        background-color: #181825;
+        color: #a6adc8;
+        padding: 8px;
+        border: none;
+        border-bottom: 2px solid #45475a;
+    }
+"""
+
+
 class FavoritesEditDialog(QDialog):
     """Dialog to edit favorite notes and target price"""
     def __init__(self, notes: str, target_price: int | None, parent=None):
@@ -77,6 +105,83 @@ class FavoritesEditDialog(QDialog):
         }
 
 
+class FavoritesModel(QAbstractTableModel):
+    """Table model over the favorite dicts returned by ``db.get_favorites()``.
+
+    Cells are formatted on demand, so the view only pays for visible rows.
+    """
+
+    HEADERS = ("플랫폼", "제목", "가격", "목표가", "메모", "등록일")
+    TITLE_COLUMN = 1
+    _TARGET_REACHED_BRUSH = QBrush(QColor("#a6e3a1"))  # Price at/below target
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[dict] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return item['platform']
+            if col == 1:
+                return item['title']
+            if col == 2:
+                return item['price']
+            if col == 3:
+                tp = item.get('target_price')
+                return f"{tp:,}원" if tp else "-"
+            if col == 4:
+                return item.get('notes') or ''
+            if col == 5:
+                return (item.get('fav_added_at') or '')[:16]
+        elif role == Qt.ItemDataRole.ForegroundRole and col == 2:
+            tp = item.get('target_price')
+            price = item.get('price_numeric')
+            if tp and price and price <= tp:
+                return self._TARGET_REACHED_BRUSH
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    # Price and target price sort numerically; everything else by its text.
+    _SORT_KEYS = (
+        lambda r: r['platform'] or '',
+        lambda r: r['title'] or '',
+        lambda r: r.get('price_numeric') or 0,
+        lambda r: r.get('target_price') or 0,
+        lambda r: r.get('notes') or '',
+        lambda r: r.get('fav_added_at') or '',
+    )
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if not 0 <= column < len(self._SORT_KEYS):
+            return
+        self.layoutAboutToBeChanged.emit()
+        self._rows.sort(
+            key=self._SORT_KEYS[column],
+            reverse=order == Qt.SortOrder.DescendingOrder,
+        )
+        self.layoutChanged.emit()
+
+    def set_rows(self, rows: list[dict]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+
 class FavoritesWidget(QWidget):
     """Widget to display and manage favorites"""
     
@@ -84,12 +189,14 @@ class FavoritesWidget(QWidget):
         super().__init__(parent)
         self.engine = engine
         self.db = engine.db
+        self._last_fav_version = None
         self.setup_ui()
 
     def set_engine(self, engine):
         """Set or update the monitor engine (and DB reference)."""
         self.engine = engine
         self.db = engine.db if engine else None
+        self._last_fav_version = None
         self.refresh_list()
         
     def setup_ui(self):
@@ -112,47 +219,24 @@ class FavoritesWidget(QWidget):
         layout.addLayout(header_layout)
         
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["플랫폼", "제목", "가격", "목표가", "메모", "등록일"])
+        self._model = FavoritesModel(self)
+        self.table = QTableView()
+        self.table.setModel(self._model)
         h_header = self.table.horizontalHeader()
         if h_header is not None:
-            h_header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+            h_header.setSectionResizeMode(FavoritesModel.TITLE_COLUMN, QHeaderView.ResizeMode.Stretch)
+            h_header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         
         # Table style
         self.table.setAlternatingRowColors(True)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         v_header = self.table.verticalHeader()
         if v_header is not None:
             v_header.setVisible(False)
         self.table.setSortingEnabled(True)  # Enable column sorting
-        self.table.setStyleSheet("""
-            QTableWidget {
-                background-color: #1e1e2e;
-                alternate-background-color: #313244;
-                gridline-color: #45475a;
-                border: none;
-                border-radius: 8px;
-            }
-            QTableWidget::item {
-                padding: 8px;
-            }
-            QTableWidget::item:hover {
-                background-color: #45475a;
-            }
-            QTableWidget::item:selected {
-                background-color: #89b4fa;
-                color: #1e1e2e;
-            }
-            QHeaderView::section {
-                background-color: #181825;
-                color: #a6adc8;
-                padding: 8px;
-                border: none;
-                border-bottom: 2px solid #45475a;
-            }
-        """)
+        self.table.setObjectName("favoritesTable")
+        self.table.setStyleSheet(_FAVORITES_TABLE_QSS)
         
         layout.addWidget(self.table)
         
@@ -170,18 +254,29 @@ class FavoritesWidget(QWidget):
         # Context menu
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
-        self.table.cellDoubleClicked.connect(self.on_double_click)
+        self.table.doubleClicked.connect(self.on_double_click)
         
         self.refresh_list()
         
     def refresh_list(self):
         if self.db is None:
-            self.table.setRowCount(0)
+            self._model.set_rows([])
+            self._last_fav_version = None
             self.table.hide()
             self.empty_state.show()
             return
+        # Nothing committed since the last load: keep the current rows
+        version = self.db.favorites_version()
+        if version == self._last_fav_version:
+            return
         favorites = self.db.get_favorites()
-        self.table.setRowCount(len(favorites))
+        self._last_fav_version = version
+        self._model.set_rows(favorites)
+        
+        # Re-apply the user's column sort to the fresh rows
+        h_header = self.table.horizontalHeader()
+        if h_header is not None and h_header.sortIndicatorSection() >= 0:
+            self._model.sort(h_header.sortIndicatorSection(), h_header.sortIndicatorOrder())
         
         # Show/hide empty state
         if not favorites:
@@ -190,46 +285,21 @@ class FavoritesWidget(QWidget):
         else:
             self.empty_state.hide()
             self.table.show()
-        
-        for row, item in enumerate(favorites):
-            # Platform
-            self.table.setItem(row, 0, QTableWidgetItem(item['platform']))
             
-            # Title
-            title_item = QTableWidgetItem(item['title'])
-            title_item.setData(Qt.ItemDataRole.UserRole, item['url'])
-            title_item.setData(Qt.ItemDataRole.UserRole + 1, item['listing_id'])
-            self.table.setItem(row, 1, title_item)
-            
-            # Price
-            price_item = QTableWidgetItem(item['price'])
-            if item.get('target_price') and item.get('price_numeric'):
-                if item['price_numeric'] <= item['target_price']:
-                     price_item.setForeground(QColor("#a6e3a1")) # Green if reached target
-            self.table.setItem(row, 2, price_item)
-            
-            # Target Price
-            tp = item.get('target_price')
-            tp_text = f"{tp:,}원" if tp else "-"
-            self.table.setItem(row, 3, QTableWidgetItem(tp_text))
-            
-            # Notes
-            self.table.setItem(row, 4, QTableWidgetItem(item.get('notes', '')))
-            
-            # Added At
-            date_str = item.get('fav_added_at', '')[:16]
-            self.table.setItem(row, 5, QTableWidgetItem(date_str))
+    def _favorite_at(self, row) -> dict | None:
+        rows = self._model._rows
+        return rows[row] if 0 <= row < len(rows) else None
             
     def open_link(self, row):
-        item = self.table.item(row, 1)
+        item = self._favorite_at(row)
         if item:
-            url = item.data(Qt.ItemDataRole.UserRole)
+            url = item.get('url')
             
             # Check confirmation setting
             if hasattr(self.engine, 'settings') and self.engine.settings.settings.confirm_link_open:
                 confirm = QMessageBox.question(
                     self, "링크 열기",
-                    f"다음 상품 페이지로 이동하시겠습니까?\n{item.text()}",
+                    f"다음 상품 페이지로 이동하시겠습니까?\n{item['title']}",
                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
                 )
                 if confirm != QMessageBox.StandardButton.Yes:
@@ -238,11 +308,11 @@ class FavoritesWidget(QWidget):
             if url is not None:
                 QDesktopServices.openUrl(QUrl(str(url)))
             
-    def on_double_click(self, row, col):
-        if col == 1: # Title -> Open Link
-            self.open_link(row)
+    def on_double_click(self, index):
+        if index.column() == FavoritesModel.TITLE_COLUMN: # Title -> Open Link
+            self.open_link(index.row())
         else: # Edit
-            self.edit_favorite(row)
+            self.edit_favorite(index.row())
             
     def show_context_menu(self, pos):
         row = self.table.rowAt(pos.y())
@@ -267,43 +337,42 @@ class FavoritesWidget(QWidget):
             self.delete_favorite(row)
             
     def edit_favorite(self, row):
-        title_item = self.table.item(row, 1)
-        if title_item is None:
-            return
-        listing_id = title_item.data(Qt.ItemDataRole.UserRole + 1)
-        if listing_id is None:
+        item = self._favorite_at(row)
+        if item is None:
             return
         
-        # Get current values
-        tp_item = self.table.item(row, 3)
-        notes_item = self.table.item(row, 4)
-        tp_text = tp_item.text().replace("원", "").replace(",", "").replace("-", "") if tp_item else ""
-        target_price = int(tp_text) if tp_text else None
-        notes = notes_item.text() if notes_item else ""
+        # Current values come straight from the row, no need to parse cell text
+        target_price = item.get('target_price') or None
+        notes = item.get('notes') or ""
         
         dialog = FavoritesEditDialog(notes, target_price, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_data()
             if self.db is not None:
-                self.db.update_favorite(int(listing_id), data['notes'], data['target_price'])
+                self.db.update_favorite(int(item['id']), data['notes'], data['target_price'])
                 self.refresh_list()
             
     def delete_favorite(self, row):
-        title_item = self.table.item(row, 1)
-        if title_item is None:
+        # Delete every selected row when the clicked row is part of the selection
+        selection = self.table.selectionModel()
+        rows = sorted({index.row() for index in selection.selectedRows()}) if selection else []
+        if row not in rows:
+            rows = [row]
+        items = [item for item in map(self._favorite_at, rows) if item is not None]
+        if not items:
             return
-        listing_id = title_item.data(Qt.ItemDataRole.UserRole + 1)
-        if listing_id is None:
-            return
-        title = title_item.text()
         
+        if len(items) == 1:
+            prompt = f"'{items[0]['title']}'을(를) 즐겨찾기에서 삭제하시겠습니까?"
+        else:
+            prompt = f"선택한 {len(items)}개 항목을 즐겨찾기에서 삭제하시겠습니까?"
         confirm = QMessageBox.question(
             self, "삭제 확인", 
-            f"'{title}'을(를) 즐겨찾기에서 삭제하시겠습니까?",
+            prompt,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         
         if confirm == QMessageBox.StandardButton.Yes:
             if self.db is not None:
-                self.db.remove_favorite(int(listing_id))
+                self.db.remove_favorites(item['id'] for item in items)
                 self.refresh_list()
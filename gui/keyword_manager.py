@@ -8,9 +8,99 @@ from PyQt6.QtWidgets import (
     QScrollArea, QGridLayout, QSizePolicy, QGraphicsDropShadowEffect,
     QInputDialog
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QIcon, QFont, QColor
+from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, QRectF
+from PyQt6.QtGui import QIcon, QFont, QColor, QFontMetrics, QLinearGradient, QPainter, QPixmap
+from functools import lru_cache
 from models import SearchKeyword, KeywordPreset
+from gui.components import pause_effects_while_scrolling
+
+
+# Platform badge colors and emoji: (base, light, emoji)
+_PLATFORM_BADGES = {
+    'danggeun': ('#FF6F00', '#FF9800', '🥕'),
+    'bunjang': ('#7B68EE', '#9575CD', '⚡'),
+    'joonggonara': ('#00C853', '#69F0AE', '🛒'),
+}
+_DEFAULT_BADGE = ('#89b4fa', '#b4befe', '📦')
+
+
+@lru_cache(maxsize=256)
+def _price_range_text(min_price: int | None, max_price: int | None) -> str:
+    min_str = format(min_price, ",") if min_price else "0"
+    max_str = format(max_price, ",") if max_price else "∞"
+    return "💰 %s ~ %s원" % (min_str, max_str)
+
+
+# Rendered badge per (platform, device pixel ratio), shared by every card
+_BADGE_PIXMAPS: dict[tuple[str, float], QPixmap] = {}
+
+
+def _badge_pixmap(platform: str, dpr: float) -> QPixmap:
+    """Gradient pill with the platform emoji, painted once and reused by all cards."""
+    key = (platform, dpr)
+    pixmap = _BADGE_PIXMAPS.get(key)
+    if pixmap is not None:
+        return pixmap
+    
+    base_color, light_color, emoji = _PLATFORM_BADGES.get(platform, _DEFAULT_BADGE)
+    font = QFont()
+    font.setPointSize(12)
+    metrics = QFontMetrics(font)
+    # Same box as the old QSS badge: 5px/10px padding, 12px corner radius
+    width = metrics.horizontalAdvance(emoji) + 20
+    height = metrics.height() + 10
+    
+    pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    gradient = QLinearGradient(0, 0, width, 0)
+    gradient.setColorAt(0, QColor(base_color))
+    gradient.setColorAt(1, QColor(light_color))
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(gradient)
+    rect = QRectF(0, 0, width, height)
+    painter.drawRoundedRect(rect, 12, 12)
+    painter.setFont(font)
+    painter.setPen(QColor("white"))
+    painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, emoji)
+    painter.end()
+    
+    _BADGE_PIXMAPS[key] = pixmap
+    return pixmap
+
+
+# Every card and label rule in one sheet, set once on the cards container
+# so all cards share a single parsed style tree. Selection is a dynamic
+# "selected" property; labels match on "role".
+KEYWORD_CARDS_QSS = """
+    QFrame#keywordCard {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
+            stop:0 rgba(30, 30, 46, 0.9), stop:1 rgba(49, 50, 68, 0.7));
+        border: 1px solid rgba(69, 71, 90, 0.5);
+        border-radius: 16px;
+    }
+    QFrame#keywordCard[selected="false"]:hover {
+        border: 1px solid rgba(137, 180, 250, 0.5);
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
+            stop:0 rgba(37, 37, 53, 0.95), stop:1 rgba(49, 50, 68, 0.85));
+    }
+    QFrame#keywordCard[selected="true"] {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
+            stop:0 rgba(49, 50, 68, 0.95), stop:1 rgba(69, 71, 90, 0.8));
+        border: 2px solid #89b4fa;
+        border-radius: 16px;
+    }
+    QLabel[role] { background: transparent; }
+    QLabel[role="status"] { font-size: 16pt; }
+    QLabel[role="name"] { font-size: 14pt; font-weight: bold; color: #cdd6f4; }
+    QLabel[role="price"] { color: #a6e3a1; font-size: 9pt; }
+    QLabel[role="location"] { color: #fab387; font-size: 9pt; }
+    QLabel[role="exclude"] { color: #f38ba8; font-size: 9pt; }
+    QLabel[role="notify"] { font-size: 9pt; }
+"""
 
 
 class KeywordCard(QFrame):
@@ -48,27 +138,22 @@ class KeywordCard(QFrame):
         header = QHBoxLayout()
         
         # Status indicator with animation-ready style
-        status = "🟢" if self.keyword.enabled else "⏸️"
-        status_label = QLabel(status)
-        status_label.setStyleSheet("font-size: 16pt; background: transparent;")
-        header.addWidget(status_label)
+        self.status_label = QLabel()
+        self.status_label.setProperty("role", "status")
+        header.addWidget(self.status_label)
         
         # Keyword name with accent color
-        name_label = QLabel(self.keyword.keyword)
-        name_label.setStyleSheet("""
-            font-size: 14pt; 
-            font-weight: bold; 
-            color: #cdd6f4;
-            background: transparent;
-        """)
-        header.addWidget(name_label)
+        self.name_label = QLabel()
+        self.name_label.setProperty("role", "name")
+        header.addWidget(self.name_label)
         
         header.addStretch()
         
-        # Platform badges with gradient
-        for platform in self.keyword.platforms:
-            badge = self.create_platform_badge(platform)
-            header.addWidget(badge)
+        # Platform badges with gradient (filled by update_from)
+        self.badges_layout = QHBoxLayout()
+        self.badges_layout.setSpacing(6)
+        self._badge_platforms: list[str] | None = None
+        header.addLayout(self.badges_layout)
         
         layout.addLayout(header)
         
@@ -77,101 +162,108 @@ class KeywordCard(QFrame):
         details.setSpacing(16)
         
         # Price range with icon
-        if self.keyword.min_price or self.keyword.max_price:
-            min_str = f"{self.keyword.min_price:,}" if self.keyword.min_price else "0"
-            max_str = f"{self.keyword.max_price:,}" if self.keyword.max_price else "∞"
-            price_label = QLabel(f"💰 {min_str} ~ {max_str}원")
-            price_label.setStyleSheet("""
-                color: #a6e3a1; 
-                font-size: 9pt;
-                background: transparent;
-            """)
-            details.addWidget(price_label)
+        self.price_label = QLabel()
+        self.price_label.setProperty("role", "price")
+        details.addWidget(self.price_label)
         
         # Location
-        if self.keyword.location:
-            loc_label = QLabel(f"📍 {self.keyword.location}")
-            loc_label.setStyleSheet("""
-                color: #fab387; 
-                font-size: 9pt;
-                background: transparent;
-            """)
-            details.addWidget(loc_label)
+        self.location_label = QLabel()
+        self.location_label.setProperty("role", "location")
+        details.addWidget(self.location_label)
         
         # Excludes
-        if self.keyword.exclude_keywords:
-            ex_label = QLabel(f"🚫 {len(self.keyword.exclude_keywords)}개 제외")
-            ex_label.setStyleSheet("""
-                color: #f38ba8; 
-                font-size: 9pt;
-                background: transparent;
-            """)
-            details.addWidget(ex_label)
+        self.exclude_label = QLabel()
+        self.exclude_label.setProperty("role", "exclude")
+        details.addWidget(self.exclude_label)
         
         # Notification status
-        notify_enabled = getattr(self.keyword, 'notify_enabled', True)
-        notify_icon = "🔔" if notify_enabled else "🔕"
-        notify_label = QLabel(notify_icon)
-        notify_label.setStyleSheet("""
-            font-size: 9pt;
-            background: transparent;
-        """)
-        notify_label.setToolTip("알림 " + ("켜짐" if notify_enabled else "꺼짐"))
-        details.addWidget(notify_label)
+        self.notify_label = QLabel()
+        self.notify_label.setProperty("role", "notify")
+        details.addWidget(self.notify_label)
         
         details.addStretch()
         layout.addLayout(details)
+        
+        self._shown: tuple | None = None
+        self.update_from(self.index, self.keyword)
+    
+    def update_from(self, index: int, keyword: SearchKeyword):
+        """Show another (or an edited) keyword in this card without rebuilding it"""
+        self.index = index
+        self.keyword = keyword
+        
+        # Everything the labels display; unchanged cards skip all text work
+        notify_enabled = getattr(keyword, 'notify_enabled', True)
+        shown = (
+            keyword.enabled, keyword.keyword, tuple(keyword.platforms),
+            keyword.min_price, keyword.max_price, keyword.location,
+            len(keyword.exclude_keywords or ()), notify_enabled,
+        )
+        if shown == self._shown:
+            return
+        self._shown = shown
+        
+        self.status_label.setText("🟢" if keyword.enabled else "⏸️")
+        self.name_label.setText(keyword.keyword)
+        
+        # Badges only change when the platform list does
+        if keyword.platforms != self._badge_platforms:
+            while self.badges_layout.count():
+                item = self.badges_layout.takeAt(0)
+                widget = item.widget() if item is not None else None
+                if widget is not None:
+                    widget.hide()
+                    widget.deleteLater()
+            for platform in keyword.platforms:
+                self.badges_layout.addWidget(self.create_platform_badge(platform))
+            self._badge_platforms = list(keyword.platforms)
+        
+        if keyword.min_price or keyword.max_price:
+            self.price_label.setText(_price_range_text(keyword.min_price, keyword.max_price))
+            self.price_label.show()
+        else:
+            self.price_label.hide()
+        
+        if keyword.location:
+            self.location_label.setText(f"📍 {keyword.location}")
+            self.location_label.show()
+        else:
+            self.location_label.hide()
+        
+        if keyword.exclude_keywords:
+            self.exclude_label.setText(f"🚫 {len(keyword.exclude_keywords)}개 제외")
+            self.exclude_label.show()
+        else:
+            self.exclude_label.hide()
+        
+        self.notify_label.setText("🔔" if notify_enabled else "🔕")
+        self.notify_label.setToolTip("알림 " + ("켜짐" if notify_enabled else "꺼짐"))
     
     def create_platform_badge(self, platform: str) -> QLabel:
-        """Create gradient platform badge"""
-        colors = {
-            'danggeun': ('#FF6F00', '#FF9800', '🥕'),
-            'bunjang': ('#7B68EE', '#9575CD', '⚡'),
-            'joonggonara': ('#00C853', '#69F0AE', '🛒')
-        }
-        base_color, light_color, emoji = colors.get(platform, ('#89b4fa', '#b4befe', '📦'))
-        
-        badge = QLabel(emoji)
-        badge.setStyleSheet(f"""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                stop:0 {base_color}, stop:1 {light_color});
-            color: white;
-            padding: 5px 10px;
-            border-radius: 12px;
-            font-size: 12pt;
-        """)
+        """Create gradient platform badge from the shared pixmap cache"""
+        badge = QLabel()
+        badge.setObjectName("keywordBadge")
+        badge.setProperty("role", "badge")
+        badge.setPixmap(_badge_pixmap(platform, self.devicePixelRatioF()))
         return badge
     
     def update_style(self):
+        # Re-polish so the shared sheet picks up the new "selected" value
+        self.setProperty("selected", self.selected)
+        style = self.style()
+        if style is not None:
+            style.unpolish(self)
+            style.polish(self)
         if self.selected:
-            self.setStyleSheet("""
-                QFrame#keywordCard {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
-                        stop:0 rgba(49, 50, 68, 0.95), stop:1 rgba(69, 71, 90, 0.8));
-                    border: 2px solid #89b4fa;
-                    border-radius: 16px;
-                }
-            """)
             self.shadow.setBlurRadius(25)
             self.shadow.setOffset(0, 6)
         else:
-            self.setStyleSheet("""
-                QFrame#keywordCard {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
-                        stop:0 rgba(30, 30, 46, 0.9), stop:1 rgba(49, 50, 68, 0.7));
-                    border: 1px solid rgba(69, 71, 90, 0.5);
-                    border-radius: 16px;
-                }
-                QFrame#keywordCard:hover {
-                    border: 1px solid rgba(137, 180, 250, 0.5);
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
-                        stop:0 rgba(37, 37, 53, 0.95), stop:1 rgba(49, 50, 68, 0.85));
-                }
-            """)
             self.shadow.setBlurRadius(15)
             self.shadow.setOffset(0, 4)
     
     def set_selected(self, selected: bool):
+        if selected == self.selected:
+            return
         self.selected = selected
         self.update_style()
     
@@ -405,9 +497,10 @@ class KeywordEditDialog(QDialog):
         self.location_edit.setText(self.keyword.location or "")
         self.exclude_edit.setPlainText("\n".join(self.keyword.exclude_keywords))
         
-        self.danggeun_check.setChecked("danggeun" in self.keyword.platforms)
-        self.bunjang_check.setChecked("bunjang" in self.keyword.platforms)
-        self.joonggonara_check.setChecked("joonggonara" in self.keyword.platforms)
+        platforms = set(self.keyword.platforms)
+        self.danggeun_check.setChecked("danggeun" in platforms)
+        self.bunjang_check.setChecked("bunjang" in platforms)
+        self.joonggonara_check.setChecked("joonggonara" in platforms)
     
     def _load_presets(self):
         """Load presets into combo box"""
@@ -431,9 +524,10 @@ class KeywordEditDialog(QDialog):
                 self.max_price_spin.setValue(0)
             self.location_edit.setText(preset.location or "")
             self.exclude_edit.setPlainText("\n".join(preset.exclude_keywords))
-            self.danggeun_check.setChecked("danggeun" in preset.platforms)
-            self.bunjang_check.setChecked("bunjang" in preset.platforms)
-            self.joonggonara_check.setChecked("joonggonara" in preset.platforms)
+            platforms = set(preset.platforms)
+            self.danggeun_check.setChecked("danggeun" in platforms)
+            self.bunjang_check.setChecked("bunjang" in platforms)
+            self.joonggonara_check.setChecked("joonggonara" in platforms)
     
     def _save_as_preset(self):
         """Save current settings as preset"""
@@ -554,13 +648,22 @@ class KeywordManagerWidget(QWidget):
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         
         self.cards_container = QWidget()
+        self.cards_container.setStyleSheet(KEYWORD_CARDS_QSS)
         self.cards_layout = QVBoxLayout(self.cards_container)
         self.cards_layout.setSpacing(12)
         self.cards_layout.setContentsMargins(0, 0, 8, 0)
+        
+        # Empty state, shown by refresh_list when there are no keywords
+        self.empty_label = QLabel("🔍 아직 키워드가 없어요\n\n위의 '+ 새 키워드' 버튼을 눌러\n모니터링할 검색어를 추가하세요!")
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty_label.setStyleSheet("color: #6c7086; font-size: 12pt; padding: 40px; line-height: 1.6;")
+        self.empty_label.hide()
+        self.cards_layout.addWidget(self.empty_label)
         self.cards_layout.addStretch()
         
         scroll.setWidget(self.cards_container)
         layout.addWidget(scroll)
+        pause_effects_while_scrolling(scroll)
         
         # Action buttons
         action_layout = QHBoxLayout()
@@ -600,46 +703,36 @@ class KeywordManagerWidget(QWidget):
         layout.addLayout(action_layout)
     
     def refresh_list(self):
-        # Clear existing cards - proper cleanup to prevent memory leaks
-        for card in self.cards:
+        # Recycle existing cards: update them in place and only create or
+        # delete the cards needed to match the keyword count.
+        keywords = self.settings.settings.keywords
+        for i, (card, kw) in enumerate(zip(self.cards, keywords)):
+            card.update_from(i, kw)
+            card.set_selected(False)
+        
+        # Surplus cards - proper cleanup to prevent memory leaks
+        for card in self.cards[len(keywords):]:
             try:
                 card.clicked.disconnect()
                 card.double_clicked.disconnect()
             except Exception:
                 pass  # Already disconnected
             card.hide()
+            self.cards_layout.removeWidget(card)
             card.setParent(None)
             card.deleteLater()
-        self.cards.clear()
-        
-        # Remove stretch and other widgets
-        while self.cards_layout.count():
-            item = self.cards_layout.takeAt(0)
-            if item is None:
-                continue
-            widget = item.widget()
-            if widget:
-                widget.hide()
-                widget.setParent(None)
-                widget.deleteLater()
-        
-        # Create new cards
-        keywords = self.settings.settings.keywords
-        for i, kw in enumerate(keywords):
-            card = KeywordCard(i, kw)
+        del self.cards[len(keywords):]
+        
+        # New cards go after the existing ones, ahead of the empty label and stretch
+        for i in range(len(self.cards), len(keywords)):
+            card = KeywordCard(i, keywords[i])
             card.clicked.connect(self.on_card_clicked)
             card.double_clicked.connect(self.on_card_double_clicked)
             self.cards.append(card)
-            self.cards_layout.addWidget(card)
+            self.cards_layout.insertWidget(i, card)
         
-        # Add empty state if no keywords
-        if not keywords:
-            empty_label = QLabel("🔍 아직 키워드가 없어요\n\n위의 '+ 새 키워드' 버튼을 눌러\n모니터링할 검색어를 추가하세요!")
-            empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty_label.setStyleSheet("color: #6c7086; font-size: 12pt; padding: 40px; line-height: 1.6;")
-            self.cards_layout.addWidget(empty_label)
-        
-        self.cards_layout.addStretch()
+        # Empty state if no keywords
+        self.empty_label.setVisible(not keywords)
         
         # Update count badge
         self.count_badge.setText(str(len(keywords)))
@@ -718,7 +811,8 @@ class KeywordManagerWidget(QWidget):
         keyword = self.settings.settings.keywords[self.selected_index]
         keyword.enabled = not keyword.enabled
         self.settings.update_keyword(self.selected_index, keyword)
-        self.refresh_list()
+        # Only the toggled card changes; update it in place and keep the selection
+        self.cards[self.selected_index].update_from(self.selected_index, keyword)
         self.keywords_changed.emit()
     
     def delete_keyword(self):
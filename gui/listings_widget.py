@@ -20,6 +20,8 @@ class ListingsWidget(QWidget):
         self._standalone_db = None  # For accessing DB without engine running
         self.current_page = 0
         self.page_size = 50
+        # page -> (created_at, id) of the last row on the previous page (keyset pagination)
+        self._page_cursors: dict[int, tuple[str, int]] = {}
         self.total_count = 0
         self.current_platform = "all"
         self.search_text = ""
@@ -412,14 +414,24 @@ class ListingsWidget(QWidget):
             platform = None if self.current_platform == "all" else self.current_platform
             status = None if self.current_status == "all" else self.current_status
             
-            # Use new DB method with status filter
+            if self.current_page == 0:
+                self._page_cursors.clear()
+            page_cursor = self._page_cursors.get(self.current_page)
+            
+            # Use new DB method with status filter; seek from the previous page's
+            # last row when known instead of skipping `offset` rows.
             listings = db.get_listings_by_status(
                 status=status,
                 platform=platform,
                 search=self.search_text,
                 limit=self.page_size,
-                offset=offset
+                offset=offset,
+                cursor_created_at=page_cursor[0] if page_cursor else None,
+                cursor_id=page_cursor[1] if page_cursor else None,
             )
+            if listings and listings[-1].get('created_at') is not None:
+                last = listings[-1]
+                self._page_cursors[self.current_page + 1] = (last['created_at'], last['id'])
             
             # Get total count (approximate when filtering)
             self.total_count = db.get_listings_count(
@@ -15,6 +15,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from gui.styles import DARK_STYLE, LIGHT_STYLE
+from gui.components import BADGE_QSS
 from models import ThemeMode
 from gui.keyword_manager import KeywordManagerWidget
 from gui.settings_dialog import SettingsDialog
@@ -777,7 +778,8 @@ class MainWindow(QMainWindow):
     def on_error(self, error: str):
         self.status_bar.showMessage(f"⚠️ 오류: {error}")
         self.status_text.setText("오류 발생")
-        self.status_dot.setStyleSheet("color: #f38ba8; font-size: 10pt; background: transparent;")
+        # Go through set_color so the dot's cached colour stays in sync
+        self.status_dot.set_color("#f38ba8")
     
     def open_settings(self):
         dialog = SettingsDialog(self.settings_manager, self)
@@ -807,7 +809,7 @@ class MainWindow(QMainWindow):
             is_dark = mode == ThemeMode.DARK
         
         style = DARK_STYLE if is_dark else LIGHT_STYLE
-        self.setStyleSheet(style)
+        self.setStyleSheet(style + BADGE_QSS)
         
         # Update specific elements
         header_bg = "#181825" if is_dark else "#ffffff"
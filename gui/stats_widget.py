@@ -577,7 +577,7 @@ class StatsWidget(QWidget):
         if format_type == "csv":
             success, message = ExportManager.export_to_csv(data, filename, fields)
         else:
-            success, message = ExportManager.export_to_excel(data, filename, fields)
+            success, message = ExportManager.export_to_excel_fast(data, filename, fields)
 
         if success:
             QMessageBox.information(self, "완료", message)
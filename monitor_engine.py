@@ -1042,122 +1042,133 @@ class MonitorEngine:
                     )
                 platform_results[platform] = items_raw
 
-        for platform in active_platforms:
-            items_raw = platform_results.get(platform) or []
-            raw_count = len(items_raw)
-            enrichment_budget = self.METADATA_ENRICHMENT_LIMIT if getattr(
-                self.settings.settings, "metadata_enrichment_enabled", False
-            ) else 0
-
-            items_prefilter, used_prefilter = await self._enrich_items_with_budget(
-                platform,
-                keyword_config.keyword,
-                items_raw,
-                enrichment_budget,
-                phase="prefilter",
-                predicate=lambda item, kw=keyword_config, blocked=blocked_set: self._needs_prefilter_metadata_enrichment(
-                    item,
-                    kw,
-                    blocked,
-                ),
-            )
-            enrichment_budget = max(0, enrichment_budget - used_prefilter)
+        stats_rows: list[tuple[str, str, int, int]] = []
+        try:
+            for platform in active_platforms:
+                items_raw = platform_results.get(platform) or []
+                raw_count = len(items_raw)
+                enrichment_budget = self.METADATA_ENRICHMENT_LIMIT if getattr(
+                    self.settings.settings, "metadata_enrichment_enabled", False
+                ) else 0
+
+                items_prefilter, used_prefilter = await self._enrich_items_with_budget(
+                    platform,
+                    keyword_config.keyword,
+                    items_raw,
+                    enrichment_budget,
+                    phase="prefilter",
+                    predicate=lambda item, kw=keyword_config, blocked=blocked_set: self._needs_prefilter_metadata_enrichment(
+                        item,
+                        kw,
+                        blocked,
+                    ),
+                )
+                enrichment_budget = max(0, enrichment_budget - used_prefilter)
 
-            # Apply per-keyword filters (price/location/exclude keywords)
-            items: list[Item] = []
-            for it in items_prefilter:
-                if not getattr(it, "keyword", None):
-                    it.keyword = keyword_config.keyword
-                if keyword_config.matches(it):
-                    items.append(it)
+                # Apply per-keyword filters (price/location/exclude keywords)
+                items: list[Item] = []
+                for it in items_prefilter:
+                    if not getattr(it, "keyword", None):
+                        it.keyword = keyword_config.keyword
+                    if keyword_config.matches(it):
+                        items.append(it)
 
-            if raw_count > 0 and len(items) == 0:
-                self.logger.info(
-                    f"{platform}: all {raw_count} raw items filtered out "
-                    f"(location={keyword_config.location!r}, min={keyword_config.min_price}, "
-                    f"max={keyword_config.max_price}, exclude={len(keyword_config.exclude_keywords or [])})"
-                )
+                if raw_count > 0 and len(items) == 0:
+                    self.logger.info(
+                        f"{platform}: all {raw_count} raw items filtered out "
+                        f"(location={keyword_config.location!r}, min={keyword_config.min_price}, "
+                        f"max={keyword_config.max_price}, exclude={len(keyword_config.exclude_keywords or [])})"
+                    )
 
-            if blocked_set:
-                items = [it for it in items if not self._item_is_blocked(it, blocked_set)]
+                if blocked_set:
+                    items = [it for it in items if not self._item_is_blocked(it, blocked_set)]
 
-            items, _ = await self._enrich_items_with_budget(
-                platform,
-                keyword_config.keyword,
-                items,
-                enrichment_budget,
-                phase="postfilter",
-                predicate=self._needs_metadata_enrichment,
-            )
+                items, _ = await self._enrich_items_with_budget(
+                    platform,
+                    keyword_config.keyword,
+                    items,
+                    enrichment_budget,
+                    phase="postfilter",
+                    predicate=self._needs_metadata_enrichment,
+                )
 
-            self.logger.info(f"Found {len(items)} items on {platform} for '{keyword_config.keyword}'")
-            process_start = perf_counter()
-            platform_new = 0
-            db_ms_total = 0.0
+                self.logger.info(f"Found {len(items)} items on {platform} for '{keyword_config.keyword}'")
+                process_start = perf_counter()
+                platform_new = 0
+                db_ms_total = 0.0
 
-            existing_ids = self.db.get_existing_article_ids(
-                platform, [str(it.article_id) for it in items if getattr(it, "article_id", None)]
-            )
+                existing_ids = self.db.get_existing_article_ids(
+                    platform, [str(it.article_id) for it in items if getattr(it, "article_id", None)]
+                )
 
-            for item in items:
-                if not item.title or len(item.title.strip()) < 2:
-                    continue
+                to_store: list[Item] = []
+                pending_new: list[Item] = []
+                for item in items:
+                    if not item.title or len(item.title.strip()) < 2:
+                        continue
 
-                # Skip fuzzy duplicate checks for known article IDs.
-                if str(item.article_id) not in existing_ids and self.db.is_fuzzy_duplicate(item):
-                    continue
+                    # Skip fuzzy duplicate checks for known article IDs.
+                    if str(item.article_id) not in existing_ids:
+                        if self.db.is_fuzzy_duplicate(item, pending=pending_new):
+                            continue
+                        pending_new.append(item)
+                    to_store.append(item)
 
                 db_started = perf_counter()
-                is_new, price_change, listing_id = self.db.add_listing(item)
+                results = self.db.add_listings_bulk(to_store)
                 db_ms_total += (perf_counter() - db_started) * 1000
 
-                if is_new:
-                    platform_new += 1
-                    self.logger.info(f"New item: {item.title}")
+                for item, (is_new, price_change, listing_id) in zip(to_store, results):
+                    if is_new:
+                        platform_new += 1
+                        self.logger.info(f"New item: {item.title}")
 
-                    if self.settings.settings.auto_tagging_enabled and listing_id:
-                        tags = self.auto_tagger.analyze(item.title)
-                        if tags:
-                            self.db.add_auto_tags(listing_id, tags)
-                            self.logger.debug(f"Auto-tagged '{item.title}' with: {tags}")
+                        if self.settings.settings.auto_tagging_enabled and listing_id:
+                            tags = self.auto_tagger.analyze(item.title)
+                            if tags:
+                                self.db.add_auto_tags(listing_id, tags)
+                                self.logger.debug(f"Auto-tagged '{item.title}' with: {tags}")
 
-                    if self.on_new_item:
-                        self.on_new_item(item)
+                        if self.on_new_item:
+                            self.on_new_item(item)
 
-                    if not self.is_first_run and getattr(keyword_config, "notify_enabled", True):
-                        await self.send_notifications(item, listing_id=listing_id)
+                        if not self.is_first_run and getattr(keyword_config, "notify_enabled", True):
+                            await self.send_notifications(item, listing_id=listing_id)
 
-                elif price_change:
-                    self.logger.info(
-                        f"Price change: {item.title} ({price_change['old_price']} -> {price_change['new_price']})"
-                    )
-                    fav = self.db.get_favorite_details(listing_id) if listing_id is not None else None
-                    new_price_display = price_change["new_price"]
-
-                    if fav and fav.get("target_price") and price_change.get("new_numeric"):
-                        if price_change["new_numeric"] <= fav["target_price"]:
-                            new_price_display += " (target hit)"
-                            self.logger.info(f"Target price hit for {item.title}")
-
-                    if self.on_price_change:
-                        self.on_price_change(item, price_change["old_price"], price_change["new_price"])
-
-                    if not self.is_first_run and getattr(keyword_config, "notify_enabled", True):
-                        await self.send_notifications(
-                            item,
-                            is_price_change=True,
-                            old_price=price_change["old_price"],
-                            new_price=new_price_display,
-                            listing_id=listing_id,
+                    elif price_change:
+                        self.logger.info(
+                            f"Price change: {item.title} ({price_change['old_price']} -> {price_change['new_price']})"
                         )
+                        fav = self.db.get_favorite_details(listing_id) if listing_id is not None else None
+                        new_price_display = price_change["new_price"]
+
+                        if fav and fav.get("target_price") and price_change.get("new_numeric"):
+                            if price_change["new_numeric"] <= fav["target_price"]:
+                                new_price_display += " (target hit)"
+                                self.logger.info(f"Target price hit for {item.title}")
+
+                        if self.on_price_change:
+                            self.on_price_change(item, price_change["old_price"], price_change["new_price"])
+
+                        if not self.is_first_run and getattr(keyword_config, "notify_enabled", True):
+                            await self.send_notifications(
+                                item,
+                                is_price_change=True,
+                                old_price=price_change["old_price"],
+                                new_price=new_price_display,
+                                listing_id=listing_id,
+                            )
 
-            self.db.record_search_stats(keyword_config.keyword, platform, len(items), platform_new)
-            new_count += platform_new
-            elapsed_ms = (perf_counter() - process_start) * 1000
-            self.logger.info(
-                f"[perf] process keyword='{keyword_config.keyword}' platform={platform} "
-                f"items={len(items)} new={platform_new} db_ms={db_ms_total:.1f} elapsed_ms={elapsed_ms:.1f}"
-            )
+                stats_rows.append((keyword_config.keyword, platform, len(items), platform_new))
+                new_count += platform_new
+                elapsed_ms = (perf_counter() - process_start) * 1000
+                self.logger.info(
+                    f"[perf] process keyword='{keyword_config.keyword}' platform={platform} "
+                    f"items={len(items)} new={platform_new} db_ms={db_ms_total:.1f} elapsed_ms={elapsed_ms:.1f}"
+                )
+        finally:
+            # Keep stats for platforms that finished before a later one raised
+            self.db.record_search_stats_bulk(stats_rows)
 
         total_ms = (perf_counter() - search_start) * 1000
         self.logger.info(f"[perf] keyword '{keyword_config.keyword}' total_elapsed_ms={total_ms:.1f}")
@@ -1173,9 +1184,8 @@ class MonitorEngine:
         self._cycle_platform_attempts = {p: 0 for p in ("danggeun", "bunjang", "joonggonara")}
         self._cycle_fallback_counts = {p: 0 for p in ("danggeun", "bunjang", "joonggonara")}
         self._cycle_danggeun_location_warning_keys = set()
-        blocked_sellers = self.db.get_blocked_sellers()
         self._cycle_blocked_set = {
-            (row.get("seller_name"), row.get("platform")) for row in blocked_sellers if row.get("seller_name")
+            (seller_name, platform) for seller_name, platform in self.db.get_blocked_seller_keys() if seller_name
         }
 
         try:
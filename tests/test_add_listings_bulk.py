@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+
+from db import DatabaseManager
+from models import Item
+
+
+def _item(article_id: str, price: str = "10,000원", title: str | None = None, platform: str = "danggeun") -> Item:
+    return Item(
+        platform=platform,
+        article_id=article_id,
+        title=title or f"title {article_id}",
+        price=price,
+        link=f"https://example.com/{platform}/{article_id}",
+        keyword="test",
+    )
+
+
+class TestAddListingsBulk(unittest.TestCase):
+    def test_bulk_matches_single_item_semantics(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(os.path.join(tmp, "test.db"))
+            try:
+                _, _, existing_id = db.add_listing(_item("a1"))
+
+                results = db.add_listings_bulk(
+                    [
+                        _item("a1", price="8,000원"),
+                        _item("a2"),
+                        _item("a2", price="9,000원"),
+                        _item("a1", platform="bunjang"),
+                    ]
+                )
+
+                self.assertEqual(len(results), 4)
+                is_new, change, listing_id = results[0]
+                self.assertFalse(is_new)
+                self.assertEqual(listing_id, existing_id)
+                assert change is not None
+                self.assertEqual(change["new_numeric"], 8000)
+
+                self.assertTrue(results[1][0])
+                # Repeated key within the batch sees the row inserted just before it.
+                self.assertFalse(results[2][0])
+                self.assertEqual(results[2][2], results[1][2])
+                assert results[2][1] is not None
+                self.assertEqual(results[2][1]["old_numeric"], 10000)
+                self.assertTrue(results[3][0])
+
+                self.assertEqual(db.get_total_listings(), 3)
+                self.assertTrue(db.is_duplicate("danggeun", "a2"))
+                self.assertEqual(db.add_listings_bulk([]), [])
+            finally:
+                db.close()
+
+    def test_fuzzy_duplicate_considers_pending_items(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(os.path.join(tmp, "test.db"))
+            try:
+                first = _item("p1", title="아이폰 15 프로 256GB 판매합니다")
+                second = _item("p2", title="아이폰 15 프로 256GB 판매합니다!")
+                self.assertFalse(db.is_fuzzy_duplicate(second))
+                self.assertTrue(db.is_fuzzy_duplicate(second, pending=[first]))
+                self.assertFalse(db.is_fuzzy_duplicate(second, pending=[_item("p3", price="1원", title=first.title)]))
+            finally:
+                db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
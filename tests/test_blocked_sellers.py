@@ -19,6 +19,28 @@ class TestBlockedSellers(unittest.TestCase):
             finally:
                 db.close()
 
+    def test_blocked_seller_keys_track_add_remove_and_other_connections(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "test.db")
+            db = DatabaseManager(db_path)
+            other = DatabaseManager(db_path)
+            try:
+                db.add_seller_filter("seller1", "danggeun", is_blocked=True)
+                self.assertTrue(db.is_seller_blocked("seller1", "danggeun"))
+                self.assertFalse(db.is_seller_blocked("seller1", "bunjang"))
+                self.assertEqual(db.get_blocked_seller_keys(), frozenset({("seller1", "danggeun")}))
+
+                other.remove_seller_filter("seller1", "danggeun")
+                self.assertEqual(db.get_blocked_seller_keys(), frozenset())
+                self.assertFalse(db.is_seller_blocked("seller1", "danggeun"))
+
+                # Another connection's block is visible without a prior key reload
+                other.add_seller_filter("seller2", None, is_blocked=True)
+                self.assertTrue(db.is_seller_blocked("seller2", "bunjang"))
+            finally:
+                other.close()
+                db.close()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from db import DatabaseManager
+from models import Item
+
+
+class TestBufferedWrites(unittest.TestCase):
+    def test_reads_see_queued_telemetry(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(os.path.join(tmp, "test.db"))
+            try:
+                db.add_search_history("맥북")
+                db.add_search_history("맥북")
+                db.record_search_stats("맥북", "danggeun", 5, 2)
+
+                self.assertEqual(db.get_search_history(), ["맥북"])
+                last_time = db.get_last_search_time("맥북")
+                assert last_time is not None
+                self.assertLess(abs((datetime.now() - last_time).total_seconds()), 60)
+                self.assertIsNone(db.get_last_search_time("없음"))
+                self.assertEqual(sum(row["items_found"] for row in db.get_daily_stats()), 5)
+
+                with db.lock:
+                    cur = db.conn.cursor()
+                    cur.execute("SELECT use_count FROM search_history WHERE keyword = ?", ("맥북",))
+                    self.assertEqual(cur.fetchone()["use_count"], 2)
+            finally:
+                db.close()
+
+    def test_close_flushes_pending_rows(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "test.db")
+            db = DatabaseManager(db_path)
+            _, _, listing_id = db.add_listing(
+                Item(
+                    platform="bunjang",
+                    article_id="b1",
+                    title="아이폰",
+                    price="500,000원",
+                    link="https://example.com/b1",
+                    keyword="아이폰",
+                )
+            )
+            assert listing_id is not None
+            db.log_notification(listing_id, "telegram", "x" * 300)
+            db.close()
+
+            db = DatabaseManager(db_path)
+            try:
+                logs = db.get_notification_logs()
+                self.assertEqual(len(logs), 1)
+                self.assertEqual(len(logs[0]["message_preview"]), 200)
+            finally:
+                db.close()
+
+    def test_failing_row_does_not_drop_rest_of_batch(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(os.path.join(tmp, "test.db"))
+            try:
+                _, _, listing_id = db.add_listing(
+                    Item(
+                        platform="bunjang",
+                        article_id="b2",
+                        title="아이패드",
+                        price="300,000원",
+                        link="https://example.com/b2",
+                        keyword="아이패드",
+                    )
+                )
+                assert listing_id is not None
+                db.log_notification(listing_id, "telegram", "first")
+                db.log_notification(listing_id + 1000, "telegram", "orphan")  # FK failure
+                db.log_notification(listing_id, "discord", "last")
+                db.record_search_stats("아이패드", "bunjang", 4, 1)
+                with self.assertLogs("DatabaseManager", level="WARNING") as logs:
+                    db.flush()
+
+                previews = sorted(row["message_preview"] for row in db.get_notification_logs())
+                self.assertEqual(previews, ["first", "last"])
+                self.assertEqual(sum(row["items_found"] for row in db.get_daily_stats()), 4)
+                self.assertEqual(len(logs.records), 1)
+            finally:
+                db.close()
+
+    def test_bulk_search_stats(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(os.path.join(tmp, "test.db"))
+            try:
+                db.record_search_stats_bulk([("맥북", "danggeun", 5, 1), ("맥북", "bunjang", 3, 2)])
+                db.record_search_stats_bulk([])
+                stats = db.get_daily_stats()
+                self.assertEqual(sum(row["items_found"] for row in stats), 8)
+                self.assertEqual(sum(row["new_items"] for row in stats), 3)
+            finally:
+                db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -97,6 +97,87 @@ class TestDatabaseIntegrityUpdates(unittest.TestCase):
             finally:
                 db.close()
 
+    def test_favorites_version_changes_on_favorite_and_listing_writes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(os.path.join(tmp, "test.db"))
+            try:
+                item = Item(
+                    platform="bunjang",
+                    article_id="b2",
+                    title="iPad",
+                    price="500,000원",
+                    link="https://example.com/b2",
+                    keyword="ipad",
+                )
+                _, _, listing_id = db.add_listing(item)
+                assert listing_id is not None
+
+                version = db.favorites_version()
+                self.assertEqual(db.favorites_version(), version)
+
+                self.assertTrue(db.add_favorite(listing_id))
+                self.assertNotEqual(db.favorites_version(), version)
+                version = db.favorites_version()
+
+                self.assertTrue(db.update_favorite(listing_id, notes="watch"))
+                self.assertNotEqual(db.favorites_version(), version)
+                version = db.favorites_version()
+
+                # A price change on the listing must also invalidate the view
+                item.price = "450,000원"
+                db.add_listing(item)
+                self.assertNotEqual(db.favorites_version(), version)
+                version = db.favorites_version()
+
+                # Writes that don't touch a favorited listing leave it alone
+                other = Item(
+                    platform="bunjang",
+                    article_id="b3",
+                    title="iPad mini",
+                    price="300,000원",
+                    link="https://example.com/b3",
+                    keyword="ipad",
+                )
+                db.add_listing(other)
+                db.record_search_stats("ipad", "bunjang", 2, 1)
+                db.flush()
+                self.assertEqual(db.favorites_version(), version)
+
+                db.update_sale_status(listing_id, "sold")
+                self.assertNotEqual(db.favorites_version(), version)
+                version = db.favorites_version()
+
+                db.remove_favorite(listing_id)
+                self.assertNotEqual(db.favorites_version(), version)
+            finally:
+                db.close()
+
+    def test_remove_favorites_deletes_all_given_listings(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(os.path.join(tmp, "test.db"))
+            try:
+                ids = []
+                for i in range(3):
+                    _, _, listing_id = db.add_listing(
+                        Item(
+                            platform="bunjang",
+                            article_id=f"fav-{i}",
+                            title=f"item {i}",
+                            price="10,000원",
+                            link=f"https://example.com/fav-{i}",
+                            keyword="item",
+                        )
+                    )
+                    assert listing_id is not None
+                    self.assertTrue(db.add_favorite(listing_id))
+                    ids.append(listing_id)
+
+                self.assertEqual(db.remove_favorites(ids[:2]), 2)
+                self.assertEqual([f["id"] for f in db.get_favorites()], [ids[2]])
+                self.assertEqual(db.remove_favorites([]), 0)
+            finally:
+                db.close()
+
     def test_explicit_sale_status_overrides_title_heuristic(self):
         with tempfile.TemporaryDirectory() as tmp:
             db = DatabaseManager(os.path.join(tmp, "test.db"))
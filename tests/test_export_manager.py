@@ -0,0 +1,191 @@
+import csv
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import export_manager
+from db import DatabaseManager
+from export_manager import ExportManager
+from models import Item
+
+
+class TestExportManagerCsv(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "out.csv")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _read(self):
+        with open(self.path, newline="", encoding="utf-8-sig") as f:
+            return list(csv.reader(f))
+
+    def test_streams_generator_and_counts_rows(self):
+        rows = ({"title": f"item {i}", "price": i, "extra": "x"} for i in range(3))
+        ok, message = ExportManager.export_to_csv(rows, self.path, ["title", "price"])
+
+        self.assertTrue(ok)
+        self.assertIn("3개", message)
+        self.assertEqual(
+            self._read(),
+            [["title", "price"], ["item 0", "0"], ["item 1", "1"], ["item 2", "2"]],
+        )
+
+    def test_empty_iterable_is_rejected_without_creating_file(self):
+        ok, _ = ExportManager.export_to_csv(iter(()), self.path)
+        self.assertFalse(ok)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_missing_field_is_written_blank(self):
+        ok, _ = ExportManager.export_to_csv([{"title": "a"}], self.path, ["title", "seller"])
+        self.assertTrue(ok)
+        self.assertEqual(self._read()[1], ["a", ""])
+
+    def test_single_field_export(self):
+        ok, _ = ExportManager.export_to_csv([{"title": "a"}, {"title": "b"}], self.path, ["title"])
+        self.assertTrue(ok)
+        self.assertEqual(self._read(), [["title"], ["a"], ["b"]])
+
+    def test_sequence_rows_are_written_in_field_order(self):
+        rows = ([f"item {i}", i] for i in range(2))
+        ok, message = ExportManager.export_to_csv(rows, self.path, ["제목", "가격"])
+
+        self.assertTrue(ok)
+        self.assertIn("2개", message)
+        self.assertEqual(self._read(), [["제목", "가격"], ["item 0", "0"], ["item 1", "1"]])
+
+    def test_excel_fast_falls_back_to_openpyxl_without_xlsxwriter(self):
+        rows = [{"title": "a"}]
+        with mock.patch.object(export_manager, "_xlsxwriter", None), mock.patch.dict(
+            sys.modules, {"xlsxwriter": None}
+        ), mock.patch.object(
+            ExportManager, "export_to_excel", return_value=(True, "fallback")
+        ) as fallback:
+            result = ExportManager.export_to_excel_fast(rows, self.path, ["title"])
+        self.assertEqual(result, (True, "fallback"))
+        fallback.assert_called_once_with(rows, self.path, ["title"])
+
+    def test_excel_fast_keeps_urls_as_text_and_closes_on_failure(self):
+        fake = mock.Mock()
+        workbook = fake.Workbook.return_value
+        sheet = workbook.add_worksheet.return_value
+        # Header and first data row succeed, the second data row fails
+        sheet.write_row.side_effect = [None, None, RuntimeError("disk full")]
+        rows = [["https://example.com/1"], ["https://example.com/2"]]
+        with mock.patch.object(export_manager, "_xlsxwriter", fake):
+            ok, _ = ExportManager.export_to_excel_fast(rows, self.path, ["URL"])
+
+        self.assertFalse(ok)
+        fake.Workbook.assert_called_once_with(
+            self.path, {"constant_memory": True, "strings_to_urls": False}
+        )
+        workbook.close.assert_called_once_with()
+
+    def test_iter_listings_for_export_feeds_csv(self):
+        db = DatabaseManager(os.path.join(self.tmp.name, "test.db"))
+        try:
+            for i in range(5):
+                db.add_listing(
+                    Item(
+                        platform="danggeun",
+                        article_id=f"e{i}",
+                        title=f"export {i}",
+                        price="1,000원",
+                        link=f"https://example.com/e{i}",
+                        keyword="test",
+                    )
+                )
+            rows = db.iter_listings_for_export(batch_size=2)
+            ok, message = ExportManager.export_to_csv(rows, self.path, ["article_id", "title"])
+        finally:
+            db.close()
+
+        self.assertTrue(ok)
+        self.assertIn("5개", message)
+        self.assertEqual(len(self._read()), 6)
+
+    def test_raw_export_rows_match_dict_rows(self):
+        db = DatabaseManager(os.path.join(self.tmp.name, "test.db"))
+        try:
+            for i in range(3):
+                db.add_listing(
+                    Item(
+                        platform="danggeun",
+                        article_id=f"r{i}",
+                        title=f"raw {i}",
+                        price="1,000원",
+                        link=f"https://example.com/r{i}",
+                        keyword="test",
+                    )
+                )
+            dict_rows = list(db.iter_listings_for_export(batch_size=2))
+            raw_rows = list(db.iter_listings_for_export(batch_size=2, raw=True))
+        finally:
+            db.close()
+
+        self.assertEqual(len(raw_rows), 3)
+        self.assertIsInstance(raw_rows[0], sqlite3.Row)
+        self.assertEqual([dict(row) for row in raw_rows], dict_rows)
+
+    def test_export_chunks_cover_every_row_once_in_order(self):
+        db = DatabaseManager(os.path.join(self.tmp.name, "test.db"))
+        try:
+            for i in range(7):
+                db.add_listing(
+                    Item(
+                        platform="danggeun",
+                        article_id=f"k{i}",
+                        title=f"keyset {i}",
+                        price="1,000원",
+                        link=f"https://example.com/k{i}",
+                        keyword="test",
+                    )
+                )
+            expected = [row["id"] for row in db.iter_listings_for_export()]
+            chunked = [
+                row["id"]
+                for row in db.iter_listings_for_export(batch_size=2, chunk_rows=3, raw=True)
+            ]
+        finally:
+            db.close()
+
+        self.assertEqual(len(expected), 7)
+        self.assertEqual(chunked, expected)
+
+    def test_count_listings_for_export_matches_rows(self):
+        db = DatabaseManager(os.path.join(self.tmp.name, "test.db"))
+        try:
+            for i, status in enumerate(["for_sale", "sold", "reserved", "sold"]):
+                db.add_listing(
+                    Item(
+                        platform="bunjang" if i % 2 else "danggeun",
+                        article_id=f"c{i}",
+                        title=f"count {i}",
+                        price="1,000원",
+                        link=f"https://example.com/c{i}",
+                        keyword="test",
+                        sale_status=status,
+                    )
+                )
+            for filters in (
+                {},
+                {"include_sold": False},
+                {"platform": "bunjang"},
+                {"status": "sold", "platform": "bunjang"},
+                {"date_from": "2000-01-01", "date_to": "2000-01-02"},
+            ):
+                with self.subTest(filters=filters):
+                    self.assertEqual(
+                        db.count_listings_for_export(**filters),
+                        len(db.get_listings_for_export(**filters)),
+                    )
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+
+from db import DatabaseManager
+from models import Item
+
+
+def _item(article_id: str) -> Item:
+    return Item(
+        platform="danggeun",
+        article_id=article_id,
+        title=f"title {article_id}",
+        price="10,000원",
+        link=f"https://example.com/{article_id}",
+        keyword="test",
+    )
+
+
+class TestIsDuplicateCache(unittest.TestCase):
+    def test_tracks_inserts_deletes_and_other_connections(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "test.db")
+            db = DatabaseManager(db_path)
+            other = DatabaseManager(db_path)
+            try:
+                self.assertFalse(db.is_duplicate("danggeun", "a1"))
+                db.add_listing(_item("a1"))
+                self.assertTrue(db.is_duplicate("danggeun", "a1"))
+                self.assertFalse(db.is_duplicate("bunjang", "a1"))
+
+                # Rows written through another connection are picked up.
+                other.add_listing(_item("a2"))
+                self.assertTrue(db.is_duplicate("danggeun", "a2"))
+
+                # Stale keys are confirmed against the table.
+                with db.lock:
+                    db.conn.execute("DELETE FROM listings WHERE article_id = ?", ("a1",))
+                    db.conn.commit()
+                self.assertFalse(db.is_duplicate("danggeun", "a1"))
+            finally:
+                other.close()
+                db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
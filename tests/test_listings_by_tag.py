@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+from db import DatabaseManager
+from models import Item
+
+
+class TestListingsByTag(unittest.TestCase):
+    def test_get_listings_by_tag_uses_tag_table(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(os.path.join(tmp, "test.db"))
+            try:
+                ids = []
+                for idx in range(3):
+                    _, _, listing_id = db.add_listing(
+                        Item(
+                            platform="bunjang",
+                            article_id=f"b{idx}",
+                            title=f"아이폰 {idx}",
+                            price="500,000원",
+                            link=f"https://example.com/b{idx}",
+                            keyword="아이폰",
+                        )
+                    )
+                    assert listing_id is not None
+                    ids.append(listing_id)
+
+                db.add_auto_tags(ids[0], ["급처", "택포"])
+                db.add_auto_tags(ids[2], ["급처"])
+
+                tagged = {row["id"] for row in db.get_listings_by_tag("급처")}
+                self.assertEqual(tagged, {ids[0], ids[2]})
+                self.assertEqual([row["id"] for row in db.get_listings_by_tag(" 택포 ")], [ids[0]])
+                self.assertEqual(db.get_listings_by_tag("없음"), [])
+            finally:
+                db.close()
+
+    def test_export_rows_carry_flat_tags(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(os.path.join(tmp, "test.db"))
+            try:
+                _, _, listing_id = db.add_listing(
+                    Item(
+                        platform="bunjang",
+                        article_id="flat",
+                        title="갤럭시",
+                        price="300,000원",
+                        link="https://example.com/flat",
+                        keyword="갤럭시",
+                    )
+                )
+                assert listing_id is not None
+                db.add_auto_tags(listing_id, ["택포", "급처"])
+
+                rows = {row["article_id"]: row for row in db.get_listings_for_export()}
+                self.assertEqual(rows["flat"]["auto_tags_flat"], "급처, 택포")
+                self.assertNotIn("auto_tags", rows["flat"])
+            finally:
+                db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -34,6 +34,62 @@ class TestListingsCountWithStatus(unittest.TestCase):
             finally:
                 db.close()
 
+    def test_status_counts_merge_null_status_into_for_sale(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(os.path.join(tmp, "test.db"))
+            try:
+                with db.lock:
+                    cur = db.conn.cursor()
+                    for article_id, status in (("c1", "for_sale"), ("c2", None), ("c3", "sold")):
+                        cur.execute(
+                            "INSERT INTO listings (platform, article_id, title, price, sale_status) VALUES (?, ?, ?, ?, ?)",
+                            ("bunjang", article_id, "t", "1만", status),
+                        )
+                    db.conn.commit()
+
+                counts = db.get_status_counts()
+                self.assertEqual(counts, {"for_sale": 2, "sold": 1})
+                self.assertEqual(sum(counts.values()), db.get_total_listings())
+            finally:
+                db.close()
+
+    def test_keyset_pages_match_offset_pages(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(os.path.join(tmp, "test.db"))
+            try:
+                with db.lock:
+                    cur = db.conn.cursor()
+                    # Shared timestamps exercise the id tie-breaker.
+                    for i in range(7):
+                        cur.execute(
+                            "INSERT INTO listings (platform, article_id, title, price, sale_status, created_at) "
+                            "VALUES (?, ?, ?, ?, ?, ?)",
+                            ("danggeun", f"k{i}", f"t{i}", "1만", "for_sale", f"2024-01-0{1 + i // 3} 00:00:00"),
+                        )
+                    db.conn.commit()
+
+                offset_ids = [
+                    [row["id"] for row in db.get_listings_by_status(status="for_sale", limit=3, offset=page * 3)]
+                    for page in range(3)
+                ]
+
+                keyset_ids = []
+                last = None
+                for _ in range(3):
+                    rows = db.get_listings_by_status(
+                        status="for_sale",
+                        limit=3,
+                        cursor_created_at=last["created_at"] if last else None,
+                        cursor_id=last["id"] if last else None,
+                    )
+                    keyset_ids.append([row["id"] for row in rows])
+                    last = rows[-1] if rows else None
+
+                self.assertEqual(keyset_ids, offset_ids)
+                self.assertEqual(sum(len(ids) for ids in keyset_ids), 7)
+            finally:
+                db.close()
+
 
 if __name__ == "__main__":
     unittest.main()
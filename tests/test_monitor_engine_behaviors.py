@@ -210,6 +210,43 @@ class TestMonitorEngineBehaviors(unittest.IsolatedAsyncioTestCase):
         if engine._executor is not None:
             engine._executor.shutdown(wait=True, cancel_futures=True)
 
+    async def test_search_stats_are_kept_when_a_later_platform_raises(self):
+        engine = await self._make_engine(notifications_enabled=False)
+        for platform in ("danggeun", "bunjang"):
+            engine.primary_scrapers[platform] = _FakeScraper(
+                items=[
+                    Item(
+                        platform=platform,
+                        article_id=f"{platform}-1",
+                        title=f"{platform} item",
+                        price="10,000원",
+                        link=f"https://example.com/{platform}-1",
+                        keyword="test",
+                    )
+                ]
+            )
+            engine.primary_scraper_kind[platform] = "playwright"
+
+        def _fail_on_bunjang(item: Item):
+            if item.platform == "bunjang":
+                raise RuntimeError("callback failed")
+
+        engine.on_new_item = _fail_on_bunjang
+
+        kw = SearchKeyword(keyword="test", platforms=["danggeun", "bunjang"])
+        with self.assertRaises(RuntimeError):
+            await engine.search_keyword(kw, blocked_set=set())
+        self.db.flush()
+
+        with self.db.lock:
+            cur = self.db.conn.cursor()
+            cur.execute("SELECT platform, items_found, new_items FROM search_stats")
+            rows = [tuple(row) for row in cur.fetchall()]
+        self.assertEqual(rows, [("danggeun", 1, 1)])
+
+        if engine._executor is not None:
+            engine._executor.shutdown(wait=True, cancel_futures=True)
+
     async def test_prefilter_enrichment_recovers_items_for_location_filter(self):
         engine = await self._make_engine(notifications_enabled=False, metadata_enrichment_enabled=True)
         base_item = Item(
@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+
+from db import DatabaseManager
+
+
+class TestQueryPlans(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self._tmp.name, "test.db"))
+
+    def tearDown(self):
+        self.db.close()
+        self._tmp.cleanup()
+
+    def _plan(self, query: str, params: tuple = ()) -> str:
+        with self.db.lock:
+            rows = self.db.conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+        return " | ".join(str(row["detail"]) for row in rows)
+
+    def test_duplicate_lookup_is_index_only(self):
+        plan = self._plan(
+            "SELECT 1 FROM listings WHERE platform = ? AND article_id = ?",
+            ("danggeun", "a1"),
+        )
+        self.assertIn("COVERING INDEX", plan)
+
+    def test_price_changes_use_changed_at_index(self):
+        plan = self._plan(
+            """
+            SELECT l.title, ph.old_price, ph.new_price, ph.changed_at
+            FROM price_history ph
+            JOIN listings l ON ph.listing_id = l.id
+            WHERE ph.changed_at >= datetime('now', ?)
+            ORDER BY ph.changed_at DESC
+            LIMIT 50
+            """,
+            ("-7 days",),
+        )
+        self.assertIn("idx_price_history_changed_listing", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_recent_and_status_listings_avoid_sort(self):
+        recent = self._plan("SELECT id FROM listings ORDER BY created_at DESC LIMIT 20")
+        self.assertIn("idx_listings_created", recent)
+        self.assertNotIn("TEMP B-TREE", recent)
+
+        by_status = self._plan(
+            "SELECT * FROM listings WHERE sale_status = ? ORDER BY created_at DESC, id DESC LIMIT 50",
+            ("sold",),
+        )
+        self.assertIn("idx_listings_status_created", by_status)
+        self.assertNotIn("TEMP B-TREE", by_status)
+
+    def test_status_counts_are_index_only(self):
+        plan = self._plan("SELECT sale_status, COUNT(*) FROM listings GROUP BY sale_status")
+        self.assertIn("COVERING INDEX", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_daily_stats_are_index_only(self):
+        plan = self._plan(
+            """
+            SELECT DATE(checked_at) as date, SUM(items_found), SUM(new_items)
+            FROM search_stats
+            WHERE checked_at >= datetime('now', ?)
+            GROUP BY DATE(checked_at)
+            ORDER BY date
+            """,
+            ("-7 days",),
+        )
+        self.assertIn("COVERING INDEX idx_search_stats_checked_totals", plan)
+
+    def test_keyset_page_seeks_index(self):
+        plan = self._plan(
+            "SELECT * FROM listings WHERE sale_status = ? AND (created_at, id) < (?, ?) "
+            "ORDER BY created_at DESC, id DESC LIMIT 50",
+            ("sold", "2024-01-01 00:00:00", 10),
+        )
+        self.assertIn("idx_listings_status_created", plan)
+        self.assertIn("created_at<?", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from db import DatabaseManager
+from models import Item
+
+
+class TestReadConnections(unittest.TestCase):
+    def test_reads_do_not_wait_for_writer_lock(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(os.path.join(tmp, "test.db"))
+            try:
+                db.add_listing(
+                    Item(
+                        platform="danggeun",
+                        article_id="a1",
+                        title="맥북",
+                        price="100,000원",
+                        link="https://example.com/a1",
+                        keyword="맥북",
+                    )
+                )
+                results: list[int] = []
+                with db.lock:
+                    reader = threading.Thread(target=lambda: results.append(db.get_total_listings()))
+                    reader.start()
+                    reader.join(timeout=5)
+                    self.assertFalse(reader.is_alive())
+                self.assertEqual(results, [1])
+                self.assertEqual(db.get_listing("danggeun", "a1")["title"], "맥북")
+            finally:
+                db.close()
+            self.assertEqual(db._reader_conns, [])
+
+    def test_release_read_conn_closes_only_calling_threads_reader(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(os.path.join(tmp, "test.db"))
+            try:
+                self.assertEqual(db.get_total_listings(), 0)
+
+                def _worker():
+                    db.get_total_listings()
+                    db.release_read_conn()
+
+                worker = threading.Thread(target=_worker)
+                worker.start()
+                worker.join(timeout=5)
+                self.assertEqual(len(db._reader_conns), 1)
+                # The main thread's reader is untouched and still usable.
+                self.assertEqual(db.get_total_listings(), 0)
+            finally:
+                db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
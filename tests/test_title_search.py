@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+from db import DatabaseManager
+
+
+class TestTitleSearch(unittest.TestCase):
+    def _seed(self, db: DatabaseManager) -> None:
+        with db.lock:
+            cur = db.conn.cursor()
+            cur.executemany(
+                "INSERT INTO listings (platform, article_id, title, price) VALUES (?, ?, ?, ?)",
+                [
+                    ("danggeun", "a1", "아이폰15 프로 판매", "100만"),
+                    ("bunjang", "b1", "iPhone 13 mini", "50만"),
+                    ("bunjang", "b2", "맥북 에어 M2", "90만"),
+                ],
+            )
+            db.conn.commit()
+
+    def test_substring_search_matches_like_semantics(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(os.path.join(tmp, "test.db"))
+            try:
+                self._seed(db)
+                self.assertEqual(db.get_listings_count(search="아이폰"), 1)
+                self.assertEqual(db.get_listings_count(search="IPHONE"), 1)
+                self.assertEqual(db.get_listings_count(search="프로 판"), 1)
+                # Short terms take the LIKE path.
+                self.assertEqual(db.get_listings_count(search="맥북"), 1)
+                self.assertEqual(
+                    [row["article_id"] for row in db.get_listings_by_status(search="mini")],
+                    ["b1"],
+                )
+                self.assertEqual(len(db.get_listings_for_export(search="에어 M")), 1)
+            finally:
+                db.close()
+
+    def test_index_follows_updates_and_deletes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(os.path.join(tmp, "test.db"))
+            try:
+                self._seed(db)
+                with db.lock:
+                    db.conn.execute("UPDATE listings SET title = ? WHERE article_id = ?", ("갤럭시 S24", "a1"))
+                    db.conn.execute("DELETE FROM listings WHERE article_id = ?", ("b1",))
+                    db.conn.commit()
+                self.assertEqual(db.get_listings_count(search="아이폰"), 0)
+                self.assertEqual(db.get_listings_count(search="갤럭시"), 1)
+                self.assertEqual(db.get_listings_count(search="iPhone"), 0)
+            finally:
+                db.close()
+
+    def test_existing_rows_are_indexed_on_upgrade(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "test.db")
+            db = DatabaseManager(db_path)
+            self._seed(db)
+            with db.lock:
+                db.conn.execute("DROP TABLE listings_fts")
+                db.conn.commit()
+            db.close()
+
+            db = DatabaseManager(db_path)
+            try:
+                self.assertEqual(db.get_listings_count(search="아이폰"), 1)
+            finally:
+                db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
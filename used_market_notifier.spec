@@ -100,6 +100,7 @@ hiddenimports = [
     "openpyxl",
     "openpyxl.workbook",
     "openpyxl.worksheet",
+    "xlsxwriter",
 
     # Utilities
     "difflib",